@@ -0,0 +1,57 @@
+"""Inventory operations on a large inventory.
+
+Run with `uv run python -m benchmarks.inventory [item count]`
+"""
+
+import random
+import sys
+from timeit import timeit
+
+from myning.objects.inventory import Inventory
+from myning.objects.item import Item, ItemType
+
+SLOTS = [ItemType.MINERAL, ItemType.WEAPON, ItemType.HELMET, ItemType.SHIRT, ItemType.PANTS]
+
+
+def report(name: str, seconds: float, number: int):
+    print(f"{name:<28} {seconds / number * 1e6:>12.2f} µs")
+
+
+def main(size: int):
+    items = [
+        Item(f"item {i}", "", random.choice(SLOTS), random.randint(1, 1000), random.randint(1, 100))
+        for i in range(size)
+    ]
+    inventory = Inventory._create()  # pylint: disable=protected-access
+    print(f"Inventory with {size:,} items")
+    report("add_items", timeit(lambda: inventory.add_items(items), number=1), 1)
+
+    current = items[0]
+    report("total_value", timeit(lambda: inventory.total_value, number=1000), 1000)
+    report("item_count", timeit(lambda: inventory.item_count, number=1000), 1000)
+    report("items (list)", timeit(lambda: inventory.items, number=10), 10)
+    report(
+        "iter_items (consume)",
+        timeit(lambda: sum(1 for _ in inventory.iter_items()), number=10),
+        10,
+    )
+    report(
+        "get_best_in_slot",
+        timeit(lambda: inventory.get_best_in_slot(ItemType.WEAPON), number=1000),
+        1000,
+    )
+    report(
+        "has_better_item",
+        timeit(lambda: inventory.has_better_item(ItemType.WEAPON, current), number=1000),
+        1000,
+    )
+    sample = random.sample(items, min(1000, size))
+    report(
+        "remove_item",
+        timeit(lambda: [inventory.remove_item(i) for i in sample], number=1),
+        len(sample),
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
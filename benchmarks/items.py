@@ -0,0 +1,30 @@
+"""Memory used by a large number of items.
+
+Run with `uv run python -m benchmarks.items [item count]`
+"""
+
+import random
+import sys
+import tracemalloc
+from timeit import default_timer
+
+from myning.utilities.generators import generate_equipment, generate_mineral
+
+
+def main(size: int):
+    tracemalloc.start()
+    start = default_timer()
+    items = [
+        generate_equipment(random.randint(1, 50)) if i % 2 else generate_mineral(20)
+        for i in range(size)
+    ]
+    seconds = default_timer() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{len(items):,} items (half equipment, half minerals)")
+    print(f"{'memory':<12} {memory / 2**20:>10,.1f} MiB {memory / size:>10,.1f} B/item")
+    print(f"{'generation':<12} {seconds:>10,.2f} s   {seconds / size * 1e6:>10,.2f} µs/item")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,119 @@
+"""Loading a large save at startup, one query per singleton against a single preloading query.
+
+Run with `uv run python -m benchmarks.load [army size]`
+"""
+
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from timeit import default_timer
+
+from main import SINGLETONS
+from myning.config import SPECIES
+from myning.migrations import MIGRATIONS
+from myning.objects.character import CharacterSpecies
+from myning.objects.inventory import Inventory
+from myning.objects.player import Player
+from myning.objects.singleton import Singleton
+from myning.utilities.file_manager import DB_PATH
+from myning.utilities.generators import generate_characters, generate_equipment
+
+ROOT = Path(__file__).parents[1]
+
+# What main() did before, the player was loaded by the migration check and then again
+BEFORE = """
+from main import SINGLETONS
+from myning.migrations.migrate import check_for_migrations
+from myning.objects.player import Player
+from myning.utilities.file_manager import FileManager
+
+check_for_migrations()
+FileManager.setup()
+Player.initialize()
+for cls in SINGLETONS:
+    cls.initialize()
+"""
+
+AFTER = """
+from main import load_game
+from myning.migrations.migrate import check_for_migrations
+
+check_for_migrations()
+load_game()
+"""
+
+
+def create_save(size: int):
+    Path(DB_PATH).parent.mkdir()
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute("CREATE TABLE save_data (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    Player.initialize("Bench")
+    for cls in SINGLETONS:
+        cls.initialize()
+    player = Player()
+    player.completed_migrations = list(MIGRATIONS.keys())
+    human = SPECIES[CharacterSpecies.HUMAN.value]
+    for ally in generate_characters([human] * size, (1, 50), max_items=4, max_item_level=50):
+        player.add_ally(ally)
+    inventory = Inventory()
+    inventory.add_items([generate_equipment(50) for _ in range(size)])
+
+    equipped = [item for ally in player.allies for item in ally.equipment.all_items]
+    saved = [player, *(cls() for cls in SINGLETONS), *inventory.items, *equipped]
+    with conn:
+        conn.executemany(
+            "INSERT INTO save_data VALUES (?, ?)",
+            ((item.file_name, json.dumps(item.to_dict())) for item in saved),
+        )
+    conn.close()
+    Singleton.reset()
+
+
+def run(code: str) -> float:
+    start = default_timer()
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": str(ROOT)}
+    )
+    return default_timer() - start
+
+
+def time_in_process(code: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        Singleton.reset()
+        start = default_timer()
+        exec(code)  # pylint: disable=exec-used
+        samples.append(default_timer() - start)
+    return statistics.median(samples)
+
+
+def report(name: str, cold: float, warm: float):
+    print(f"{name:<8} {cold * 1000:>10.1f} ms cold {warm * 1000:>10.1f} ms warm")
+
+
+def main(size: int, runs: int):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            create_save(size)
+            print(
+                f"Save with {size:,} allies and items, {Path(DB_PATH).stat().st_size / 1024:,.0f} KB"
+            )
+            print(f"Median of {runs} runs, cold in a new interpreter and warm in this one")
+            for name, code in (("before", BEFORE), ("after", AFTER)):
+                cold = statistics.median(run(code) for _ in range(runs))
+                report(name, cold, time_in_process(code, runs))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000, 5)
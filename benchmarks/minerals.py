@@ -0,0 +1,67 @@
+"""Save size and inventory load time before and after folding minerals into stacks.
+
+Run with `uv run python -m benchmarks.minerals [mineral count]`
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from timeit import timeit
+
+from myning.migrations import stack_minerals
+from myning.objects.inventory import Inventory
+from myning.utilities.file_manager import DB_PATH, FileManager
+from myning.utilities.generators import generate_mineral
+
+
+def create_save(size: int):
+    Path(DB_PATH).parent.mkdir()
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute("CREATE TABLE save_data (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        ids = []
+        for i in range(size):
+            mineral = generate_mineral(20).to_dict()
+            # unstacked minerals each had a random id and no count
+            mineral["id"] = f"{mineral['name']} - {i}"
+            del mineral["count"]
+            ids.append(mineral["id"])
+            conn.execute(
+                "INSERT INTO save_data VALUES (?, ?)",
+                (f"items/{mineral['id']}", json.dumps(mineral)),
+            )
+        conn.execute(
+            "INSERT INTO save_data VALUES (?, ?)", ("inventory", json.dumps({"mineral": ids}))
+        )
+    conn.close()
+
+
+def report(name: str):
+    load = timeit(lambda: FileManager.load(Inventory, Inventory.file_name), number=1)
+    inventory = FileManager.load(Inventory, Inventory.file_name)
+    assert inventory
+    print(
+        f"{name:<8} {Path(DB_PATH).stat().st_size / 1024:>10,.0f} KB "
+        f"{load * 1000:>10,.1f} ms load "
+        f"{len(inventory.items):>8,} rows {inventory.item_count:>8,} minerals"
+    )
+
+
+def main(size: int):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            create_save(size)
+            report("before")
+            stack_minerals.run()
+            report("after")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,50 @@
+"""Throughput of name and description generation.
+
+Run with `uv run python -m benchmarks.names [name count]`
+"""
+
+import sys
+from timeit import timeit
+
+from myning.objects.character import CharacterSpecies
+from myning.utilities import string_generation
+
+SPECIES = [CharacterSpecies.HUMAN.value, CharacterSpecies.ALIEN.value]
+
+
+def report(name: str, seconds: float, count: int):
+    print(f"{name:<36} {count / seconds:>14,.0f} /s")
+
+
+def main(count: int):
+    print(f"{count:,} of each")
+    for species in SPECIES:
+        report(
+            f"generate_name ({species})",
+            timeit(
+                lambda: [string_generation.generate_name(species) for _ in range(count)], number=1
+            ),
+            count,
+        )
+        report(
+            f"generate_names ({species})",
+            timeit(lambda: string_generation.generate_names(species, count), number=1),
+            count,
+        )
+        report(
+            f"generate_description ({species})",
+            timeit(
+                lambda: [string_generation.generate_description(species) for _ in range(count)],
+                number=1,
+            ),
+            count,
+        )
+        report(
+            f"generate_descriptions ({species})",
+            timeit(lambda: string_generation.generate_descriptions(species, count), number=1),
+            count,
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,39 @@
+"""Startup time, with and without the parsed content cache.
+
+Run with `uv run python -m benchmarks.startup [runs]`
+"""
+
+import statistics
+import subprocess
+import sys
+from timeit import default_timer
+
+from myning.config import _CONTENT_CACHE
+
+MODULES = ["myning.config", "main"]
+
+
+def run(module: str) -> float:
+    start = default_timer()
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+    return default_timer() - start
+
+
+def report(name: str, samples: list[float]):
+    print(f"{name:<32} {statistics.median(samples) * 1000:>10.1f} ms")
+
+
+def main(runs: int):
+    print(f"Median of {runs} runs (a new interpreter each time)")
+    for module in MODULES:
+        cold = []
+        for _ in range(runs):
+            _CONTENT_CACHE.unlink(missing_ok=True)
+            cold.append(run(module))
+        warm = [run(module) for _ in range(runs)]
+        report(f"import {module} (no cache)", cold)
+        report(f"import {module} (cached)", warm)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
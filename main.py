@@ -16,6 +16,33 @@ from myning.objects.trip import Trip
 from myning.utilities.file_manager import FileManager
 from myning.utilities.git import check_for_updates
 
+# Everything that is saved, besides the player
+SINGLETONS = (
+    Game,
+    Garden,
+    Graveyard,
+    Inventory,
+    Macguffin,
+    ResearchFacility,
+    Settings,
+    Stats,
+    Trip,
+)
+
+
+def load_game():
+    """Initialize every singleton from a save that is read in a single query"""
+    FileManager.setup()
+    # check_for_migrations has already read the save and loaded the player of an existing game
+    if not Player.initialized:
+        FileManager.preload()
+        Player.initialize()
+    for cls in SINGLETONS:
+        cls.initialize()
+    # Anything left over isn't needed at startup
+    FileManager.clear_preloaded()
+    FileManager.apply_repairs()
+
 
 def main():
     # Use rich print for any initialization
@@ -25,18 +52,7 @@ def main():
     check_for_updates()
     check_for_migrations()
 
-    FileManager.setup()
-    Player.initialize()
-
-    Game.initialize()
-    Garden.initialize()
-    Graveyard.initialize()
-    Inventory.initialize()
-    Macguffin.initialize()
-    ResearchFacility.initialize()
-    Settings.initialize()
-    Stats.initialize()
-    Trip.initialize()
+    load_game()
 
     # import MIGRATIONS here to resolve circular dependencies
     from myning.migrations import MIGRATIONS  # pylint: disable=import-outside-toplevel
@@ -61,18 +77,7 @@ def main():
         # Any other SystemExit (shouldn't normally reach here): fall through to save.
     finally:
         if not _time_travel:
-            FileManager.multi_save(
-                Game(),
-                Garden(),
-                Graveyard(),
-                Inventory(),
-                Macguffin(),
-                Player(),
-                ResearchFacility(),
-                Settings(),
-                Stats(),
-                Trip(),
-            )
+            FileManager.multi_save(Player(), *(cls() for cls in SINGLETONS))
             print("Game saved. Thank you for playing Myning!")
 
 
@@ -27,6 +27,7 @@ def migrate(id: int):
     player = Player()
     player.completed_migrations.append(id)
     FileManager.save(player)
+    FileManager.apply_repairs()
 
 
 if __name__ == "__main__":
@@ -2,8 +2,6 @@ import os
 from base64 import b64encode
 from typing import Literal
 
-import aiohttp
-
 
 # Needed once we had username and passwords
 def basic_auth(username, password):
@@ -17,6 +15,9 @@ API_CONFIG = {
 
 
 async def fetch(url: str, method: Literal["GET", "POST", "PATCH"] = "GET", headers=None, json=None):
+    # aiohttp takes longer to import than the rest of the game, so wait until it is needed
+    import aiohttp  # pylint: disable=import-outside-toplevel
+
     async with aiohttp.ClientSession() as session:
         async with session.request(method, url, headers=headers, json=json) as response:
             response.raise_for_status()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from importlib import import_module
 from typing import TYPE_CHECKING, Callable, Coroutine, Optional
 
 from rich.console import RenderableType
@@ -36,11 +37,28 @@ class ExitArgs:
 PickHandler = Callable[..., PickArgs]
 Handler = Callable[..., PickArgs | DynamicArgs | AsyncArgs | ExitArgs]
 OptionLabel = str | Text | list[str | Text]
+LazyOptionLabel = Callable[[], OptionLabel]
+
+
+def lazy_handler(module: str, name: str = "enter") -> Handler:
+    """A handler for `module.name` that only imports the chapter once it is chosen"""
+
+    def handler(*args, **kwargs):
+        return getattr(import_module(module), name)(*args, **kwargs)
+
+    # Chapters take their border title from their handler's module
+    handler.__module__ = module
+    handler.__qualname__ = name
+    return handler
 
 
 @dataclass
 class Option:
-    label: OptionLabel
+    label: OptionLabel | LazyOptionLabel
+    """
+    Pass a callable to defer building the label until its row is about to be displayed (useful for
+    menus with thousands of options)
+    """
     handler: Handler
     enable_hotkeys: bool = True
     """
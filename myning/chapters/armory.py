@@ -1,3 +1,4 @@
+import heapq
 from functools import partial
 
 from myning.chapters import Option, PickArgs, main_menu, tutorial
@@ -70,7 +71,7 @@ def pick_equipment(c: Character, slot: ItemType):
             message=f"You have no {slot.value}.",
             options=[Option("Bummer", partial(pick_slot, c))],
         )
-    options = [Option(item.arr, partial(equip, c, item)) for item in items]
+    options = [Option(lambda item=item: item.arr, partial(equip, c, item)) for item in items]
     options.append(Option(["", "Go Back"], partial(pick_slot, c)))
     return PickArgs(
         message=f"Choose {slot.value} to equip:\n",
@@ -89,15 +90,37 @@ def equip(c: Character, equipment: Item):
 
 
 def auto_equip():
-    for character in player.army:
-        for slot in EQUIPMENT_TYPES:
-            equipped = character.equipment.get_slot_item(slot)
-            if inventory.has_better_item(slot, equipped) and (
-                best := inventory.get_best_in_slot(slot)
-            ):
-                if equipped:
-                    inventory.add_item(equipped)
-                inventory.remove_item(best)
-                character.equipment.equip(best)
-    FileManager.multi_save(*player.army, inventory)
+    army = player.army
+    assignments = get_best_assignments(army)
+    for character, item in assignments:
+        if equipped := character.equipment.get_slot_item(item.type):
+            inventory.add_item(equipped)
+        inventory.remove_item(item)
+        character.equipment.equip(item)
+    # Allies are saved as part of the player
+    FileManager.multi_save(player, inventory)
     return pick_member()
+
+
+def get_best_assignments(army: list[Character]):
+    """Pick the items each member should equip so the army as a whole has the best gear.
+
+    Stats from equipment add up, so the army's total is highest when, for each slot, the best
+    `len(army)` items among the inventory and what is already equipped are worn. Members who
+    already wear one of those keep it and the rest are handed out best first in army order.
+    """
+    assignments: list[tuple[Character, Item]] = []
+    for slot in EQUIPMENT_TYPES:
+        equipped = [member.equipment.get_slot_item(slot) for member in army]
+        pool = [item for item in equipped if item] + inventory.get_slot(slot)
+        best = heapq.nlargest(len(army), pool, key=lambda item: item.main_affect)
+        best_ids = {item.id for item in best}
+        equipped_ids = {item.id for item in equipped if item}
+        available = (item for item in best if item.id not in equipped_ids)
+        for member, item in zip(army, equipped):
+            if item and item.id in best_ids:
+                continue
+            if (new_item := next(available, None)) is None:
+                break
+            assignments.append((member, new_item))
+    return assignments
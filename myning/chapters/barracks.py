@@ -14,9 +14,10 @@ from myning.tui.input import IntInputScreen
 from myning.utilities.fib import fibonacci
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
-from myning.utilities.generators import generate_character
+from myning.utilities.generators import generate_characters
 from myning.utilities.pick import confirm
 from myning.utilities.ui import Icons
+from myning.utilities.xp import distribute_xp
 
 if TYPE_CHECKING:
     from myning.tui.chapter import ChapterWidget
@@ -26,8 +27,9 @@ inventory = Inventory()
 
 
 def enter():
-    member_arrs = [member.pick_arr for member in player.army]
-    handlers = [partial(add_xp, member) for member in player.army]
+    army = player.army
+    member_arrs = [lambda member=member: member.pick_arr for member in army]
+    handlers = [partial(add_xp, member) for member in army]
     options = [
         Option(label, handler, enable_hotkeys=False)
         for label, handler in zip(member_arrs, handlers)
@@ -55,10 +57,8 @@ def enter():
 
 
 def pick_hire_muscle():
-    entities = [
-        generate_character((1, 1), max_items=1, species=random.choice(player.discovered_species))
-        for _ in range(20)
-    ]
+    species = [random.choice(player.discovered_species) for _ in range(20)]
+    entities = generate_characters(species, (1, 1), max_items=1)
     entities.sort(key=lambda e: e.name)
     cost = [full_cost(len(player.army), entity) for entity in entities]
     options = [
@@ -120,7 +120,7 @@ def pick_fire_muscle():
             message="You ain't got nobody to fire!",
             options=[Option("I should have thought of that...", enter)],
         )
-    member_arrs = [member.pick_arr for member in player.allies]
+    member_arrs = [lambda member=member: member.pick_arr for member in player.allies]
     handlers = [partial(confirm_fire_muscle, member) for member in player.allies]
     options = [Option(label, handler) for label, handler in zip(member_arrs, handlers)]
     options.append(Option(["", "Go Back"], enter))
@@ -196,7 +196,8 @@ def level_up(member: Character):
             options=[Option("Bummer!", enter)],
         )
     player.remove_available_xp(xp_for_level)
-    member.add_experience(xp_for_level)
+    member.add_experience(xp_for_level, save=False)
+    FileManager.save(player)
     return enter()
 
 
@@ -213,7 +214,8 @@ def add_xp_manually(member: Character):
         def screen_callback(xp: int | None):
             if xp is not None:
                 player.remove_available_xp(xp)
-                member.add_experience(xp)
+                member.add_experience(xp, save=False)
+                FileManager.save(player)
                 chapter.pick(enter())
 
         chapter.app.push_screen(
@@ -262,18 +264,8 @@ def auto_add_xp():
             options=[Option("I should have thought of that...", enter)],
         )
 
-    player.army.reverse()
-    while player.exp_available > 0:
-        member = min(player.army, key=lambda m: m.level)
-        if member.level >= player.level and member.name != player.name:
-            member = player
-
-        xp = fibonacci(member.level + 1)
-        xp -= member.experience
-        xp = min(xp, player.exp_available)
-        player.remove_available_xp(xp)
-        member.add_experience(xp)
-
+    # Lowest level first, ties in the order allies joined
+    add_xp_to_lowest([player, *player.allies])
     return enter()
 
 
@@ -285,20 +277,19 @@ def auto_add_ghost_xp():
             options=[Option("I should have thought of that...", enter)],
         )
 
-    player.army.reverse()
-    ghosts = [m for m in player.army if m.is_ghost]
-    while player.exp_available > 0:
-        member = min(ghosts, key=lambda m: m.level)
-        if member.level >= player.level and member.name != player.name:
-            member = player
+    add_xp_to_lowest([m for m in player.army if m.is_ghost])
+    return enter()
 
-        xp = fibonacci(member.level + 1)
-        xp -= member.experience
-        xp = min(xp, player.exp_available)
-        player.remove_available_xp(xp)
-        member.add_experience(xp)
 
-    return enter()
+def add_xp_to_lowest(members: list[Character]):
+    """Level up the lowest level member one level at a time until all available xp is spent,
+    leveling up the player whenever the members have caught up"""
+    grants = distribute_xp(members, player, player.exp_available)
+    for member, xp in grants:
+        player.remove_available_xp(xp)
+        member.add_experience(xp, save=False)
+    # Allies are saved as part of the player
+    FileManager.save(player)
 
 
 def full_cost(army_size: int, entity: Character) -> int:
@@ -12,6 +12,7 @@ from myning.objects.item import Item, ItemType
 from myning.objects.player import Player
 from myning.objects.settings import Settings, SortOrder
 from myning.objects.stats import IntegerStatKeys, Stats
+from myning.objects.stock import Stock
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 
@@ -21,12 +22,26 @@ settings = Settings()
 inventory = Inventory()
 
 
+def sort_by_type(item: Item):
+    return item.type
+
+
+def sort_by_value(item: Item):
+    return item.value
+
+
 class BaseStore(ABC):
     buying_option: BuyingOption | None = None
 
     def __init__(self):
-        self._items: list[Item] = []
-        self.generate()
+        self.stock = Stock.get(self.__class__.__name__.lower())
+        if self.stock.is_stale(self.level):
+            self.restock()
+
+    @property
+    @abstractmethod
+    def level(self) -> int:
+        pass
 
     @abstractmethod
     def generate(self):
@@ -36,54 +51,55 @@ class BaseStore(ABC):
     def enter(self) -> PickArgs:
         pass
 
+    def restock(self):
+        self.stock.restock(self.level)
+        self.generate()
+        FileManager.save(self.stock)
+
     def add_item(self, item: Item):
-        self._items.append(item)
+        self.stock.add(item)
 
     def add_items(self, *items: Item):
         for item in items:
             self.add_item(item)
 
     def remove_item(self, item: Item):
-        if item in self._items:
-            self._items.remove(item)
+        self.stock.remove(item)
 
     def remove_items(self, *items: Item):
         for item in items:
-            if item in self._items:
-                self._items.remove(item)
+            self.stock.remove(item)
+
+    @property
+    def sort_key(self):
+        if (
+            player.has_upgrade("sort_by_value")
+            and self.stock.name in UPGRADES["sort_by_value"].player_value
+            and settings.sort_order == SortOrder.VALUE
+        ):
+            return sort_by_value
+        return sort_by_type
 
     @property
     def items(self):
-        store_name = self.__class__.__name__.lower()
-        return sorted(
-            self._items,
-            key=lambda i: (
-                i.value
-                if (
-                    player.has_upgrade("sort_by_value")
-                    and store_name in UPGRADES["sort_by_value"].player_value
-                    and settings.sort_order == SortOrder.VALUE
-                )
-                else i.type
-            ),
-        )
+        self.stock.sort(self.sort_key)
+        return list(self.stock.items)
 
     @property
     def empty(self):
-        return not self._items
+        return not self.stock.items
 
     def exit(self):
-        FileManager.multi_delete(*self._items)
         return main_menu.enter()
 
     def pick_buy(self):
         if self.empty:
-            self.generate()
+            self.restock()
         options = [
             Option(
                 [
                     *item.arr,
-                    Text.from_markup(f"({Formatter.gold(item.value)})", justify="right"),
+                    Text.from_markup(f"({Formatter.gold(item.total_value)})", justify="right"),
                     self.hint_symbol(item),
                 ],
                 partial(self.confirm_buy, item),
@@ -93,7 +109,7 @@ class BaseStore(ABC):
         ]
         if self.buying_option:
             items = [item for item in self.items if self.buying_option.filter(item)]
-            cost = sum(item.value for item in items)
+            cost = sum(item.total_value for item in items)
             options.append(
                 Option(
                     [
@@ -114,13 +130,13 @@ class BaseStore(ABC):
         )
 
     def confirm_buy(self, item: Item):
-        if player.gold < item.value:
+        if player.gold < item.total_value:
             return PickArgs(
                 message="Not enough gold!",
                 options=[Option("Bummer!", self.pick_buy)],
             )
         return PickArgs(
-            message=f"Are you sure you want to buy {item} for {Formatter.gold(item.value)}?",  # pylint: disable=line-too-long
+            message=f"Are you sure you want to buy {item} for {Formatter.gold(item.total_value)}?",  # pylint: disable=line-too-long
             options=[
                 Option("Yes", partial(self.buy, item)),
                 Option("No", self.pick_buy),
@@ -128,19 +144,19 @@ class BaseStore(ABC):
         )
 
     def buy(self, item: Item):
-        player.gold -= item.value
-        inventory.add_item(item)
+        player.gold -= item.total_value
+        held = inventory.add_item(item)
         self.remove_item(item)
         if item.type == ItemType.WEAPON:
             stats.increment_int_stat(IntegerStatKeys.WEAPONS_PURCHASED)
         elif item.type in EQUIPMENT_TYPES:
             stats.increment_int_stat(IntegerStatKeys.ARMOR_PURCHASED)
-        FileManager.multi_save(player, item, stats, inventory)
+        FileManager.multi_save(player, held, stats, inventory, self.stock)
         return self.enter()
 
     def confirm_multi_buy(self, items: list[Item]):
         assert self.buying_option
-        cost = sum(item.value for item in items)
+        cost = sum(item.total_value for item in items)
         if player.gold < cost:
             return PickArgs(
                 message="Not enough gold!",
@@ -155,11 +171,11 @@ class BaseStore(ABC):
         )
 
     def multi_buy(self, items: list[Item]):
-        cost = sum(item.value for item in items)
+        cost = sum(item.total_value for item in items)
         player.gold -= cost
-        inventory.add_items(items)
+        held = inventory.add_items(items)
         self.remove_items(*items)
-        FileManager.multi_save(player, *items, inventory)
+        FileManager.multi_save(player, *held, inventory, self.stock)
         return self.enter()
 
     def hint_symbol(self, item: Item) -> str:
@@ -42,18 +42,24 @@ class Blacksmith(BaseStore):
         return fibonacci(self.level + 4) * 100
 
     def generate(self):
+        stocked = {(item.value, item.type) for item in self.stock.items}
         for tier in TIERS[: self.level]:
             for item_type in EQUIPMENT_TYPES:
                 value = tier.value if item_type == ItemType.WEAPON else int(tier.value * 0.4)
+                if (value, item_type) in stocked:
+                    continue
                 type_name = random.choice(STRINGS[item_type.lower()])
                 name = f"{tier.name}'s {type_name}"
                 description = f"A {item_type.name}'s  {type_name}."
-                item = Item(name, description, item_type, value, tier.main_affect)
-                if not any(i.value == item.value and i.type == item.type for i in self.items):
-                    self.add_item(item)
+                self.add_item(Item(name, description, item_type, value, tier.main_affect))
+                stocked.add((value, item_type))
 
     def enter(self):
+        # The smith always has every item it can make, so replace the ones that were bought
+        count = len(self.stock.items)
         self.generate()
+        if len(self.stock.items) != count:
+            FileManager.save(self.stock)
         return PickArgs(
             message="What would you like to do?",
             options=[
@@ -102,6 +108,5 @@ class Blacksmith(BaseStore):
         player.gold -= self.upgrade_cost
         player.blacksmith_level += 1
         FileManager.save(player)
-        self.remove_items(*self.items)
-        self.generate()
+        self.restock()
         return self.enter()
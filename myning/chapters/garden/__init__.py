@@ -25,6 +25,10 @@ class Garden(BaseStore):
             self.buying_option = BuyingOption("all seeds", lambda _: True)
         super().__init__()
 
+    @property
+    def level(self):
+        return garden.level
+
     def generate(self):
         amount = max(garden.level, 5)
         self.add_items(*(generate_plant(garden.level) for _ in range(amount)))
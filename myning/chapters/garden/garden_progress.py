@@ -10,10 +10,7 @@ garden = Garden()
 class GardenProgress(Container):
     def __init__(self) -> None:
         super().__init__()
-        self.progress_bar = ProgressBar(
-            show_eta=False,
-            total=sum(plant.total_time for row in garden.rows for plant in row if plant),
-        )
+        self.progress_bar = ProgressBar(show_eta=False, total=garden.schedule.total_time)
         self.time_left = Static()
 
     def compose(self):
@@ -29,11 +26,6 @@ class GardenProgress(Container):
     def tick(self):
         if garden.empty:
             return
-        self.progress_bar.progress = sum(
-            min(plant.elapsed_time, plant.total_time)
-            for row in garden.rows
-            for plant in row
-            if plant
-        )
-        remaining = max(plant.time_left for row in garden.rows for plant in row if plant)
-        self.time_left.update(get_time_str(int(remaining)))
+        garden.schedule.advance()
+        self.progress_bar.progress = garden.schedule.progress()
+        self.time_left.update(get_time_str(int(garden.schedule.time_left())))
@@ -6,6 +6,8 @@ from textual.widgets import DataTable
 
 from myning.objects.garden import Garden
 from myning.tui.chapter.option_table import OptionTable
+from myning.utilities.event_bus import EventBus, GameEvent
+from myning.utilities.profiler import profiled
 
 if TYPE_CHECKING:
     from myning.tui.chapter import ChapterWidget
@@ -22,10 +24,13 @@ class GardenTable(OptionTable):  # pylint: disable=too-many-ancestors
         self.cursor_type = "cell"
 
     def on_mount(self):
-        for i in range(garden.level):
-            self.add_column(str(i))
         self.update()
+        # Plants grow with time, garden changes are published
         self.set_interval(1, self.update)
+        EventBus.subscribe(self.update, GameEvent.GARDEN)
+
+    def on_unmount(self):
+        EventBus.unsubscribe(self.update, GameEvent.GARDEN)
 
     def on_resize(self):
         self.styles.height = garden.level + self.scrollbar_size_horizontal + 2  # 2 for borders
@@ -52,24 +57,24 @@ class GardenTable(OptionTable):  # pylint: disable=too-many-ancestors
             progress.remove()
         self.remove()
 
+    @profiled
     def update(self):
-        if not self.row_count:
+        # The garden schedule knows which cells changed their icon, so growing plants only cost
+        # anything when they cross into their next growth stage
+        changed = garden.changed_cells()
+        if garden.level != self.row_count:
+            self.clear(columns=True)
+            for i in range(garden.level):
+                self.add_column(str(i))
             self.add_rows(
                 [
-                    [
-                        Text.from_markup(plant.growth_icon, justify="center") if plant else "  "
-                        for plant in row
-                    ]
-                    for row in garden.rows
+                    [get_cell(garden.growth_icon(i, j)) for j in range(garden.level)]
+                    for i in range(garden.level)
                 ]
             )
-        else:
-            for i, row in enumerate(garden.rows):
-                for j, plant in enumerate(row):
-                    self.update_cell_at(
-                        Coordinate(i, j),
-                        Text.from_markup(plant.growth_icon, justify="center") if plant else "  ",
-                    )
+            return
+        for i, j in changed:
+            self.update_cell_at(Coordinate(i, j), get_cell(garden.growth_icon(i, j)))
 
     async def handle_chapter_key(self, key: str):
         if not self.parent:
@@ -84,3 +89,7 @@ class GardenTable(OptionTable):  # pylint: disable=too-many-ancestors
             inactive.move_cursor(row=0)
         elif bindings := active._bindings.key_to_bindings.get(key):  # pylint: disable=protected-access
             await active.run_action(bindings[0].action)
+
+
+def get_cell(icon: str):
+    return Text.from_markup(icon, justify="center") if icon else "  "
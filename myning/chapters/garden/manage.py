@@ -77,11 +77,10 @@ def harvest_row():
             message="There are no more plants ready to harvest",
             options=[Option("Go Back", manage_garden)],
         )
-    for column in range(garden.level):
-        plant = garden.get_plant(row, column)
-        if plant and plant.ready:
-            harvest_plant(row, column)
-    FileManager.multi_save(player, garden)
+    plants = [garden.harvest_plant(row, column) for column in garden.ready_columns(row)]
+    held = inventory.add_items(plants)
+    stats.increment_int_stat(IntegerStatKeys.PLANTS_HARVESTED, len(plants))
+    FileManager.multi_save(player, garden, stats, inventory, *held)
     return manage_garden()
 
 
@@ -92,17 +91,18 @@ def plant_row():
             message="Everything is planted!",
             options=[Option("Go Back", manage_garden)],
         )
-    for column in range(garden.level):
-        plant = garden.get_plant(row, column)
-        seed = next(iter(inventory.seeds), None)
-        if not seed:
-            return PickArgs(
-                message="You have run out of seeds to plant",
-                options=[Option("Bummer!", manage_garden)],
-            )
-        if not plant:
-            plant_seed(seed, row, column)
-    FileManager.multi_save(garden, inventory)
+    columns = garden.empty_columns(row)
+    seeds = inventory.seeds[: len(columns)]
+    for seed, column in zip(seeds, columns):
+        seed.sow()
+        garden.add_plant(seed, row, column)
+    inventory.remove_items(*seeds)
+    FileManager.multi_save(garden, inventory, *seeds)
+    if len(seeds) < len(columns):
+        return PickArgs(
+            message="You have run out of seeds to plant",
+            options=[Option("Bummer!", manage_garden)],
+        )
     return manage_garden()
 
 
@@ -22,7 +22,7 @@ def enter():
             message="You have no fallen allies to revive.",
             options=[Option("Bummer", main_menu.enter)],
         )
-    member_arrs = [member.pick_arr[:-1] for member in graveyard.fallen_allies]
+    member_arrs = [lambda member=member: member.pick_arr[:-1] for member in graveyard.fallen_allies]
     handlers = [partial(action, member) for member in graveyard.fallen_allies]
     options = [Option(label, handler) for label, handler in zip(member_arrs, handlers)]
     return PickArgs(
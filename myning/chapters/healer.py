@@ -1,4 +1,5 @@
 import random
+from datetime import timedelta
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -12,6 +13,7 @@ from myning.config import HEAL_TICK_LENGTH, UPGRADES
 from myning.objects.army import Army
 from myning.objects.player import Player
 from myning.tui.header import Header
+from myning.utilities.clock import clock
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 from myning.utilities.pick import throttle
@@ -21,11 +23,39 @@ if TYPE_CHECKING:
 
 player = Player()
 
+RECOVERY_INTERVAL = timedelta(seconds=1)
+
 
 def members_to_heal(members: Army):
     return [m for m in members if m.health < m.max_health]
 
 
+def heal():
+    """Heal a random hurt member a little, returns whether anyone still needs healing"""
+    if need_healing := members_to_heal(player.army):
+        heal_amount = random.randint(1, len(player.army))
+        member = random.choice(need_healing)
+        member.health = min(member.health + heal_amount, member.max_health)
+        FileManager.save(member)
+    return bool(members_to_heal(player.army))
+
+
+class Recovery:
+    """Slow healing as a game clock source: one heal every RECOVERY_INTERVAL while anyone is hurt"""
+
+    def __init__(self):
+        self.last_heal = clock.now()
+
+    def next_due(self):
+        if not members_to_heal(player.army):
+            return None
+        return self.last_heal + RECOVERY_INTERVAL
+
+    def catch_up(self):
+        self.last_heal = clock.now()
+        heal()
+
+
 def healthy():
     return PickArgs(
         message="Everyone is healthy.",
@@ -89,6 +119,7 @@ class HealScreen(Screen[None]):
         self.content_container = ScrollableContainer()
         self.content = Static()
         self.progress = ProgressBar(total=player.army.total_health)
+        self.recovery = Recovery()
         super().__init__()
 
     def compose(self):
@@ -102,9 +133,13 @@ class HealScreen(Screen[None]):
         yield Footer()
 
     def on_mount(self):
+        clock.register(self.recovery)
         self.tick()
         self.set_interval(1, self.tick)
 
+    def on_unmount(self):
+        clock.unregister(self.recovery)
+
     def update_screen(self):
         table = Table.grid()
         table.add_row(f"Recovering... (press {Formatter.keybind('Enter ↩')} to speed up)\n")
@@ -121,25 +156,17 @@ class HealScreen(Screen[None]):
 
     @throttle(HEAL_TICK_LENGTH)
     def action_skip(self):
-        if not self.heal():
+        if not heal():
             self.exit()
         self.flash_border()
         self.update_screen()
 
     def tick(self):
+        clock.catch_up()
         self.update_screen()
-        if not self.heal():
+        if not members_to_heal(player.army):
             self.exit()
 
     def exit(self):
         if self.app.screen is self:  # Prevent crash from holding enter
             self.dismiss(None)  # Needs a result to call the callback
-
-    def heal(self):
-        if need_healing := members_to_heal(player.army):
-            heal_amount = random.randint(1, len(player.army))
-            member = random.choice(need_healing)
-            member.health = min(member.health + heal_amount, member.max_health)
-            FileManager.save(member)
-        still_need_healing = members_to_heal(player.army)
-        return bool(still_need_healing)
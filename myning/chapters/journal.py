@@ -16,11 +16,11 @@ facility = ResearchFacility()
 
 def enter(back_handler: Callable = None):
     species_list = [s for s in SPECIES.values() if s.name != "Alien"]
-    discovered_count = sum(1 for s in species_list if s in player.discovered_species)
+    discovered_count = sum(1 for s in species_list if player.has_discovered(s))
     options = [
         Option(
             [species.icon, species.name]
-            if species in player.discovered_species
+            if player.has_discovered(species)
             else [Icons.LOCKED, Colors.LOCKED("?" * len(species.name))],
             partial(show, species, back_handler),
         )
@@ -34,7 +34,7 @@ def enter(back_handler: Callable = None):
 
 
 def show(species: Species, back_handler: Callable = None):
-    if species not in player.discovered_species:
+    if not player.has_discovered(species):
         return PickArgs(
             message="You have not discovered this species yet.",
             options=[Option("Go Back", partial(enter, back_handler))],
@@ -1,26 +1,6 @@
 from functools import partial
 
-from myning.chapters import (
-    ExitArgs,
-    Handler,
-    Option,
-    PickArgs,
-    armory,
-    barracks,
-    blacksmith,
-    compendium,
-    garden,
-    graveyard,
-    healer,
-    mine,
-    research_facility,
-    settings,
-    stats,
-    store,
-    telescope,
-    time_machine,
-    wizard_hut,
-)
+from myning.chapters import ExitArgs, Handler, Option, PickArgs, lazy_handler
 from myning.config import MINES
 from myning.objects.mine import Mine
 from myning.objects.player import Player
@@ -54,26 +34,30 @@ class MenuItem:
         )
 
 
+def chapter(module: str, name: str = "enter") -> Handler:
+    return lazy_handler(f"myning.chapters.{module}", name)
+
+
 def enter():
     chapters = [
-        MenuItem("Mine", mine.pick_mine),
-        MenuItem("Store", store.enter),
-        MenuItem("Armory", armory.pick_member),
-        MenuItem("Healer", healer.enter),
-        MenuItem("Wizard Hut", wizard_hut.enter, MINES["Hole in the ground"]),
-        MenuItem("Barracks", barracks.enter, MINES["Small pit"]),
-        MenuItem("Blacksmith", blacksmith.enter, MINES["Trench"]),
-        MenuItem("Graveyard", graveyard.enter, MINES["Large pit"]),
-        MenuItem("Garden", garden.enter, MINES["Cave"]),
-        MenuItem("Research Facility", research_facility.enter, MINES["Cavern"]),
-        MenuItem("Time Machine", time_machine.enter, MINES["Cave System"]),
-        MenuItem("Telescope", telescope.enter, MINES["Meteor Crater"]),
-        MenuItem("Compendium", compendium.enter),
-        MenuItem("Stats", stats.enter),
-        MenuItem("Settings", settings.enter),
+        MenuItem("Mine", chapter("mine", "pick_mine")),
+        MenuItem("Store", chapter("store")),
+        MenuItem("Armory", chapter("armory", "pick_member")),
+        MenuItem("Healer", chapter("healer")),
+        MenuItem("Wizard Hut", chapter("wizard_hut"), MINES["Hole in the ground"]),
+        MenuItem("Barracks", chapter("barracks"), MINES["Small pit"]),
+        MenuItem("Blacksmith", chapter("blacksmith"), MINES["Trench"]),
+        MenuItem("Graveyard", chapter("graveyard"), MINES["Large pit"]),
+        MenuItem("Garden", chapter("garden"), MINES["Cave"]),
+        MenuItem("Research Facility", chapter("research_facility"), MINES["Cavern"]),
+        MenuItem("Time Machine", chapter("time_machine"), MINES["Cave System"]),
+        MenuItem("Telescope", chapter("telescope"), MINES["Meteor Crater"]),
+        MenuItem("Compendium", chapter("compendium")),
+        MenuItem("Stats", chapter("stats")),
+        MenuItem("Settings", chapter("settings")),
         MenuItem("Exit", ExitArgs),
     ]
-    options = [Option(chapter.arr, chapter.play) for chapter in chapters]
+    options = [Option(item.arr, item.play) for item in chapters]
     return PickArgs(
         message="Where would you like to go next?",
         options=options,
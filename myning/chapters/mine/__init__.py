@@ -14,6 +14,7 @@ from myning.objects.research_facility import ResearchFacility
 from myning.objects.species import Species
 from myning.objects.stats import IntegerStatKeys, Stats
 from myning.objects.trip import LOST_RATIO, Trip
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 from myning.utilities.pick import story_builder
@@ -227,6 +228,7 @@ def unlock_mine(mine: Mine):
         )
     player.gold -= mine.cost
     player.mines_available.append(mine)
+    EventBus.publish(GameEvent.MINES)
     FileManager.save(player)
     return PickArgs(
         message=f"You have unlocked {mine.icon} {mine.name}",
@@ -243,7 +245,7 @@ def complete_trip(abandoned: bool):
 
     stats.increment_int_stat(IntegerStatKeys.ENEMIES_DEFEATED, trip.enemies_defeated)
     stats.increment_int_stat(IntegerStatKeys.BATTLES_WON, trip.battles_won)
-    stats.increment_int_stat(IntegerStatKeys.MINERALS_MINED, len(trip.minerals_mined))
+    stats.increment_int_stat(IntegerStatKeys.MINERALS_MINED, trip.mineral_count)
     if player.army.defeated:
         stats.increment_int_stat(IntegerStatKeys.ARMY_DEFEATS)
         trip.subtract_losses()
@@ -289,7 +291,7 @@ def complete_trip(abandoned: bool):
         )
 
     if trip.mine.type == MineType.COMBAT:
-        trip.minerals_mined = []
+        trip.minerals_mined = {}
         trip.items_found = []
         story_args_list.append(
             StoryArgs(
@@ -297,12 +299,12 @@ def complete_trip(abandoned: bool):
                 "were donated to the training facility.",
             )
         )
-    inventory.add_items(trip.items_found + trip.minerals_mined)
+    inventory.add_items(trip.items_found)
+    FileManager.multi_save(*inventory.add_items(list(trip.minerals_mined.values())))
 
     for ally in trip.allies_gained:
         player.add_ally(ally)
-        if ally.species not in player.discovered_species:
-            player.discovered_species.append(ally.species)
+        if player.discover_species(ally.species):
             message = "✨ You have discovered a new species! ✨\n"
             subtitle = (
                 f"{ally.species.icon} [bold yellow1]{ally.species.name}[/]\n\n"
@@ -330,7 +332,7 @@ def complete_trip(abandoned: bool):
     progress = player.get_mine_progress(trip.mine.name)
     progress.minutes += trip.total_seconds / 60.0
     progress.kills += trip.enemies_defeated
-    progress.minerals += len(trip.minerals_mined)
+    progress.minerals += trip.mineral_count
     if trip.boss_defeated:
         stats.increment_int_stat(IntegerStatKeys.BOSSES_DEFEATED)
         if trip.mine.boss:
@@ -342,6 +344,7 @@ def complete_trip(abandoned: bool):
         boss_ok = boss is None or trip.boss_defeated
         if criteria_met and boss_ok and trip.mine not in player.mines_completed:
             player.mines_completed.append(trip.mine)
+            EventBus.publish(GameEvent.MINES)
             story_args_list.append(
                 StoryArgs(
                     message=f"You have completed {trip.mine.icon} "
@@ -375,4 +378,4 @@ def available_species(mine: Mine) -> list[Species]:
 
 
 def unlock_species_emojies(species: list[Species]) -> list[str]:
-    return [s.icon if s in player.discovered_species else "❓" for s in species]
+    return [s.icon if player.has_discovered(s) else "❓" for s in species]
@@ -289,8 +289,7 @@ class VictoryAction(Action):
         TabTitle.change_tab_subactivity("")
         assert trip.mine
         rewards = generate_reward(trip.mine.max_item_level, enemy_count)
-        trip.add_items(*rewards)
-        FileManager.multi_save(trip, *rewards)
+        FileManager.multi_save(trip, *trip.add_items(*rewards))
         self.rewards = rewards
         super().__init__(len(rewards) + 1)
 
@@ -309,8 +308,7 @@ class VictoryAction(Action):
 class ItemsAction(Action):
     def __init__(self, items: list[Item], message: str):
         self.items = items
-        trip.add_items(*items)
-        FileManager.multi_save(*items, trip)
+        FileManager.multi_save(*trip.add_items(*items), trip)
         self.message = message + "\n\n" + "\n".join(item.battle_new_str for item in self.items)
         super().__init__(5)
 
@@ -466,8 +464,7 @@ class BossVictoryAction(Action):
         rewards = []
         for _ in range(boss_config.reward_multiplier):
             rewards.extend(generate_reward(trip.mine.max_item_level, 1))
-        trip.add_items(*rewards)
-        FileManager.multi_save(trip, player, stats, *rewards)
+        FileManager.multi_save(trip, player, stats, *trip.add_items(*rewards))
         self.rewards = rewards
         super().__init__(len(rewards) + 2 if self.gold_bonus else len(rewards) + 1)
 
@@ -1,4 +1,5 @@
 import random
+import time
 from enum import Enum, auto
 from functools import lru_cache
 
@@ -29,8 +30,21 @@ class MiningMinigame(Static):
         self.cursor = random.randint(1, self.width - 2)
         self.direction = random.choice([-1, 1])
         self.paused = False
+        # The bar never changes and the cursor only has `width` positions, so build them once
+        self.bar = "".join(
+            f"[{color}]{'█' * width}[/]" for color, width in zip(COLORS, self.segment_widths)
+        )
+        self.cursor_lines = [f"{' ' * cursor}[bold]⛏︎[/]" for cursor in range(self.width)]
+        self.frames_rendered = 0
+        self.started = time.monotonic()
+
+    @property
+    def render_rate(self) -> float:
+        """Frames sent to the screen per second since the game started"""
+        return self.frames_rendered / max(time.monotonic() - self.started, 1e-9)
 
     def on_mount(self):
+        self.started = time.monotonic()
         self.tick()
         self.tick_duration()
         speed = self.width * 8 / random.randint(3, 7)
@@ -43,19 +57,18 @@ class MiningMinigame(Static):
         self.cursor = (self.cursor + self.direction) % self.width
         if self.cursor <= 0 or self.cursor >= self.width - 1:
             self.direction = -self.direction
+        # The cursor moves on every tick, so every frame is different
+        self.frames_rendered += 1
         self.update(
-            "\n".join(
-                [
-                    f"Mining... ({self.duration} seconds left)\n",
-                    "💎  " * (5 - (self.duration - 1) % 5),
-                    "",
-                    "".join(
-                        f"[{color}]{'█' * width}[/]"
-                        for color, width in zip(COLORS, self.segment_widths)
-                    ),
-                    f"{' ' * (self.cursor)}[bold]⛏︎[/]",
-                ]
-            )
+            f"Mining... ({self.duration} seconds left)\n\n"
+            f"{'💎  ' * (5 - (self.duration - 1) % 5)}\n\n"
+            f"{self.bar}\n"
+            f"{self.cursor_lines[self.cursor]}"
+        )
+
+    def on_unmount(self):
+        self.log(
+            f"MiningMinigame rendered {self.frames_rendered} frames ({self.render_rate:.1f}/s)"
         )
 
     def tick_duration(self):
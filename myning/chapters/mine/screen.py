@@ -30,6 +30,7 @@ from myning.utilities.boss_scaling import get_effective_boss_config
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 from myning.utilities.pick import throttle
+from myning.utilities.profiler import profiled
 from myning.utilities.tab_title import TabTitle
 from myning.utilities.ui import Icons, get_time_str
 
@@ -167,6 +168,7 @@ class MineScreen(Screen[bool]):
         else:
             self.confirm_abandon()
 
+    @profiled
     def tick(self):
         if self.abandoning:
             return
@@ -181,6 +183,7 @@ class MineScreen(Screen[bool]):
         if self.action.duration <= 0:
             self.action = self.next_action
 
+    @profiled
     def update_screen(self):
         if not trip.mine:
             return
@@ -261,7 +264,7 @@ class MineScreen(Screen[bool]):
         progress = player.get_mine_progress(mine.name)
         current_minutes = (trip.total_seconds - trip.seconds_left) / 60.0
         kills_met = progress.kills + trip.enemies_defeated >= mine.win_criteria.kills
-        minerals_met = progress.minerals + len(trip.minerals_mined) >= mine.win_criteria.minerals
+        minerals_met = progress.minerals + trip.mineral_count >= mine.win_criteria.minerals
         minutes_met = progress.minutes + current_minutes >= mine.win_criteria.minutes
         return kills_met and minerals_met and minutes_met
 
@@ -7,6 +7,7 @@ from myning.objects.macguffin import Macguffin
 from myning.objects.player import Player
 from myning.objects.research_facility import ResearchFacility
 from myning.objects.upgrade import Upgrade
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 
@@ -104,6 +105,7 @@ def purchase_research(research: Upgrade):
     research.level += 1
     if research.id not in [u.id for u in facility.research]:
         facility.research.append(research)
+    EventBus.publish(GameEvent.RESEARCH)
     FileManager.save(facility)
     return pick_research()
 
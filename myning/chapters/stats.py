@@ -2,31 +2,23 @@ from datetime import datetime
 from functools import partial
 from typing import TYPE_CHECKING
 
-import aiohttp
 from rich.table import Table
 from rich.text import Text
 from textual.widgets import ProgressBar
 
 from myning import api
 from myning.chapters import AsyncArgs, Option, PickArgs, main_menu
-from myning.objects.garden import Garden
-from myning.objects.inventory import Inventory
 from myning.objects.macguffin import Macguffin
-from myning.objects.player import Player
-from myning.objects.research_facility import ResearchFacility
 from myning.objects.stats import Stats
 from myning.utilities.formatter import Formatter
 from myning.utilities.ui import Icons
+from myning.utilities.value_ledger import ledger
 
 if TYPE_CHECKING:
     from myning.tui.chapter import ChapterWidget
 
-facility = ResearchFacility()
-garden = Garden()
 macguffin = Macguffin()
-player = Player()
 stats = Stats()
-inventory = Inventory()
 
 
 def enter():
@@ -44,6 +36,8 @@ def enter():
 def api_request(loading_message: str):
     def outer(func):
         async def inner(chapter: "ChapterWidget", *args, **kwargs):
+            import aiohttp  # pylint: disable=import-outside-toplevel
+
             chapter.clear()
             chapter.question.message = loading_message
             progress = ProgressBar(show_percentage=False, show_eta=False)
@@ -71,7 +65,7 @@ def api_request(loading_message: str):
 
 @api_request("Syncing Stats...")
 async def sync(chapter: "ChapterWidget"):
-    score = macguffin.get_new_standard_boost(get_total_value())
+    score = macguffin.get_new_standard_boost(ledger.total)
     await api.players.sync(int(score * 100))
     chapter.pick(
         PickArgs(
@@ -149,9 +143,3 @@ def view_player(_player):
         )
 
     return AsyncArgs(callback=callback)
-
-
-# This is the same function as in the time machine. I haven't figured out a great place where they
-# can share this function and I don't want to cross import
-def get_total_value() -> int:
-    return player.total_value + facility.total_value + garden.total_value + inventory.total_value
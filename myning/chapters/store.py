@@ -29,9 +29,9 @@ def enter():
 
 
 class Store(BaseStore):
-    def __init__(self):
-        self.level = player.level
-        super().__init__()
+    @property
+    def level(self):
+        return player.level
 
     def generate(self):
         amount = max(self.level, 5)
@@ -63,14 +63,11 @@ class Store(BaseStore):
     def pick_sell(self):
         options = [
             Option(
-                [
-                    *item.arr,
-                    Text.from_markup(f"({Formatter.gold(sell_price(item))})", justify="right"),
-                ],
+                partial(sell_label, item),
                 partial(self.sell, item),
                 enable_hotkeys=False,
             )
-            for item in inventory.items
+            for item in inventory.iter_items()
         ]
         if player.has_upgrade("sell_minerals"):
             minerals = inventory.get_slot(ItemType.MINERAL).copy()
@@ -128,7 +125,9 @@ class Store(BaseStore):
         inventory.remove_item(item)
         self.add_item(item)
         stats.increment_int_stat(IntegerStatKeys.GOLD_EARNED, price)
-        FileManager.multi_save(player, stats, inventory)
+        FileManager.multi_save(player, stats, inventory, self.stock)
+        # Sold items are saved inline with the stock
+        FileManager.delete(item)
         return self.enter()
 
     def confirm_mass_sell(self, description: str, items: list[Item], tax: float):
@@ -151,7 +150,8 @@ class Store(BaseStore):
         inventory.remove_items(*items)
         self.add_items(*items)
         stats.increment_int_stat(IntegerStatKeys.GOLD_EARNED, total)
-        FileManager.multi_save(player, stats, inventory)
+        FileManager.multi_save(player, stats, inventory, self.stock)
+        FileManager.multi_delete(*items)
         return self.enter()
 
 
@@ -163,4 +163,11 @@ def sell_price(item: Item):
         multiplier = macguffin.plant_boost
     else:
         multiplier = MARKDOWN_RATIO
-    return int(item.value * multiplier) or 1
+    return (int(item.value * multiplier) or 1) * item.count
+
+
+def sell_label(item: Item):
+    return [
+        *item.arr,
+        Text.from_markup(f"({Formatter.gold(sell_price(item))})", justify="right"),
+    ]
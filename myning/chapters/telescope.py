@@ -1,7 +1,5 @@
 from typing import TYPE_CHECKING
 
-from chafa import Canvas, CanvasConfig, PixelType
-from PIL import Image
 from rich.text import Text
 from textual.widget import Widget
 from textual.widgets import Static
@@ -48,6 +46,10 @@ class Telescope(Static):
     def render(self):
         if not isinstance(self.parent, Widget):
             return None
+        # pylint: disable=import-outside-toplevel
+        from chafa import Canvas, CanvasConfig, PixelType
+        from PIL import Image
+
         config = CanvasConfig()
         image = Image.open("./images/space.jpeg")
         config.width = self.parent.container_size.width - 1
@@ -4,8 +4,6 @@ from rich.table import Table
 
 from myning.chapters import Option, PickArgs, main_menu
 from myning.config import RESEARCH
-from myning.objects.garden import Garden
-from myning.objects.inventory import Inventory
 from myning.objects.macguffin import Macguffin
 from myning.objects.player import Player
 from myning.objects.research_facility import ResearchFacility
@@ -15,12 +13,11 @@ from myning.utilities.formatter import Formatter
 from myning.utilities.pick import confirm
 from myning.utilities.species_rarity import get_time_travel_species
 from myning.utilities.ui import Colors, Icons
+from myning.utilities.value_ledger import ledger
 
 facility = ResearchFacility()
-garden = Garden()
 macguffin = Macguffin()
 player = Player()
-inventory = Inventory()
 
 
 def enter():
@@ -35,18 +32,12 @@ def enter():
     )
 
 
-# This is the same function as in the stats page. I haven't figured out a great place where they can
-# share this function and I don't want to cross import
-def get_total_value():
-    return player.total_value + facility.total_value + garden.total_value + inventory.total_value
-
-
 def get_potential_standard_boost():
-    return macguffin.get_new_standard_boost(get_total_value())
+    return macguffin.get_new_standard_boost(ledger.total)
 
 
 def get_potential_smaller_boost():
-    return macguffin.get_new_smaller_boost(get_total_value())
+    return macguffin.get_new_smaller_boost(ledger.total)
 
 
 def view_potential():
@@ -87,22 +78,25 @@ def view_potential():
     )
 
 
-@confirm(
-    lambda: "\n".join(
+def go_back_in_time_message():
+    standard = Formatter.percentage(get_potential_standard_boost())
+    smaller = Formatter.percentage(get_potential_smaller_boost())
+    return "\n".join(
         [
             "Are you sure you want to erase ALL progress and go back in time?",
             f"[{Colors.LOCKED}]You'll lose all your progress and gain the following boosts:",
-            f"{Formatter.percentage(get_potential_standard_boost())} mineral value",
-            f"{Formatter.percentage(get_potential_standard_boost())} xp gain",
-            f"{Formatter.percentage(get_potential_smaller_boost())} soul credits",
-            f"{Formatter.percentage(get_potential_smaller_boost())} research speed",
-            f"{Formatter.percentage(get_potential_smaller_boost())} plant value",
+            f"{standard} mineral value",
+            f"{standard} xp gain",
+            f"{smaller} soul credits",
+            f"{smaller} research speed",
+            f"{smaller} plant value",
             "",
             "Oh, yeah, and there's a slight chance you may experience a bit of transmogrification.",
         ]
-    ),
-    enter,
-)
+    )
+
+
+@confirm(go_back_in_time_message, enter)
 def go_back_in_time():
     standard = get_potential_standard_boost()
     smaller = get_potential_smaller_boost()
@@ -1,16 +1,6 @@
 # pylint: disable=line-too-long
 
-from myning.chapters import (
-    Option,
-    PickArgs,
-    PickHandler,
-    StoryArgs,
-    armory,
-    healer,
-    main_menu,
-    mine,
-    store,
-)
+from myning.chapters import Option, PickArgs, PickHandler, StoryArgs, lazy_handler, main_menu
 from myning.objects.character import Character
 from myning.objects.game import Game, GameState
 from myning.objects.inventory import Inventory
@@ -118,7 +108,7 @@ def get_helmet():
             f"{carl.name}: {carl.introduction}",
             f"{carl.name}: Welcome to the store. Take a look around. Special sale today on absolutely nothing.",
         ],
-        store.enter,
+        lazy_handler("myning.chapters.store"),
     )
 
 
@@ -126,7 +116,10 @@ def learn_armory():
     return PickArgs(
         message=f"{jrod.name}: It's time to get your equipment ready. Here's what you're wearing down into the mines.\n",
         options=[
-            Option(f"Press {Formatter.keybind('Enter ↩')} to continue...", armory.pick_member)
+            Option(
+                f"Press {Formatter.keybind('Enter ↩')} to continue...",
+                lazy_handler("myning.chapters.armory", "pick_member"),
+            )
         ],
         subtitle=player.equipment_table,
     )
@@ -142,7 +135,7 @@ def learn_mine():
             "not be able to benefit from the bonuses they provide or skip time when there would "
             "normally be a mini-game",
         ],
-        mine.pick_mine,
+        lazy_handler("myning.chapters.mine", "pick_mine"),
     )
 
 
@@ -155,7 +148,7 @@ def learn_healer():
             "As you exit the mine, a large boulder falls and hits your head. You have lost 2 health!",
             f"{jrod.name}: It looks like you took some damage from the mine! Let's go heal that up.",
         ]
-    return narrate(messages, healer.enter)
+    return narrate(messages, lazy_handler("myning.chapters.healer"))
 
 
 def learn_bindings():
@@ -6,6 +6,7 @@ from myning.chapters import Option, PickArgs, main_menu
 from myning.config import UPGRADES
 from myning.objects.player import Player
 from myning.objects.upgrade import Upgrade
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 from myning.utilities.ui import Colors
@@ -53,5 +54,6 @@ def buy(upgrade: Upgrade):
     upgrade.level += 1
     if upgrade.id not in [u.id for u in player.upgrades]:
         player.upgrades.append(upgrade)
+    EventBus.publish(GameEvent.UPGRADES)
     FileManager.save(player)
     return enter()
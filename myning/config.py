@@ -1,12 +1,21 @@
 from pathlib import Path
 
-import yaml
-
 from myning.objects.mine import Mine
 from myning.objects.species import Species
 from myning.objects.upgrade import Upgrade, UpgradeType
+from myning.utilities.content_cache import load_content
 
 _CONFIG_DIR = Path(__file__).parent
+_CONTENT_FILES = [
+    "config.yaml",
+    "names.yaml",
+    "strings.yaml",
+    "mines.yaml",
+    "research.yaml",
+    "species.yaml",
+    "upgrades.yaml",
+]
+_CONTENT_CACHE = _CONFIG_DIR / "__pycache__" / "content.pickle"
 
 CONFIG: dict[str, int]
 MINES: dict[str, Mine] = {}
@@ -15,9 +24,11 @@ SPECIES: dict[str, Species] = {}
 UPGRADES: dict[str, Upgrade] = {}
 
 
+_content = load_content(_CONFIG_DIR, _CONTENT_FILES, _CONTENT_CACHE)
+
+
 def _load_yaml(filename: str) -> dict:
-    with open(_CONFIG_DIR / filename) as f:
-        return yaml.safe_load(f)
+    return _content[filename]
 
 
 CONFIG = _load_yaml("config.yaml")
@@ -41,6 +52,7 @@ for _id, _upgrade in _load_yaml("upgrades.yaml").items():
 
 LOST_RATIO = CONFIG["lost_ratio"]
 MARKDOWN_RATIO = CONFIG["markdown_ratio"]
+STORE_REFRESH_MINUTES = CONFIG["store_refresh_minutes"]
 XP_COST = CONFIG["xp_cost"]
 
 HEAL_TICK_LENGTH = CONFIG["heal_tick_length"]
@@ -10,6 +10,7 @@ from . import (
     soul_credits,
     species_pokedex,
     sqlite_migration,
+    stack_minerals,
     stats_transfer,
 )
 
@@ -26,4 +27,5 @@ MIGRATIONS = {
     10: inventory_transfer,
     11: sqlite_migration,
     12: bestiary_backfill,
+    13: stack_minerals,
 }
@@ -9,15 +9,22 @@ def check_for_migrations():
     if not os.path.exists(".data"):
         return
 
+    # Read the whole save at once, the rest of the game is loaded from it after the player
+    FileManager.preload()
     Player.initialize()
     player = Player()
 
     latest_migration = player.completed_migrations[-1]
     while latest_migration != list(MIGRATIONS.keys())[-1]:
         latest_migration = latest_migration + 1
+        # Migrations rewrite the save, so read it again once they ran
+        FileManager.clear_preloaded()
         MIGRATIONS[latest_migration].run()
+        FileManager.preload()
         player.completed_migrations.append(latest_migration)
 
         input(f"\nMIGRATION {latest_migration} RAN (Enter to continue)")
 
     FileManager.save(player)
+    # Migrations can load their own player, keep the one that was just saved for the game to use
+    Player._instance = player  # pylint: disable=protected-access
@@ -0,0 +1,87 @@
+"""Migration 13: Fold minerals into stacks.
+
+Every mineral used to be saved as its own `items/<id>` row. Minerals with the same name and value
+are now a single stack that counts them: one row per stack for the inventory, and stored inline
+in the trip. The database is vacuumed afterwards to give the freed pages back.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from myning.objects.item import Item, ItemType
+from myning.utilities.file_manager import DB_PATH
+
+CHUNK_SIZE = 500
+
+
+def fold(conn: sqlite3.Connection, minerals: list[str | dict]) -> dict[str, Item]:
+    """Stacks of the given minerals, which are either item ids or already stacked items"""
+    stacks: dict[str, Item] = {}
+    items = [Item.from_dict(mineral) for mineral in minerals if isinstance(mineral, dict)]
+    ids = [mineral for mineral in minerals if isinstance(mineral, str)]
+    for start in range(0, len(ids), CHUNK_SIZE):
+        keys = [f"items/{id}" for id in ids[start : start + CHUNK_SIZE]]
+        rows = conn.execute(
+            f"SELECT data FROM save_data WHERE key IN ({','.join('?' * len(keys))})", keys
+        )
+        items.extend(Item.from_dict(json.loads(data)) for (data,) in rows)
+    for item in items:
+        item.id = item.stack_id
+        if (stack := stacks.get(item.id)) is not None:
+            stack.count += item.count
+        else:
+            stacks[item.id] = item
+    return stacks
+
+
+def load(conn: sqlite3.Connection, key: str) -> dict | None:
+    row = conn.execute("SELECT data FROM save_data WHERE key=?", (key,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def save(conn: sqlite3.Connection, key: str, data: dict):
+    conn.execute(
+        "INSERT OR REPLACE INTO save_data (key, data) VALUES (?, ?)", (key, json.dumps(data))
+    )
+
+
+def run():
+    db_file = Path(DB_PATH)
+    if not db_file.is_file():
+        return
+    size_before = db_file.stat().st_size
+
+    conn = sqlite3.connect(DB_PATH)
+    folded = set()
+    stacked = set()
+    with conn:
+        if (inventory := load(conn, "inventory")) and ItemType.MINERAL.value in inventory:
+            minerals = inventory[ItemType.MINERAL.value]
+            stacks = fold(conn, minerals)
+            for stack in stacks.values():
+                save(conn, stack.file_name, stack.to_dict())
+            inventory[ItemType.MINERAL.value] = list(stacks)
+            save(conn, "inventory", inventory)
+            folded.update(minerals)
+            stacked.update(stacks)
+
+        if trip := load(conn, "trip"):
+            minerals = trip["minerals_mined"]
+            stacks = fold(conn, minerals)
+            trip["minerals_mined"] = [stack.to_dict() for stack in stacks.values()]
+            save(conn, "trip", trip)
+            folded.update(mineral for mineral in minerals if isinstance(mineral, str))
+
+        conn.executemany(
+            "DELETE FROM save_data WHERE key=?",
+            ((f"items/{id}",) for id in folded - stacked),
+        )
+    conn.execute("VACUUM")
+    conn.close()
+
+    size_after = db_file.stat().st_size
+    print(
+        f"\nFolded {len(folded):,} mineral rows into {len(stacked):,} stacks. "
+        f"Save data went from {size_before / 1024:,.0f} KB to {size_after / 1024:,.0f} KB."
+    )
@@ -8,7 +8,8 @@ from myning.config import SPECIES, XP_COST
 from myning.objects.equipment import Equipment
 from myning.objects.object import Object
 from myning.objects.species import Species
-from myning.utilities.fib import fibonacci, fibonacci_sum
+from myning.utilities.event_bus import EventBus, GameEvent
+from myning.utilities.fib import fibonacci, fibonacci_sum, highest_level
 from myning.utilities.file_manager import FileManager
 from myning.utilities.formatter import Formatter
 from myning.utilities.rand import get_random_int
@@ -163,35 +164,30 @@ class Character(Object):
         if "id" in dict:
             entity.id = dict["id"]
 
-        # add id (and save) for all allies without
+        # add id for all allies without, their old file is replaced once loading is done
         # TODO: remove after everyone is migrated
         elif "allies" not in dict:
-            # clear old file?
             entity.id = entity.name
-            FileManager.delete(entity)
-
-            # create new file for allies
+            stale_key = entity.file_name
             entity.id = f"{entity.name} - {get_random_int(10**13)}"
-            FileManager.save(entity)
+            FileManager.repair(entity, stale_key)
 
         entity.is_ghost = dict.get("is_ghost") or False
         return entity
 
-    def add_experience(self, xp: int):
+    def add_experience(self, xp: int, save: bool = True):
+        """Add `xp`, jumping straight to the level it reaches. Pass `save=False` when the caller
+        persists the character itself, e.g. allies, which are saved as part of the player."""
         if xp <= 0:
             return
-        self.experience += xp
-        needed = fibonacci(self.level + 1)
-        while self.experience >= needed:
-            self.level += 1
-            self.experience -= needed
-            self.health += self.health_mod
-            for stat in Character.base_stats:
-                self.stats[stat] += 1
-
-            needed = fibonacci(self.level + 1)
+        level = highest_level(self.level, self.experience + xp)
+        self.experience += xp - (fibonacci_sum(level) - fibonacci_sum(self.level))
+        self.health += (level - self.level) * self.health_mod
+        self.level = level
+        EventBus.publish(GameEvent.ARMY)
 
-        FileManager.save(self)
+        if save:
+            FileManager.save(self)
 
     companion_species = [
         CharacterSpecies.DWARF,
@@ -1,6 +1,7 @@
 from rich.table import Table
 
 from myning.objects.item import Item, ItemType
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager
 
 EQUIPMENT_TYPES = [
@@ -28,12 +29,14 @@ class Equipment:
 
     def clear(self):
         self._slots = {category: None for category in EQUIPMENT_TYPES}
+        EventBus.publish(GameEvent.ARMY)
 
     def get_slot_item(self, slot: ItemType):
         return self._slots[slot]
 
     def equip(self, item: Item):
         self._slots[item.type] = item
+        EventBus.publish(GameEvent.ARMY)
 
     @property
     def stats(self):
@@ -2,6 +2,7 @@ from enum import Enum
 
 from myning.objects.object import Object
 from myning.objects.singleton import Singleton
+from myning.utilities.clock import clock
 from myning.utilities.file_manager import FileManager
 
 
@@ -31,10 +32,12 @@ class Game(Object, metaclass=Singleton):
     def to_dict(self):
         return {
             "state": self._state,
+            "clock": clock.to_dict(),
         }
 
     @classmethod
     def from_dict(cls, dict: dict):
         game = cls._create()
         game._state = dict["state"]
+        clock.load(dict.get("clock"))
         return game
@@ -1,8 +1,11 @@
 from datetime import datetime, timedelta
 
+from myning.objects.garden_schedule import CellQueue, GardenSchedule
 from myning.objects.object import Object
 from myning.objects.plant import Plant
 from myning.objects.singleton import Singleton
+from myning.utilities.clock import clock
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.fib import fibonacci
 from myning.utilities.file_manager import FileManager, Subfolders
 
@@ -14,6 +17,7 @@ class Garden(Object, metaclass=Singleton):
         if not garden:
             garden = cls._create()
         cls._instance = garden
+        clock.register(garden)
 
     file_name = "garden"
 
@@ -28,6 +32,14 @@ class Garden(Object, metaclass=Singleton):
         self.water = water if water else level
         self.last_collected_water = last_collected_water
         self.rows = rows if rows else [[None for _ in range(level)] for _ in range(level)]
+        self.schedule = GardenSchedule()
+        self.free = CellQueue()
+        for row, plants in enumerate(self.rows):
+            for column, plant in enumerate(plants):
+                if plant:
+                    self.schedule.add(row, column, plant)
+                else:
+                    self.free.add((row, column))
 
     def to_dict(self):
         return {
@@ -57,7 +69,7 @@ class Garden(Object, metaclass=Singleton):
 
     @property
     def empty(self):
-        return not any(plant for row in self.rows for plant in row)
+        return len(self.free) == self.level * self.level
 
     @property
     def next_empty_row(self):
@@ -65,12 +77,7 @@ class Garden(Object, metaclass=Singleton):
 
     @property
     def next_empty_coords(self):
-        for row in range(self.level):
-            for column in range(self.level):
-                plant = self.get_plant(row, column)
-                if not plant:
-                    return row, column
-        return None, None
+        return self.free.first() or (None, None)
 
     @property
     def next_unharvest_row(self):
@@ -78,12 +85,8 @@ class Garden(Object, metaclass=Singleton):
 
     @property
     def next_plant_coords(self):
-        for row in range(self.level):
-            for column in range(self.level):
-                plant = self.get_plant(row, column)
-                if plant and plant.ready:
-                    return row, column
-        return None, None
+        self.schedule.advance()
+        return self.schedule.ready.first() or (None, None)
 
     @property
     def upgrade_cost(self) -> int:
@@ -98,37 +101,78 @@ class Garden(Object, metaclass=Singleton):
 
     def collect_water(self):
         if not self.last_collected_water:
-            self.last_collected_water = datetime.now()
+            self.last_collected_water = clock.now()
             FileManager.save(self)
             return
-        time_since_last_water = (datetime.now() - self.last_collected_water).total_seconds()
+        time_since_last_water = (clock.now() - self.last_collected_water).total_seconds()
         new_water = min(self.level, self.water + int(time_since_last_water / 60))
         if new_water > self.water:
-            self.last_collected_water = datetime.now()
+            self.last_collected_water = clock.now()
             self.water = new_water
             FileManager.save(self)
 
+    def next_due(self) -> datetime | None:
+        """When the garden next changes on its own, for fast-forwarding the game clock"""
+        due = []
+        if self.schedule.events:
+            # Rounded up, event times are floats but the clock counts microseconds
+            due.append(
+                datetime.fromtimestamp(self.schedule.events[0][0]) + timedelta(microseconds=1)
+            )
+        if self.water < self.level and self.last_collected_water:
+            due.append(self.last_collected_water + timedelta(minutes=1))
+        return min(due, default=None)
+
+    def catch_up(self):
+        self.schedule.advance()
+        self.collect_water()
+
     def level_up(self):
         self.level += 1
         self.water += 1
-        for row in self.rows:
-            row.append(None)
+        for row, plants in enumerate(self.rows):
+            plants.append(None)
+            self.free.add((row, self.level - 1))
 
         self.rows.append([None for _ in range(self.level)])
+        for column in range(self.level):
+            self.free.add((self.level - 1, column))
+        EventBus.publish(GameEvent.GARDEN)
 
     def add_plant(self, plant: "Plant", row: int, column: int):
         self.rows[row][column] = plant
+        self.free.discard((row, column))
+        self.schedule.add(row, column, plant)
+        EventBus.publish(GameEvent.GARDEN)
 
     def get_plant(self, row: int, column: int):
         return self.rows[row][column]
 
     def check_ready(self, row: int, column: int) -> bool:
-        plant = self.get_plant(row, column)
-        return plant and plant.ready
+        self.schedule.advance()
+        return (row, column) in self.schedule.ready
+
+    def empty_columns(self, row: int) -> list[int]:
+        return [column for column in range(self.level) if (row, column) in self.free]
+
+    def ready_columns(self, row: int) -> list[int]:
+        self.schedule.advance()
+        return [column for column in range(self.level) if (row, column) in self.schedule.ready]
+
+    def changed_cells(self):
+        """Cells whose growth icon changed since this was last called"""
+        self.schedule.advance()
+        return self.schedule.pop_changed()
+
+    def growth_icon(self, row: int, column: int) -> str:
+        return self.schedule.icon(row, column)
 
     def uproot_plant(self, row: int, column: int):
         uprooted_plant = self.rows[row][column]
         self.rows[row][column] = None
+        self.free.add((row, column))
+        self.schedule.remove(row, column)
+        EventBus.publish(GameEvent.GARDEN)
         return uprooted_plant
 
     def harvest_plant(self, row: int, column: int):
@@ -143,5 +187,7 @@ class Garden(Object, metaclass=Singleton):
         if not plant:
             return
         plant.started = plant.started - timedelta(minutes=1 * self.level)
+        self.schedule.add(row, column, plant)
         self.water -= 1
+        EventBus.publish(GameEvent.GARDEN)
         return plant
@@ -0,0 +1,165 @@
+import heapq
+from datetime import datetime
+from typing import NamedTuple
+
+from myning.objects.plant import Plant
+from myning.utilities.clock import clock
+
+# Fractions of its growth time at which a plant's icon changes, the last one is when it is ready
+STAGES = (0.5, 0.75, 1)
+STAGE_ICONS = ("🌱", "🪴", "🌳")
+READY = len(STAGES)
+
+Coords = tuple[int, int]
+
+
+class Cell(NamedTuple):
+    plant: Plant
+    started: float
+    total: float
+
+
+class CellQueue:
+    """A set of cells that also gives the first one in row-major order. Removed cells are left in
+    the heap and skipped when they reach the top."""
+
+    def __init__(self, cells=()):
+        self.cells: set[Coords] = set(cells)
+        self.heap = sorted(self.cells)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, coords: Coords):
+        return coords in self.cells
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def add(self, coords: Coords):
+        if coords not in self.cells:
+            self.cells.add(coords)
+            heapq.heappush(self.heap, coords)
+
+    def discard(self, coords: Coords):
+        self.cells.discard(coords)
+
+    def first(self) -> Coords | None:
+        while self.heap and self.heap[0] not in self.cells:
+            heapq.heappop(self.heap)
+        return self.heap[0] if self.heap else None
+
+
+def timestamp(now: datetime | None = None) -> float:
+    return now.timestamp() if now else clock.timestamp()
+
+
+class GardenSchedule:
+    """The times at which the plants in a garden next change their growth icon, in a heap keyed by
+    absolute time. Checking on the garden pops the events that are due, so only the plants whose
+    icon changed are touched no matter how big the garden is.
+
+    Events are never removed from the heap. An event is skipped when its cell no longer holds the
+    plant it was scheduled for, or the plant was watered (restarted) since.
+    """
+
+    def __init__(self):
+        self.cells: dict[Coords, Cell] = {}
+        self.stages: dict[Coords, int] = {}
+        self.ready = CellQueue()
+        self.changed: set[Coords] = set()
+        self.events: list[tuple[float, int, int, float]] = []
+        # Latest end times first, for the time left until the whole garden is grown
+        self.ends: list[tuple[float, int, int, float]] = []
+        # Overall growth is `growing * now - growing_started + ready_time`
+        self.growing = 0
+        self.growing_started = 0.0
+        self.ready_time = 0.0
+        self.total_time = 0.0
+
+    def add(self, row: int, column: int, plant: Plant, now: datetime | None = None):
+        """Schedule `plant`, replacing whatever was scheduled for its cell"""
+        self.remove(row, column)
+        if not plant.started:
+            return
+        cell = Cell(plant, timestamp(plant.started), plant.total_time)
+        coords = (row, column)
+        self.cells[coords] = cell
+        self.total_time += cell.total
+        self.growing += 1
+        self.growing_started += cell.started
+        # Not a stage yet, so updating it always schedules its next event
+        self.stages[coords] = -1
+        heapq.heappush(self.ends, (-(cell.started + cell.total), row, column, cell.started))
+        self._update(coords, cell, timestamp(now))
+
+    def remove(self, row: int, column: int):
+        coords = (row, column)
+        cell = self.cells.pop(coords, None)
+        if not cell:
+            return
+        self.total_time -= cell.total
+        if self.stages.pop(coords) == READY:
+            self.ready.discard(coords)
+            self.ready_time -= cell.total
+        else:
+            self.growing -= 1
+            self.growing_started -= cell.started
+        self.changed.add(coords)
+
+    def advance(self, now: datetime | None = None):
+        """Apply the events that are due"""
+        now_ts = timestamp(now)
+        while self.events and self.events[0][0] <= now_ts:
+            _, row, column, started = heapq.heappop(self.events)
+            cell = self.cells.get((row, column))
+            if cell and cell.started == started:
+                self._update((row, column), cell, now_ts)
+
+    def pop_changed(self) -> set[Coords]:
+        """Cells whose icon changed since this was last called"""
+        changed, self.changed = self.changed, set()
+        return changed
+
+    def _update(self, coords: Coords, cell: Cell, now: float):
+        # Compare times the same way events are scheduled so a due event always moves the stage on
+        stage = next(
+            (
+                i
+                for i, threshold in enumerate(STAGES)
+                if cell.started + cell.total * threshold > now
+            ),
+            READY,
+        )
+        if stage == self.stages[coords]:
+            return
+        self.stages[coords] = stage
+        self.changed.add(coords)
+        if stage == READY:
+            self.ready.add(coords)
+            self.growing -= 1
+            self.growing_started -= cell.started
+            self.ready_time += cell.total
+        else:
+            when = cell.started + cell.total * STAGES[stage]
+            heapq.heappush(self.events, (when, *coords, cell.started))
+
+    def icon(self, row: int, column: int) -> str:
+        coords = (row, column)
+        if coords not in self.cells:
+            return ""
+        stage = self.stages[coords]
+        return self.cells[coords].plant.icon if stage == READY else STAGE_ICONS[stage]
+
+    def progress(self, now: datetime | None = None) -> float:
+        """Seconds of growth done by all plants, each counting up to its own growth time"""
+        return self.growing * timestamp(now) - self.growing_started + self.ready_time
+
+    def time_left(self, now: datetime | None = None) -> float:
+        while self.ends:
+            end, row, column, started = self.ends[0]
+            cell = self.cells.get((row, column))
+            if cell and cell.started == started:
+                return max(0, -end - timestamp(now))
+            heapq.heappop(self.ends)
+        return 0
@@ -1,6 +1,7 @@
 from myning.objects.character import Character
 from myning.objects.object import Object
 from myning.objects.singleton import Singleton
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager
 
 
@@ -40,10 +41,12 @@ class Graveyard(Object, metaclass=Singleton):
     def add_soul_credits(self, credits: float):
         if credits > 0:
             self.soul_credits += credits
+            EventBus.publish(GameEvent.SOUL_CREDITS)
 
     def remove_soul_credits(self, credits: float):
         if credits > 0:
             self.soul_credits -= credits
+            EventBus.publish(GameEvent.SOUL_CREDITS)
 
     @property
     def fallen_allies(self) -> list[Character]:
@@ -1,12 +1,83 @@
-from typing import Literal, overload
+from bisect import bisect_left
+from itertools import chain, count
+from typing import Iterator, Literal, overload
 
 from myning.objects.item import Item, ItemType
 from myning.objects.object import Object
 from myning.objects.plant import Plant
 from myning.objects.singleton import Singleton
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager, Subfolders
 
 
+class SlotItems:
+    """The items of one inventory slot, by id in insertion order and ranked by main affect so the
+    best item is always last. Ties rank the earliest added item higher, like `max()` would.
+    Stackable items are merged into the stack already held under their id. The total value and
+    number of units of the slot are kept up to date as items come and go."""
+
+    def __init__(self):
+        self.by_id: dict[str, Item] = {}
+        self.keys: dict[str, tuple[int, int]] = {}
+        self.ranked_keys: list[tuple[int, int]] = []
+        self.ranked: list[Item] = []
+        self.added = count()
+        self.value = 0
+        self.units = 0
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def __contains__(self, item: Item):
+        return self.by_id.get(item.id) is item
+
+    def add(self, item: Item) -> Item:
+        """Add `item` and return the item now held, which is the existing stack when `item` was
+        merged into one"""
+        if (held := self.by_id.get(item.id)) is not None:
+            if item.stackable and held is not item:
+                held.count += item.count
+                self.value += item.total_value
+                self.units += item.count
+                return held
+            self.remove(held)
+        key = (get_main_affect(item), -next(self.added))
+        index = bisect_left(self.ranked_keys, key)
+        self.ranked_keys.insert(index, key)
+        self.ranked.insert(index, item)
+        self.by_id[item.id] = item
+        self.keys[item.id] = key
+        self.value += item.total_value
+        self.units += item.count
+        return item
+
+    def remove(self, item: Item):
+        if item not in self:
+            return False
+        key = self.keys.pop(item.id)
+        del self.by_id[item.id]
+        index = bisect_left(self.ranked_keys, key)
+        del self.ranked_keys[index]
+        del self.ranked[index]
+        self.value -= item.total_value
+        self.units -= item.count
+        return True
+
+    @property
+    def best(self) -> Item | None:
+        return self.ranked[-1] if self.ranked else None
+
+
+def get_main_affect(item: Item) -> int:
+    try:
+        return item.main_affect
+    except KeyError:  # equipment without its main affect
+        return 0
+
+
 class Inventory(Object, metaclass=Singleton):
     @classmethod
     def initialize(cls):
@@ -18,32 +89,44 @@ class Inventory(Object, metaclass=Singleton):
     file_name = "inventory"
 
     def __init__(self):
-        self._items: dict[ItemType, list[Item]] = {}
-
-    def add_item(self, item: Item):
-        if item.type in self._items:
-            self._items[item.type].append(item)
-        else:
-            self._items[item.type] = [item]
-
-    def add_items(self, items: list[Item]):
+        self._items: dict[ItemType, SlotItems] = {}
+
+    def _add(self, item: Item) -> Item:
+        if item.type not in self._items:
+            self._items[item.type] = SlotItems()
+        return self._items[item.type].add(item)
+
+    def add_item(self, item: Item) -> Item:
+        """Add `item`, returning the item to persist: `item` itself or the stack it joined"""
+        held = self._add(item)
+        EventBus.publish(GameEvent.INVENTORY)
+        return held
+
+    def add_items(self, items: list[Item]) -> list[Item]:
+        """Add `items`, returning the items to persist once each"""
+        held = {}
         for item in items:
-            self.add_item(item)
+            stored = self._add(item)
+            held[stored.id] = stored
+        EventBus.publish(GameEvent.INVENTORY)
+        return list(held.values())
 
     def remove_item(self, item: Item):
-        if item.type in self._items and item in self._items[item.type]:
-            self._items[item.type].remove(item)
+        if item.type in self._items and self._items[item.type].remove(item):
+            EventBus.publish(GameEvent.INVENTORY)
 
     def remove_items(self, *items: Item):
         for item in items:
-            if item.type in self._items and item in self._items[item.type]:
+            if item.type in self._items:
                 self._items[item.type].remove(item)
+        EventBus.publish(GameEvent.INVENTORY)
 
     def clear(self):
         self._items = {}
+        EventBus.publish(GameEvent.INVENTORY)
 
     def items_by_type(self) -> list[list[Item]]:
-        return list(self._items.values())
+        return [list(slot_items) for slot_items in self._items.values()]
 
     @overload
     def get_slot(self, slot: Literal[ItemType.PLANT]) -> list[Plant]: ...
@@ -52,24 +135,38 @@ class Inventory(Object, metaclass=Singleton):
     def get_slot(self, slot: ItemType) -> list[Item]: ...
 
     def get_slot(self, slot) -> list[Item] | list[Plant]:
-        return self._items.get(slot, [])
+        return list(self._items.get(slot, ()))
 
     def has_better_item(self, slot: ItemType, current: Item | None):
-        if slot_items := self.get_slot(slot):
-            if current:
-                # pylint: disable=not-an-iterable
-                return any(item for item in slot_items if item.main_affect > current.main_affect)
-            return True
+        if best := self.get_best_in_slot(slot):
+            return not current or get_main_affect(best) > current.main_affect
         return False
 
     def get_best_in_slot(self, slot: ItemType):
-        if slot_items := self.get_slot(slot):
-            return max(slot_items, key=lambda item: item.main_affect)
+        if slot_items := self._items.get(slot):
+            return slot_items.best
         return None
 
     @property
     def items(self):
-        return [item for type in self._items for item in self._items[type]]
+        return [item for slot_items in self._items.values() for item in slot_items]
+
+    def iter_items(self) -> Iterator[Item]:
+        """Iterate over `items` without building a list"""
+        return chain.from_iterable(self._items.values())
+
+    @property
+    def item_count(self) -> int:
+        """Number of units held, counting every item of a stack"""
+        return sum(slot_items.units for slot_items in self._items.values())
+
+    def count(self, slot: ItemType) -> int:
+        slot_items = self._items.get(slot)
+        return slot_items.units if slot_items else 0
+
+    def slot_value(self, slot: ItemType) -> int:
+        slot_items = self._items.get(slot)
+        return slot_items.value if slot_items else 0
 
     @property
     def seeds(self):
@@ -78,24 +175,22 @@ class Inventory(Object, metaclass=Singleton):
 
     @property
     def total_value(self) -> int:
-        return sum(item.value for item in self.items)
+        return sum(slot_items.value for slot_items in self._items.values())
 
     def to_dict(self) -> dict:
         dict = {}
-        for type_name, type in self._items.items():
-            dict[type_name] = []
-            for item in type:
-                dict[type_name].append(item.id)
+        for type_name, slot_items in self._items.items():
+            dict[type_name] = list(slot_items.by_id)
         return dict
 
     @classmethod
     def from_dict(cls, data: dict) -> "Inventory":
         inventory = cls._create()
         for item_type, items_ids in data.items():
-            inventory._items[item_type] = []
+            inventory._items[item_type] = SlotItems()
             for item_id in items_ids:
                 icls = Plant if item_type == ItemType.PLANT.value else Item
                 fetched = FileManager.load(icls, item_id, Subfolders.ITEMS)
                 if fetched:
-                    inventory._items[item_type].append(fetched)
+                    inventory._items[item_type].add(fetched)
         return inventory
@@ -1,4 +1,7 @@
+import sys
 from enum import Enum
+from functools import lru_cache
+from typing import NamedTuple
 
 from rich.text import Text
 
@@ -17,7 +20,100 @@ class ItemType(str, Enum):
     PLANT = "plant"
 
 
+def get_color(type: ItemType) -> str:
+    match type:
+        case ItemType.MINERAL:
+            return Colors.GOLD
+        case ItemType.WEAPON:
+            return Colors.WEAPON
+        case ItemType.HELMET | ItemType.SHIRT | ItemType.PANTS | ItemType.SHOES:
+            return Colors.ARMOR
+        case ItemType.PLANT:
+            return Colors.PLANT
+        case _:
+            return ""
+
+
+def get_icon(type: ItemType) -> str:
+    match type:
+        case ItemType.MINERAL:
+            return Icons.MINERAL
+        case ItemType.WEAPON:
+            return Icons.WEAPON
+        case ItemType.HELMET:
+            return Icons.HELMET
+        case ItemType.SHIRT:
+            return Icons.SHIRT
+        case ItemType.PANTS:
+            return Icons.PANTS
+        case ItemType.SHOES:
+            return Icons.SHOES
+        case _:
+            return Icons.UNKNOWN
+
+
+def get_main_affect_type(type: ItemType) -> str:
+    if type == ItemType.WEAPON:
+        return "damage"
+    if type == ItemType.MINERAL:
+        return "value"
+    return "armor"
+
+
+class ItemTemplate(NamedTuple):
+    """What all items with the same name, description and type have in common. Templates are
+    shared between those items, see `get_template`."""
+
+    name: str
+    description: str
+    type: ItemType
+    color: str
+    icon: str
+    main_affect_type: str
+    markup: str
+
+
+# Bounded, every generated piece of equipment has its own name. Evicted templates are rebuilt
+# equal, the items holding them keep theirs.
+@lru_cache(maxsize=4096)
+def get_template(name: str, description: str, type: ItemType | str) -> ItemTemplate:
+    type = ItemType(type)
+    color = get_color(type)
+    name = sys.intern(name)
+    return ItemTemplate(
+        name,
+        sys.intern(description),
+        type,
+        color,
+        get_icon(type),
+        get_main_affect_type(type),
+        f"[{color}]{name}[/]",
+    )
+
+
+@lru_cache(maxsize=1024)
+def get_affect_text(color: str, affect: int) -> Text:
+    """The right aligned main affect shown in item rows, shared between rows. Don't modify it,
+    copy it first."""
+    return Text.from_markup(f"[{color}]{affect}[/]", justify="right")
+
+
+Affects = tuple[tuple[str, int], ...]
+
+_shared_affects: dict[Affects, Affects] = {}
+
+
+def share_affects(affects: dict[str, int]) -> Affects:
+    """The one shared tuple for these affects, most equipment only has its main affect"""
+    shared = tuple(affects.items())
+    return _shared_affects.setdefault(shared, shared)
+
+
 class Item(Object):
+    # Inventories hold a lot of items, so they only keep what differs between items with the
+    # same template
+    __slots__ = ("template", "value", "_affects", "id", "count")
+
     def __init__(
         self,
         name: str,
@@ -26,21 +122,66 @@ class Item(Object):
         value: int = 0,
         main_affect: int = 0,
     ):
-        self.name = name
-        self.description = description
-        self.type = type
+        self.template = get_template(name, description, type)
         self.value = value
-        self.affects: dict[str, int] = {}
-        self.id = f"{self.name} - {get_random_int(10000000000000)}"
+        self._affects: Affects = ()
+        self.count = 1
+        self.id = (
+            self.stack_id if self.stackable else f"{self.name} - {get_random_int(10000000000000)}"
+        )
 
         if main_affect:
             self.add_affect(self.main_affect_type, main_affect)
 
+    @property
+    def name(self):
+        return self.template.name
+
+    @name.setter
+    def name(self, name: str):
+        self.template = get_template(name, self.description, self.type)
+
+    @property
+    def description(self):
+        return self.template.description
+
+    @description.setter
+    def description(self, description: str):
+        self.template = get_template(self.name, description, self.type)
+
+    @property
+    def type(self):
+        return self.template.type
+
+    @property
+    def affects(self) -> dict[str, int]:
+        return dict(self._affects)
+
+    @affects.setter
+    def affects(self, affects: dict[str, int]):
+        self._affects = share_affects(affects)
+
     def add_affect(self, stat, value):
-        self.affects[stat] = value
+        self._affects = share_affects({**self.affects, stat: value})
 
     def remove_affect(self, stat):
-        del self.affects[stat]
+        affects = self.affects
+        del affects[stat]
+        self._affects = share_affects(affects)
+
+    @property
+    def stackable(self):
+        """Minerals are fungible: all minerals with the same name and value are kept as one stack
+        that counts how many of them there are"""
+        return self.type == ItemType.MINERAL
+
+    @property
+    def stack_id(self):
+        return sys.intern(f"{self.name} - stack {self.value}")
+
+    @property
+    def total_value(self):
+        return self.value * self.count
 
     @property
     def file_name(self):
@@ -50,15 +191,15 @@ class Item(Object):
     def main_affect(self):
         if self.type in (ItemType.MINERAL, ItemType.PLANT):
             return self.value
-        return self.affects[self.main_affect_type]
+        main_affect_type = self.main_affect_type
+        for stat, value in self._affects:
+            if stat == main_affect_type:
+                return value
+        raise KeyError(main_affect_type)
 
     @property
     def main_affect_type(self):
-        if self.type == ItemType.WEAPON:
-            return "damage"
-        if self.type == ItemType.MINERAL:
-            return "value"
-        return "armor"
+        return self.template.main_affect_type
 
     def to_dict(self) -> dict:
         return {
@@ -68,6 +209,7 @@ class Item(Object):
             "affects": self.affects,
             "type": self.type,
             "id": self.id,
+            "count": self.count,
         }
 
     @classmethod
@@ -80,62 +222,49 @@ class Item(Object):
         )
         item.affects = dict["affects"]
         item.id = dict["id"]
+        item.count = dict.get("count", 1)
         return item
 
     @property
     def color(self):
-        match self.type:
-            case ItemType.MINERAL:
-                return Colors.GOLD
-            case ItemType.WEAPON:
-                return Colors.WEAPON
-            case ItemType.HELMET | ItemType.SHIRT | ItemType.PANTS | ItemType.SHOES:
-                return Colors.ARMOR
-            case ItemType.PLANT:
-                return Colors.PLANT
-            case _:
-                return ""
+        return self.template.color
 
     @property
     def icon(self):
-        match self.type:
-            case ItemType.MINERAL:
-                return Icons.MINERAL
-            case ItemType.WEAPON:
-                return Icons.WEAPON
-            case ItemType.HELMET:
-                return Icons.HELMET
-            case ItemType.SHIRT:
-                return Icons.SHIRT
-            case ItemType.PANTS:
-                return Icons.PANTS
-            case ItemType.SHOES:
-                return Icons.SHOES
-            case _:
-                return Icons.UNKNOWN
+        return self.template.icon
 
     def __str__(self):
-        s = f"{self.icon} [{self.color}]{self.name}[/]"
+        s = f"{self.icon} {self.markup}"
         if self.type not in (ItemType.MINERAL, ItemType.PLANT):
             s += f" ([{self.color}]{self.main_affect}[/])"
         return s
 
+    @property
+    def display_name(self):
+        return f"{self.name} x{self.count}" if self.count > 1 else self.name
+
+    @property
+    def markup(self):
+        if self.count > 1:
+            return f"[{self.color}]{self.display_name}[/]"
+        return self.template.markup
+
     @property
     def arr(self):
         return [
             self.icon,
-            self.name,
-            Text.from_markup(f"[{self.color}]{self.main_affect}[/]", justify="right"),
+            self.display_name,
+            get_affect_text(self.color, self.main_affect),
         ]
 
     @property
     def tutorial_new_str(self):
-        return f"New {self.type.value} added: [{self.color}]{self.name}[/]"
+        return f"New {self.type.value} added: {self.template.markup}"
 
     @property
     def battle_new_str(self):
         return (
             f"New {self.type.value} added: "
-            f"{self.icon} [{self.color}]{self.name}[/] "
+            f"{self.icon} {self.template.markup} "
             f"([{self.color}]{self.main_affect}[/])"
         )
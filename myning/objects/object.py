@@ -5,6 +5,8 @@ T = TypeVar("T", bound="Object")
 
 
 class Object:
+    __slots__ = ()
+
     file_name: str
 
     @abstractmethod
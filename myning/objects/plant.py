@@ -6,6 +6,7 @@ from rich.table import Table
 from rich.text import Text
 
 from myning.objects.item import Item
+from myning.utilities.clock import clock
 from myning.utilities.formatter import Formatter
 from myning.utilities.ui import Colors, Icons
 
@@ -23,6 +24,8 @@ PLANT_TYPES = list(PlantType)
 
 
 class Plant(Item):
+    __slots__ = ("plant_type", "started", "harvested")
+
     def __init__(self, *args, plant_type: PlantType | None = None, **kwargs):
         if "plant" not in args:
             args = [*args, "plant"]
@@ -57,12 +60,12 @@ class Plant(Item):
         return plant
 
     def sow(self):
-        self.started = datetime.now()
+        self.started = clock.now()
 
     def grow(self):
         self.name = self.name.replace("seed", "plant")
         self.description = self.description.replace("seed", "plant")
-        self.harvested = datetime.now()
+        self.harvested = clock.now()
 
     @property
     def growth_icon(self):
@@ -82,7 +85,7 @@ class Plant(Item):
     def elapsed_time(self):
         if not self.started or not self.end_time:
             return 0
-        return (datetime.now() - self.started).total_seconds()
+        return (clock.now() - self.started).total_seconds()
 
     @property
     def total_time(self):
@@ -99,7 +102,7 @@ class Plant(Item):
         ttl = self.value * 5
         if not self.harvested:
             return ttl
-        return ttl - (datetime.now() - self.harvested).total_seconds()
+        return ttl - (clock.now() - self.harvested).total_seconds()
 
     @property
     def expired(self):
@@ -107,7 +110,7 @@ class Plant(Item):
 
     @property
     def ready(self):
-        return self.end_time <= datetime.now() if self.end_time else False
+        return self.end_time <= clock.now() if self.end_time else False
 
     @property
     def is_seed(self):
@@ -115,7 +118,7 @@ class Plant(Item):
 
     @property
     def time_left(self):
-        return max(0, (self.end_time - datetime.now()).total_seconds()) if self.end_time else 0
+        return max(0, (self.end_time - clock.now()).total_seconds()) if self.end_time else 0
 
     @property
     def details(self):
@@ -1,5 +1,6 @@
 import math
 import random
+from itertools import count
 
 from myning.config import MINES, SPECIES, UPGRADES, XP_COST
 from myning.objects.army import Army
@@ -7,9 +8,14 @@ from myning.objects.character import Character, CharacterSpecies
 from myning.objects.mine import Mine
 from myning.objects.mine_stats import MineStats
 from myning.objects.singleton import Singleton
+from myning.objects.species import Species
 from myning.objects.upgrade import Upgrade
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.file_manager import FileManager
 
+# Shared by all players so a new player (e.g. after time travel) never reuses a version
+_discovery_versions = count(1)
+
 
 class Player(Character, metaclass=Singleton):
     # Remove the required argument from the constructor
@@ -36,6 +42,38 @@ class Player(Character, metaclass=Singleton):
             player.completed_migrations = [1]
         cls._instance = player
 
+    @property
+    def gold(self) -> int:
+        return self._gold
+
+    @gold.setter
+    def gold(self, gold: int):
+        self._gold = gold
+        EventBus.publish(GameEvent.GOLD)
+
+    @property
+    def discovered_species(self) -> list[Species]:
+        """Discovered species in the order they were found. Use `discover_species` to add one."""
+        return self._discovered_species
+
+    @discovered_species.setter
+    def discovered_species(self, species: list[Species]):
+        self._discovered_species = list(species)
+        self._discovered_set = set(self._discovered_species)
+        self.discovery_version = next(_discovery_versions)
+
+    def has_discovered(self, species: Species) -> bool:
+        return species in self._discovered_set
+
+    def discover_species(self, species: Species) -> bool:
+        """Add `species` if it is new, returns whether it was"""
+        if species in self._discovered_set:
+            return False
+        self._discovered_species.append(species)
+        self._discovered_set.add(species)
+        self.discovery_version = next(_discovery_versions)
+        return True
+
     @property
     def army(self):
         return Army([self, *self._allies])
@@ -53,17 +91,28 @@ class Player(Character, metaclass=Singleton):
         return any(member.health > 0 for member in self.army)
 
     @property
-    def total_value(self) -> int:
-        army_value = sum(member.value for member in self.army)
-        exp_value = self.exp_available * XP_COST
-        upgrades_value = sum(sum(u.costs[: u.level]) for u in self.upgrades)
+    def army_value(self) -> int:
+        return sum(member.value for member in self.army)
 
+    @property
+    def exp_value(self) -> int:
+        return self.exp_available * XP_COST
+
+    @property
+    def upgrades_value(self) -> int:
+        return sum(sum(u.costs[: u.level]) for u in self.upgrades)
+
+    @property
+    def mines_value(self) -> int:
         unlocked_mines = sum(mine.cost for mine in self.mines_available)
         beaten_mines = int(
             sum(mine.win_value * math.pow(mine.cost, 1 / 3) for mine in self.mines_completed)
         )
+        return unlocked_mines + beaten_mines
 
-        return army_value + exp_value + upgrades_value + unlocked_mines + self.gold + beaten_mines
+    @property
+    def total_value(self) -> int:
+        return self.army_value + self.exp_value + self.upgrades_value + self.mines_value + self.gold
 
     def has_upgrade(self, upgrade_id):
         return upgrade_id in [upgrade.id for upgrade in self.upgrades]
@@ -85,9 +134,12 @@ class Player(Character, metaclass=Singleton):
         self.discovered_species = [SPECIES[CharacterSpecies.HUMAN.value]]
         self.completed_migrations = [1]
         self.species = SPECIES[CharacterSpecies.HUMAN.value]
+        for event in (GameEvent.XP, GameEvent.UPGRADES, GameEvent.MINES):
+            EventBus.publish(event)
 
     def add_ally(self, ally: Character):
         self._allies.append(ally)
+        EventBus.publish(GameEvent.ARMY)
 
     def fire_ally(self, ally: Character):
         self._fired_allies.append(ally)
@@ -95,19 +147,24 @@ class Player(Character, metaclass=Singleton):
 
     def move_ally_out(self, ally: Character):
         self._allies.remove(ally)
+        EventBus.publish(GameEvent.ARMY)
 
     def remove_ally(self, ally: Character):
         self._allies.remove(ally)
+        EventBus.publish(GameEvent.ARMY)
 
     def revive_ally(self, ally: Character):
         self._allies.append(ally)
+        EventBus.publish(GameEvent.ARMY)
 
     def add_available_xp(self, xp: int):
         self.exp_available += xp
+        EventBus.publish(GameEvent.XP)
 
     def remove_available_xp(self, xp: int):
         if xp > 0:
             self.exp_available -= xp
+            EventBus.publish(GameEvent.XP)
 
     def get_mine_progress(self, progress_name):
         progress = self.mine_progressions.get(progress_name)
@@ -6,6 +6,8 @@ from myning.objects.character import Character
 from myning.objects.object import Object
 from myning.objects.singleton import Singleton
 from myning.objects.upgrade import Upgrade
+from myning.utilities.clock import clock
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.fib import fibonacci
 from myning.utilities.file_manager import FileManager
 
@@ -31,6 +33,8 @@ class ResearchFacility(Object, metaclass=Singleton):
         self.last_research_tick = last_research_tick
         self._researchers = researchers or []
         self._research = research or []
+        # Macguffin research boost, applied to points accrued since `last_research_tick`
+        self.bonus = 1.0
 
         if len(self._researchers) > level:
             raise Exception("Too many researchers for this level")
@@ -43,7 +47,24 @@ class ResearchFacility(Object, metaclass=Singleton):
 
     @property
     def points(self):
-        return round(self._points, 2)
+        """Points are accrued lazily: `_points` holds what was earned up to `last_research_tick`
+        and everything since is computed when read"""
+        return round(self._points + self.pending_points(), 2)
+
+    def pending_points(self, now: datetime | None = None) -> float:
+        if not self.last_research_tick or not self._researchers:
+            return 0
+        now = now or clock.now()
+        mins_since_last_tick = (now - self.last_research_tick).total_seconds() / 60
+        tick_completion = mins_since_last_tick / self.minutes_per_tick
+        earned = self.points_per_researcher * len(self._researchers) * tick_completion
+        return earned * self.bonus
+
+    def materialize(self):
+        """Fold pending points into `_points`. Needed before anything that changes the rate."""
+        now = clock.now()
+        self._points += self.pending_points(now)
+        self.last_research_tick = now
 
     @property
     def research(self):
@@ -115,33 +136,36 @@ class ResearchFacility(Object, metaclass=Singleton):
         return ticks_per_hour * self.points_per_researcher * len(self._researchers) * bonus
 
     def check_in(self, bonus: float):
-        if not self.last_research_tick:
-            self.last_research_tick = datetime.now()
-            return
-
-        mins_since_last_tick = (datetime.now() - self.last_research_tick).total_seconds() / 60
-        tick_completion = mins_since_last_tick / self.minutes_per_tick
-
-        earned = self.points_per_researcher * len(self._researchers) * tick_completion
-        self._points += earned * bonus
-        self.last_research_tick = datetime.now()
+        """Start accruing points with the given bonus, collecting what was earned while away"""
+        self.bonus = bonus
+        earned = self.pending_points()
+        self.materialize()
+        if earned:
+            EventBus.publish(GameEvent.RESEARCH)
 
     def tick(self):
+        self.materialize()
         self._points += self.points_per_researcher * len(self._researchers)
-        self.last_research_tick = datetime.now()
+        EventBus.publish(GameEvent.RESEARCH)
 
     def level_up(self):
+        self.materialize()
         self.level += 1
+        EventBus.publish(GameEvent.RESEARCH)
 
     def add_researcher(self, researcher: Character):
+        self.materialize()
         self._researchers.append(researcher)
 
     def remove_researcher(self, researcher: Character):
+        self.materialize()
         self._researchers.remove(researcher)
 
     def purchase(self, cost):
         if cost > 0:
+            self.materialize()
             self._points -= cost
+            EventBus.publish(GameEvent.RESEARCH)
 
     def has_research(self, research_id):
         return research_id in [research.id for research in self._research]
@@ -33,6 +33,10 @@ class Singleton(type):
     def _instance(cls, instance):
         cls._instances[cls] = instance
 
+    @property
+    def initialized(cls) -> bool:
+        return cls in cls._instances
+
     @classmethod
     def reset(cls):
         cls._instances = {}
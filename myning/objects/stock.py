@@ -0,0 +1,87 @@
+from bisect import insort
+from datetime import datetime, timedelta
+from typing import Callable
+
+from myning.config import STORE_REFRESH_MINUTES
+from myning.objects.item import Item, ItemType
+from myning.objects.object import Object
+from myning.objects.plant import Plant
+from myning.utilities.clock import clock
+from myning.utilities.file_manager import FileManager
+
+SortKey = Callable[[Item], object]
+
+
+class Stock(Object):
+    """The items a store has for sale. Stock is kept between visits, with its items saved inline,
+    and is only generated again when it runs out, gets old or the store levels up. Items are kept
+    sorted by the key the store currently displays them by."""
+
+    # Stock of each store by name, loaded on the first visit
+    loaded: dict[str, "Stock"] = {}
+
+    @classmethod
+    def get(cls, name: str) -> "Stock":
+        if name not in cls.loaded:
+            cls.loaded[name] = FileManager.load(cls, f"{name}_stock") or cls(name)
+        return cls.loaded[name]
+
+    def __init__(self, name: str, level: int = 0, refreshed: datetime | None = None):
+        self.name = name
+        self.level = level
+        self.refreshed = refreshed
+        self.items: list[Item] = []
+        self.sort_key: SortKey | None = None
+
+    @property
+    def file_name(self):
+        return f"{self.name}_stock"
+
+    def is_stale(self, level: int):
+        return (
+            not self.items
+            or self.refreshed is None
+            or level != self.level
+            or clock.now() - self.refreshed > timedelta(minutes=STORE_REFRESH_MINUTES)
+        )
+
+    def restock(self, level: int):
+        self.items = []
+        self.level = level
+        self.refreshed = clock.now()
+
+    def sort(self, key: SortKey):
+        if key is not self.sort_key:
+            self.items.sort(key=key)
+            self.sort_key = key
+
+    def add(self, item: Item):
+        if self.sort_key:
+            insort(self.items, item, key=self.sort_key)
+        else:
+            self.items.append(item)
+
+    def remove(self, item: Item):
+        if item in self.items:
+            self.items.remove(item)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "level": self.level,
+            "refreshed": self.refreshed.isoformat() if self.refreshed else None,
+            "items": [item.to_dict() for item in self.items],
+        }
+
+    @classmethod
+    def from_dict(cls, dict: dict) -> "Stock":
+        stock = cls(
+            dict["name"],
+            dict["level"],
+            datetime.fromisoformat(dict["refreshed"]) if dict["refreshed"] else None,
+        )
+        stock.items = [
+            (Plant if item["type"] == ItemType.PLANT.value else Item).from_dict(item)
+            for item in dict["items"]
+        ]
+        return stock
@@ -1,10 +1,12 @@
+import math
 from collections import Counter
+from copy import copy
 
 from rich.table import Table
 
 from myning.config import LOST_RATIO, MINES
 from myning.objects.character import Character
-from myning.objects.item import Item, ItemType
+from myning.objects.item import Item
 from myning.objects.mine import Mine
 from myning.objects.object import Object
 from myning.objects.singleton import Singleton
@@ -24,7 +26,8 @@ class Trip(Object, metaclass=Singleton):
         self.clear()
 
     def clear(self):
-        self.minerals_mined: list[Item] = []
+        # Mineral stacks by id, stored inline rather than as item rows
+        self.minerals_mined: dict[str, Item] = {}
         self.items_found: list[Item] = []
         self.allies_gained: list[Character] = []
         self.allies_lost: list[Character] = []
@@ -40,14 +43,23 @@ class Trip(Object, metaclass=Singleton):
         self.boss_gold_bonus = 0
 
     def add_item(self, item: Item):
-        if item.type == ItemType.MINERAL:
-            self.minerals_mined.append(item)
+        if item.stackable:
+            if (stack := self.minerals_mined.get(item.id)) is not None:
+                stack.count += item.count
+            else:
+                self.minerals_mined[item.id] = copy(item)
         else:
             self.items_found.append(item)
 
-    def add_items(self, *items: Item):
+    def add_items(self, *items: Item) -> list[Item]:
+        """Add `items`, returning the ones that are saved as their own rows"""
         for item in items:
             self.add_item(item)
+        return [item for item in items if not item.stackable]
+
+    @property
+    def mineral_count(self) -> int:
+        return sum(stack.count for stack in self.minerals_mined.values())
 
     def add_ally(self, ally: Character):
         self.allies_gained.append(ally)
@@ -69,12 +81,22 @@ class Trip(Object, metaclass=Singleton):
         self.total_seconds = seconds
 
     def subtract_losses(self):
-        self.minerals_mined = self.subtract_loss(self.minerals_mined)
+        self.subtract_mineral_loss()
         self.items_found = self.subtract_loss(self.items_found)
         self.experience_gained = int(self.enemies_defeated / LOST_RATIO)
         self.allies_gained = [ally for i, ally in enumerate(self.allies_gained) if i % 2 == 0]
         self.total_seconds = self.total_seconds - self.seconds_left
 
+    def subtract_mineral_loss(self):
+        # Lose every LOST_RATIO-th mineral as if they were listed one by one
+        seen = 0
+        for id, stack in list(self.minerals_mined.items()):
+            lost = math.ceil((seen + stack.count) / LOST_RATIO) - math.ceil(seen / LOST_RATIO)
+            seen += stack.count
+            stack.count -= lost
+            if not stack.count:
+                del self.minerals_mined[id]
+
     def subtract_loss(self, arr: list):
         new = []
         for i, item in enumerate(arr):
@@ -84,7 +106,7 @@ class Trip(Object, metaclass=Singleton):
 
     def to_dict(self) -> dict:
         return {
-            "minerals_mined": [item.id for item in self.minerals_mined],
+            "minerals_mined": [stack.to_dict() for stack in self.minerals_mined.values()],
             "items_found": [item.id for item in self.items_found],
             "battles_won": self.battles_won,
             "enemies_defeated": self.enemies_defeated,
@@ -104,13 +126,14 @@ class Trip(Object, metaclass=Singleton):
     @classmethod
     def from_dict(cls, dict: dict) -> "Trip":
         summary = cls._create()
-        summary.minerals_mined = []
-
-        for item_id in dict["minerals_mined"]:
-            item = FileManager.load(Item, item_id, Subfolders.ITEMS)
-            if not item:
-                continue
-            summary.minerals_mined.append(item)
+        for mineral in dict["minerals_mined"]:
+            if isinstance(mineral, str):  # id of an unstacked mineral row
+                if item := FileManager.load(Item, mineral, Subfolders.ITEMS):
+                    item.id = item.stack_id
+            else:
+                item = Item.from_dict(mineral)
+            if item:
+                summary.add_item(item)
 
         summary.items_found = [
             item
@@ -139,7 +162,7 @@ class Trip(Object, metaclass=Singleton):
         table.add_column(justify="right")
         table.add_row(Icons.VICTORY, "Battles won:", str(self.battles_won))
         table.add_row(Icons.SWORD, "Enemies defeated:", str(self.enemies_defeated))
-        table.add_row(Icons.MINERAL, "Minerals mined:", str(len(self.minerals_mined)))
+        table.add_row(Icons.MINERAL, "Minerals mined:", str(self.mineral_count))
         if self.boss_gold_bonus:
             table.add_row(Icons.GOLD, "Boss bounty:", f"[bold]{self.boss_gold_bonus:,}g[/]")
         return table
@@ -147,7 +170,9 @@ class Trip(Object, metaclass=Singleton):
     @property
     def table(self):
         table = Table.grid(padding=(0, 1, 0, 0))
-        mineral_counts = Counter([item.main_affect for item in self.minerals_mined])
+        mineral_counts = Counter()
+        for stack in self.minerals_mined.values():
+            mineral_counts[stack.main_affect] += stack.count
         minerals_str = "\n".join(
             [
                 f"{Icons.MINERAL} {Colors.GOLD(level)} ({mineral_counts[level]})"
@@ -10,6 +10,7 @@ from myning.tui.chapter import ChapterWidget
 from myning.tui.currency import CurrencyWidget
 from myning.tui.header import Header
 from myning.tui.inventory import InventoryWidget
+from myning.tui.profiler import ProfilerOverlay
 from myning.utilities.formatter import Formatter
 
 
@@ -30,11 +31,13 @@ class MyningScreen(Screen):
     BINDINGS = [
         Binding("f1", "help", "Help", priority=True),
         Binding("f2", "toggle_sidebar", "Toggle Sidebar", priority=True),
+        Binding("f3", "toggle_profiler", "Toggle Profiler", priority=True, show=False),
     ]
 
     def compose(self):
         yield Header()
         yield Body()
+        yield ProfilerOverlay()
         yield Footer()
 
     async def on_key(self, event: events.Key):
@@ -63,6 +66,9 @@ class MyningScreen(Screen):
         if sidebar.display:
             self.query_one(ChapterWidget).update_dashboard()
 
+    def action_toggle_profiler(self):
+        self.query_one(ProfilerOverlay).toggle()
+
     def action_help(self) -> None:
         """Action to display the help dialog."""
         self.app.push_screen(HelpScreen())
@@ -1,17 +1,56 @@
-from textual.widgets import DataTable
+import textwrap
+from typing import NamedTuple
 
+from myning.objects.character import Character
 from myning.objects.player import Player
 from myning.objects.settings import Settings
+from myning.tui.keyed_table import KeyedTable
 from myning.utilities.file_manager import FileManager
-from myning.utilities.ui import Colors, Icons
+from myning.utilities.profiler import profiled
+from myning.utilities.ui import Colors, Icons, get_health_bar
 
 player = Player()
 settings = Settings()
 
 
-class ArmyWidget(DataTable):
+class MemberRow(NamedTuple):
+    icon: str
+    name: str
+    health: int
+    max_health: int
+    damage: int
+    armor: int
+    level: int
+    experience: int
+    is_ghost: bool
+
+    @classmethod
+    def of(cls, member: Character):
+        stats = member.stats
+        return cls(
+            member.icon,
+            member.name,
+            member.health,
+            member.max_health,
+            stats["damage"],
+            stats["armor"],
+            member.level,
+            member.experience,
+            member.is_ghost,
+        )
+
+
+class ArmyWidget(KeyedTable):
     BINDINGS = [("c", "compact", "Toggle Compact Mode")]
-    hash = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.members: dict[str, MemberRow] = {}
+        self.compact_mode: bool | None = None
+        self.current_health = 0
+        self.total_health = 0
+        self.total_damage = 0
+        self.total_armor = 0
 
     def on_mount(self):
         self.border_title = "Army"
@@ -25,33 +64,62 @@ class ArmyWidget(DataTable):
         FileManager.save(settings)
         self.update()
 
+    @profiled
     def update(self):
-        army_hash = hash((player.army, settings.compact_mode))
-        if self.hash == army_hash:
+        army = {member.id: member for member in player.army}
+        members = {id: MemberRow.of(member) for id, member in army.items()}
+        if self.compact_mode == settings.compact_mode and list(members.items()) == list(
+            self.members.items()
+        ):
             return
-        self.hash = army_hash
-        self.clear(columns=True)
-        if settings.compact_mode:
+        self._update_totals(members)
+
+        if self.compact_mode != settings.compact_mode:
+            self.compact_mode = settings.compact_mode
+            self.clear(columns=True)
+            if self.compact_mode:
+                self.show_header = False
+                self.add_column("")
+            else:
+                self.show_header = True
+                self.add_columns(*player.army_column_titles)
+
+        if self.compact_mode:
             self.compact()
         else:
-            self.full()
+            self.sync_rows(members, lambda id: army[id].army_arr)
+            self.border_subtitle = (
+                f"{len(members)} members "
+                f"{Icons.HEART}  [green1]{self.current_health}[/]/"
+                f"[green1]{self.total_health}[/] "
+                f"{Icons.DAMAGE} {Colors.WEAPON(self.total_damage)} "
+                f"{Icons.ARMOR} {Colors.ARMOR(self.total_armor)}"
+            )
+
+    def _update_totals(self, members: dict[str, MemberRow]):
+        for id, row in self.members.items():
+            if members.get(id) != row:
+                self._add_to_totals(row, -1)
+        for id, row in members.items():
+            if self.members.get(id) != row:
+                self._add_to_totals(row, 1)
+        self.members = members
+
+    def _add_to_totals(self, row: MemberRow, sign: int):
+        self.current_health += sign * row.health
+        self.total_health += sign * row.max_health
+        self.total_damage += sign * row.damage
+        self.total_armor += sign * row.armor
 
     def compact(self):
-        self.show_header = False
-        self.border_subtitle = f"{len(player.army)} members "
-        self.add_column("")
-        self.add_row(player.army.icons, height=len(player.army.icons.splitlines()))
-        self.add_row("\n" + player.army.health_bar + "\n", height=3)
-        self.add_row(player.army.stats_str)
-
-    def full(self):
-        self.show_header = True
-        self.border_subtitle = (
-            f"{len(player.army)} members "
-            f"{Icons.HEART}  [green1]{player.army.current_health}[/]/"
-            f"[green1]{player.army.total_health}[/] "
-            f"{Icons.DAMAGE} {Colors.WEAPON(player.army.total_damage)} "
-            f"{Icons.ARMOR} {Colors.ARMOR(player.army.total_armor)}"
+        self.clear()
+        self.border_subtitle = f"{len(self.members)} members "
+        icons = textwrap.fill(" ".join(row.icon for row in self.members.values()), width=2 * 15)
+        health_bar = get_health_bar(self.current_health, self.total_health, 30)
+        stats_str = (
+            f"{Icons.DAMAGE} {Colors.WEAPON(self.total_damage)} "
+            f"{Icons.ARMOR} {Colors.ARMOR(self.total_armor)}"
         )
-        self.add_columns(*player.army_column_titles)
-        self.add_rows(member.army_arr for member in player.army)
+        self.add_row(icons, height=len(icons.splitlines()))
+        self.add_row("\n" + health_bar + "\n", height=3)
+        self.add_row(stats_str)
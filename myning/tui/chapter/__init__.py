@@ -1,7 +1,7 @@
 import string
+from functools import partial
 from typing import Protocol, runtime_checkable
 
-from rich.console import Console
 from rich.text import Text
 from textual import events
 from textual.containers import ScrollableContainer
@@ -12,25 +12,29 @@ from myning.chapters import (
     DynamicArgs,
     ExitArgs,
     Handler,
+    LazyOptionLabel,
     Option,
+    OptionLabel,
     PickArgs,
     main_menu,
-    mine,
     tutorial,
 )
-from myning.chapters.mine.screen import MineScreen
 from myning.objects.player import Player
 from myning.objects.trip import Trip
 from myning.tui.army import ArmyWidget
-from myning.tui.chapter.option_table import OptionTable
+from myning.tui.chapter.option_table import (
+    LazyOptionRow,
+    OptionRow,
+    VirtualOptionTable,
+    get_cell_width,
+)
 from myning.tui.chapter.question import Question
-from myning.tui.currency import CurrencyWidget
 from myning.tui.inventory import InventoryWidget
+from myning.utilities.profiler import profiler
 from myning.utilities.tab_title import TabTitle
 
 player = Player()
 trip = Trip()
-measurement_console = Console(width=80)
 
 
 @runtime_checkable
@@ -64,23 +68,12 @@ def _find_key_handler(widget: "ChapterWidget") -> ChapterKeyHandler | None:
     return None
 
 
-def _get_cell_width(cell) -> int:
-    if isinstance(cell, str):
-        return Text.from_markup(cell).cell_len
-    if isinstance(cell, Text):
-        return cell.cell_len
-    try:
-        return measurement_console.measure(cell, options=measurement_console.options).maximum
-    except Exception:  # pragma: no cover - defensive fallback for unknown renderables
-        return len(str(cell))
-
-
 class ChapterWidget(ScrollableContainer):
     can_focus = True
 
     def __init__(self):
         self.question = Question()
-        self.option_table = OptionTable()
+        self.option_table = VirtualOptionTable()
         self.handlers: list[Handler] = []
         self.hotkeys: dict[str, int] = {}
         self.hotkey_aliases: dict[str, str] = dict(_BASE_HOTKEY_ALIASES)
@@ -94,6 +87,11 @@ class ChapterWidget(ScrollableContainer):
 
     async def on_mount(self):
         if trip.mine and trip.seconds_left != 0:
+            # Only needed to resume a trip, importing the mine chapter up front slows startup
+            # pylint: disable=import-outside-toplevel
+            from myning.chapters import mine
+            from myning.chapters.mine.screen import MineScreen
+
             self.update_dashboard()
             self.app.push_screen(
                 MineScreen(),
@@ -138,9 +136,10 @@ class ChapterWidget(ScrollableContainer):
         await self.select(row.cursor_row)
 
     def update_dashboard(self):
+        # Currency re-renders itself from EventBus events. Plants in the inventory expire without
+        # an event, so it is refreshed on every pick too, which only touches the rows that changed.
         self.screen.query_one(ArmyWidget).update()
-        self.screen.query_one(CurrencyWidget).refresh()
-        self.screen.query_one(InventoryWidget).update()
+        self.screen.query_one(InventoryWidget).schedule_update()
 
     def _sync_hotkey_overrides(self):
         """Add/remove hotkey aliases based on whether a ChapterKeyHandler is mounted."""
@@ -163,14 +162,20 @@ class ChapterWidget(ScrollableContainer):
         options, hotkeys = get_labels_and_hotkeys(args.options, self.reserved_hotkeys)
         self.option_table.clear(columns=True)
         if options:
-            column_count = max(len(option) for option in options)
+            # Lazy rows are measured by the table once they scroll into view
+            built = [option for option in options if not callable(option)] or [[""]]
+            column_count = max(len(option) for option in built)
+            if args.column_titles:
+                column_count = max(column_count, len(args.column_titles))
             column_widths = [0] * column_count
             for col_idx in range(column_count):
                 if args.column_titles and col_idx < len(args.column_titles):
-                    column_widths[col_idx] = _get_cell_width(args.column_titles[col_idx])
-                for option in options:
+                    column_widths[col_idx] = get_cell_width(args.column_titles[col_idx])
+                for option in built:
                     if col_idx < len(option):
-                        column_widths[col_idx] = max(column_widths[col_idx], _get_cell_width(option[col_idx]))
+                        column_widths[col_idx] = max(
+                            column_widths[col_idx], get_cell_width(option[col_idx])
+                        )
 
             if args.column_titles:
                 self.option_table.show_header = True
@@ -182,7 +187,7 @@ class ChapterWidget(ScrollableContainer):
                 self.option_table.show_header = False
                 for col_idx in range(column_count):
                     self.option_table.add_column(str(col_idx), width=max(column_widths[col_idx], 1))
-            self.option_table.add_rows(options)
+            self.option_table.add_option_rows(options)
             self.option_table.move_cursor(row=0, column=0, scroll=False)
         self.option_table.scroll_home(animate=False, force=True, immediate=True)
         self.hotkeys = hotkeys
@@ -192,7 +197,8 @@ class ChapterWidget(ScrollableContainer):
         if not self.handlers or option_index >= len(self.handlers):
             return
         handler = self.handlers[option_index]
-        args = handler()
+        with profiler.timed(get_handler_name(handler)):
+            args = handler()
         if isinstance(args, ExitArgs):
             self.app.exit()
         elif isinstance(args, DynamicArgs):
@@ -212,18 +218,38 @@ class ChapterWidget(ScrollableContainer):
         self.pick(PickArgs(message="", options=[]))
 
 
+def get_handler_name(handler: Handler) -> str:
+    func = handler.func if isinstance(handler, partial) else handler
+    module = getattr(func, "__module__", "").rpartition(".")[-1]
+    return f"{module}.{getattr(func, '__qualname__', type(func).__name__)}"
+
+
+def build_label(label: OptionLabel | LazyOptionLabel) -> list[str | Text]:
+    if callable(label):
+        label = label()
+    return list(label) if isinstance(label, list) else [label]
+
+
 def get_labels_and_hotkeys(
     options: list[Option], reserved_hotkeys: set[str]
-) -> tuple[list[list[str | Text]], dict[str, int]]:
+) -> tuple[list[OptionRow | LazyOptionRow], dict[str, int]]:
     hotkeys: dict[str, int] = {}
-    labels: list[list[str | Text]] = []
+    labels: list[OptionRow | LazyOptionRow] = []
+    free_hotkeys = len(set(string.ascii_lowercase) - reserved_hotkeys)
     # The last Option is always assumed to be back or continue, so it defaults to no hotkey
     last_index = len(options) - 1
     for option_index, option in enumerate(options):
-        label: list[str | Text] = option.label if isinstance(option.label, list) else [option.label]
+        no_hotkey = (
+            not option.enable_hotkeys or option_index == last_index or len(hotkeys) == free_hotkeys
+        )
+        # Lazy labels only need to be built here if they could still claim a hotkey
+        if no_hotkey and callable(option.label):
+            labels.append(partial(build_label, option.label))
+            continue
 
-        if not option.enable_hotkeys or option_index == last_index:
-            labels.append(list(label))
+        label = build_label(option.label)
+        if no_hotkey:
+            labels.append(label)
             continue
 
         text_option_index = None
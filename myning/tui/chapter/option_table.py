@@ -1,5 +1,29 @@
+from itertools import zip_longest
+from typing import Callable, Iterable
+
+from rich.console import Console
+from rich.text import Text
 from textual.coordinate import Coordinate
+from textual.geometry import Region
+from textual.strip import Strip
 from textual.widgets import DataTable
+from textual.widgets.data_table import CellType, Row, RowKey
+
+measurement_console = Console(width=80)
+
+OptionRow = list[CellType]
+LazyOptionRow = Callable[[], OptionRow]
+
+
+def get_cell_width(cell) -> int:
+    if isinstance(cell, str):
+        return Text.from_markup(cell).cell_len
+    if isinstance(cell, Text):
+        return cell.cell_len
+    try:
+        return measurement_console.measure(cell, options=measurement_console.options).maximum
+    except Exception:  # pragma: no cover - defensive fallback for unknown renderables
+        return len(str(cell))
 
 
 class OptionTable(DataTable):
@@ -85,3 +109,102 @@ class OptionTable(DataTable):
             super().action_cursor_right()
         else:
             self.move_cursor(column=0)
+
+
+class VirtualOptionTable(OptionTable):
+    """An OptionTable that accepts rows as callables and only builds them when needed.
+
+    Lazy rows are materialized once they come within ``MARGIN`` rows of the visible window (or
+    when read with ``get_row``). Columns are widened, or added, as wider rows materialize.
+    """
+
+    MARGIN = 50
+
+    def __init__(self):
+        super().__init__()
+        self._lazy_rows: dict[RowKey, LazyOptionRow] = {}
+
+    def clear(self, columns: bool = False):
+        self._lazy_rows.clear()
+        return super().clear(columns)
+
+    def add_option_rows(self, rows: Iterable[OptionRow | LazyOptionRow]):
+        """Add rows at the bottom of the table; callables are kept unbuilt until displayed."""
+        lazy_rows: list[LazyOptionRow] = []
+        for row in rows:
+            if callable(row):
+                lazy_rows.append(row)
+                continue
+            if lazy_rows:
+                self._add_lazy_rows(lazy_rows)
+                lazy_rows = []
+            self.add_row(*row)
+        if lazy_rows:
+            self._add_lazy_rows(lazy_rows)
+        # Build the first screen up front so the initial column widths already fit it
+        if self._materialize_window():
+            self._clear_caches()
+
+    # NOTE: the methods below touch private DataTable state (tested against Textual 8.0.0).
+    # `add_row` costs ~20µs per call, which adds up to seconds for tens of thousands of rows.
+    def _add_lazy_rows(self, factories: list[LazyOptionRow]):
+        for factory in factories:
+            row_key = RowKey()
+            self._row_locations[row_key] = len(self.rows)
+            self._data[row_key] = {column.key: None for column in self.ordered_columns}
+            self.rows[row_key] = Row(row_key, 1)
+            self._lazy_rows[row_key] = factory
+        self._require_update_dimensions = True
+        self._update_count += 1
+        self.cursor_coordinate = self.cursor_coordinate
+        self.check_idle()
+
+    def _materialize(self, start: int, end: int) -> bool:
+        """Build lazy rows in [start, end). Returns True if the column layout changed."""
+        resized = False
+        for row_index in range(max(start, 0), min(end, self.row_count)):
+            row_key = self._row_locations.get_key(row_index)
+            factory = self._lazy_rows.pop(row_key, None)
+            if factory is None:
+                continue
+            cells = factory()
+            while len(cells) > len(self.columns):
+                column_key = self.add_column("", width=1)
+                # Fixed width columns don't need the backfilled cells measured on idle, which would
+                # rescan the whole column for every row
+                self._updated_cells = {
+                    cell for cell in self._updated_cells if cell.column_key != column_key
+                }
+                resized = True
+            for column, cell in zip(self.ordered_columns, cells):
+                if (width := get_cell_width(cell)) > column.width:
+                    column.width = width
+                    resized = True
+            self._data[row_key] = {
+                column.key: cell for column, cell in zip_longest(self.ordered_columns, cells)
+            }
+        return resized
+
+    def get_row(self, row_key: RowKey | str):
+        if row_key in self._lazy_rows:
+            row_index = self._row_locations.get(row_key)
+            if row_index is not None and self._materialize(row_index, row_index + 1):
+                self._clear_caches()
+                self._require_update_dimensions = True
+                self.check_idle()
+        return super().get_row(row_key)
+
+    def _update_dimensions(self, new_rows: Iterable[RowKey]):
+        super()._update_dimensions(key for key in new_rows if key not in self._lazy_rows)
+
+    def _materialize_window(self) -> bool:
+        if not self._lazy_rows:
+            return False
+        top = int(self.scroll_y)
+        return self._materialize(top - self.MARGIN, top + self.size.height + self.MARGIN)
+
+    def render_lines(self, crop: Region) -> list[Strip]:
+        if self._materialize_window():
+            self._clear_caches()
+            self._update_dimensions(())
+        return super().render_lines(crop)
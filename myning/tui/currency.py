@@ -6,8 +6,9 @@ from myning.objects.graveyard import Graveyard
 from myning.objects.macguffin import Macguffin
 from myning.objects.player import Player
 from myning.objects.research_facility import ResearchFacility
-from myning.utilities.file_manager import FileManager
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.formatter import Formatter
+from myning.utilities.profiler import profiled
 from myning.utilities.ui import Colors, Icons
 
 player = Player()
@@ -17,6 +18,7 @@ facility = ResearchFacility()
 
 
 class CurrencyWidget(Static):
+    @profiled
     def render(self):
         table = Table.grid(padding=(0, 1, 0, 0))
         table.add_column()
@@ -68,11 +70,20 @@ class CurrencyWidget(Static):
 
         return table
 
+    EVENTS = (GameEvent.GOLD, GameEvent.SOUL_CREDITS, GameEvent.RESEARCH, GameEvent.MINES)
+
     def on_mount(self):
         self.border_title = "Currency"
-        self.set_interval(1, self.check_in)
-
-    def check_in(self):
         facility.check_in(macguffin.research_boost)
-        FileManager.save(facility)
-        self.refresh()
+        self.research_points = facility.points
+        self.set_interval(1, self.check_research_points)
+        EventBus.subscribe(self.refresh, *self.EVENTS)
+
+    def on_unmount(self):
+        EventBus.unsubscribe(self.refresh, *self.EVENTS)
+
+    def check_research_points(self):
+        # Research points accrue continuously, only re-render when the shown value changes
+        if facility.points != self.research_points:
+            self.research_points = facility.points
+            self.refresh()
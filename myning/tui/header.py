@@ -1,11 +1,11 @@
-from datetime import datetime
-
 from textual.widgets import Static
 
+from myning.utilities.clock import clock
+
 
 class HeaderClock(Static):
     def render(self):
-        return datetime.now().strftime("%X")
+        return clock.now().strftime("%X")
 
     def on_mount(self) -> None:
         self.set_interval(1, self.refresh)
@@ -1,34 +1,49 @@
-from textual.widgets import DataTable
-
 from myning.objects.inventory import Inventory
 from myning.objects.player import Player
+from myning.tui.keyed_table import KeyedTable
+from myning.utilities.event_bus import EventBus, GameEvent
 from myning.utilities.formatter import Formatter
+from myning.utilities.profiler import profiled
 
 player = Player()
 inventory = Inventory()
 
 
-class InventoryWidget(DataTable):
-    hash = None
+class InventoryWidget(KeyedTable):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.update_scheduled = False
 
     def on_mount(self):
         self.show_cursor = False
         self.show_header = False
+        self.border_title = "Inventory"
         self.add_column("i")
         self.add_column("n", width=32)
         self.add_column("v")
+        self.update()
+        EventBus.subscribe(self.schedule_update, GameEvent.INVENTORY)
+
+    def on_unmount(self):
+        EventBus.unsubscribe(self.schedule_update, GameEvent.INVENTORY)
+
+    def schedule_update(self):
+        # Coalesce a burst of inventory changes into a single update
+        if not self.update_scheduled:
+            self.update_scheduled = True
+            self.call_later(self.update)
 
     def on_click(self):
         self.focus()
 
+    @profiled
     def update(self):
-        inventory_hash = hash(tuple(inventory.items))
-        if self.hash == inventory_hash:
-            return
-        self.hash = inventory_hash
-        self.border_title = "Inventory"
+        self.update_scheduled = False
+        items = {item.id: item for item in inventory.iter_items()}
+        # Items change in place: seeds are renamed when planted, icons turn when plants expire and
+        # mineral stacks grow
+        signatures = {id: (item.icon, item.name, item.count) for id, item in items.items()}
+        self.sync_rows(signatures, lambda id: items[id].arr)
         self.border_subtitle = (
-            f"{len(inventory.items)} items ({Formatter.gold(inventory.total_value)})"
+            f"{inventory.item_count} items ({Formatter.gold(inventory.total_value)})"
         )
-        self.clear()
-        self.add_rows(item.arr for item in inventory.items)
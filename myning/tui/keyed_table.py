@@ -0,0 +1,69 @@
+from typing import Callable, Hashable, Sequence
+
+from textual._two_way_dict import TwoWayDict
+from textual.widgets import DataTable
+from textual.widgets.data_table import CellKey, RowKey
+
+RowBuilder = Callable[[str], Sequence]
+
+
+class KeyedTable(DataTable):
+    """A DataTable whose rows are keyed (e.g. by item or character id) so that syncing it only
+    touches the rows that were added, removed or changed since the last sync."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.signatures: dict[str, Hashable] = {}
+
+    def clear(self, columns: bool = False):
+        self.signatures = {}
+        return super().clear(columns)
+
+    def sync_rows(self, signatures: dict[str, Hashable], build_row: RowBuilder):
+        """Make the table show one row per key of `signatures`, in that order.
+
+        `build_row` is only called for keys that are new or whose signature changed. Returns the
+        keys that were added, removed and updated.
+        """
+        added = [key for key in signatures if key not in self.signatures]
+        removed = [key for key in self.signatures if key not in signatures]
+        updated = [
+            key
+            for key, signature in signatures.items()
+            if key in self.signatures and self.signatures[key] != signature
+        ]
+
+        if removed:
+            self._remove_rows(removed)
+        for key in updated:
+            for column_key, cell in zip(self.columns, build_row(key)):
+                self.update_cell(key, column_key, cell)
+        for key in added:
+            self.add_row(*build_row(key), key=key)
+
+        self._reorder_rows(list(signatures))
+        self.signatures = dict(signatures)
+        return added, removed, updated
+
+    # NOTE: the methods below touch private DataTable state (tested against Textual 8.0.0).
+    # `remove_row` rebuilds every row location, which is quadratic when removing many rows.
+    def _remove_rows(self, keys: list[str]):
+        for key in keys:
+            row_key = RowKey(key)
+            for column_key in self._data[row_key]:
+                self._updated_cells.discard(CellKey(row_key, column_key))
+            del self.rows[row_key]
+            del self._data[row_key]
+        removed = set(keys)
+        self._reorder_rows([key for key in self.signatures if key not in removed])
+        self.cursor_coordinate = self.cursor_coordinate
+        self.hover_coordinate = self.hover_coordinate
+        self._require_update_dimensions = True
+        self.check_idle()
+
+    def _reorder_rows(self, keys: list[str]):
+        if [key.value for key in self._row_locations] == keys:
+            return
+        self._row_locations = TwoWayDict({RowKey(key): index for index, key in enumerate(keys)})
+        self._update_count += 1
+        self.refresh(layout=True)
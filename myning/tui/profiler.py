@@ -0,0 +1,38 @@
+from rich.table import Table
+from rich.text import Text
+from textual.widgets import Static
+
+from myning.utilities.profiler import WINDOW, profiler
+
+
+def ms(seconds: float):
+    return Text(f"{seconds * 1000:.1f}", justify="right")
+
+
+class ProfilerOverlay(Static):
+    def on_mount(self):
+        self.border_title = "Profiler"
+        self.border_subtitle = f"ms over last {WINDOW} calls"
+        self.display = profiler.enabled
+        self.set_interval(1, self.refresh)
+
+    def render(self):
+        table = Table.grid(padding=(0, 1, 0, 0))
+        table.add_row(
+            *(Text(title, justify="right") for title in ("", "calls", "p50", "p95", "max"))
+        )
+        for name, calls, p50, p95, max_ in profiler.summary():
+            table.add_row(name, Text(str(calls), justify="right"), ms(p50), ms(p95), ms(max_))
+        return table
+
+    def toggle(self):
+        profiler.enabled = not profiler.enabled
+        self.display = profiler.enabled
+        if profiler.enabled:
+            profiler.reset()
+        elif profiler.tracing:
+            self.notify(f"Profile written to {profiler.dump()}")
+
+    def on_unmount(self):
+        if profiler.enabled and profiler.tracing:
+            profiler.dump()
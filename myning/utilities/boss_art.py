@@ -1,7 +1,5 @@
 from functools import lru_cache
 
-from chafa import Canvas, CanvasConfig, PixelType
-from PIL import Image
 from rich.text import Text
 
 from myning.objects.mine import BossConfig
@@ -9,6 +7,11 @@ from myning.objects.mine import BossConfig
 
 @lru_cache(maxsize=16)
 def render_boss_art(boss_config: BossConfig) -> Text:
+    # chafa and PIL are slow to import and only needed once a boss shows up
+    # pylint: disable=import-outside-toplevel
+    from chafa import Canvas, CanvasConfig, PixelType
+    from PIL import Image
+
     config = CanvasConfig()
     image = Image.open(f"./{boss_config.image}").convert("RGB")
     config.width = 120
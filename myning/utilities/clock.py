@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from typing import Protocol
+
+
+class ClockSource(Protocol):
+    """Something that changes at known times, e.g. plants reaching their next growth stage"""
+
+    def next_due(self) -> datetime | None: ...
+
+    def catch_up(self): ...
+
+
+class GameClock:
+    """The time everything in the game grows, accrues and expires by.
+
+    It follows the system clock but never goes backwards, and can be fast-forwarded: the offset
+    is saved with the game so that skipped time stays skipped. Tests can freeze it.
+    """
+
+    def __init__(self):
+        self.offset = timedelta()
+        self.frozen: datetime | None = None
+        self.last = datetime.min
+        self.sources: list[ClockSource] = []
+
+    def now(self) -> datetime:
+        if self.frozen is not None:
+            return self.frozen
+        self.last = max(self.last, datetime.now() + self.offset)
+        return self.last
+
+    def timestamp(self) -> float:
+        return self.now().timestamp()
+
+    def register(self, source: ClockSource):
+        if source not in self.sources:
+            self.sources.append(source)
+
+    def unregister(self, source: ClockSource):
+        if source in self.sources:
+            self.sources.remove(source)
+
+    def catch_up(self):
+        """Process everything that became due up to now"""
+        self.advance(timedelta())
+
+    def advance(self, delta: timedelta):
+        """Move the clock `delta` ahead, processing the sources in the order their events fall due,
+        with the clock set to each event's time while it is processed"""
+        target = self.now() + delta
+        stalled: set[int] = set()
+        while True:
+            due = [
+                (when, index)
+                for index, source in enumerate(self.sources)
+                if index not in stalled
+                and (when := source.next_due()) is not None
+                and when <= target
+            ]
+            if not due:
+                break
+            when, index = min(due)
+            self._set(max(when, self.now()))
+            self.sources[index].catch_up()
+            # A source that is still due at the same time would never let the loop finish
+            if (after := self.sources[index].next_due()) is not None and after <= when:
+                stalled.add(index)
+        self._set(target)
+
+    def _set(self, when: datetime):
+        if self.frozen is not None:
+            self.frozen = when
+        # Real time keeps going while sources catch up, only ever move the offset forwards
+        elif (ahead := when - self.now()) > timedelta():
+            self.offset += ahead
+            self.last = when
+
+    def freeze(self, when: datetime | None = None):
+        self.frozen = when or self.now()
+
+    def reset(self):
+        self.offset = timedelta()
+        self.frozen = None
+        self.last = datetime.min
+
+    def to_dict(self) -> dict:
+        return {"offset": self.offset.total_seconds()}
+
+    def load(self, data: dict | None):
+        self.offset = timedelta(seconds=(data or {}).get("offset", 0))
+
+
+clock = GameClock()
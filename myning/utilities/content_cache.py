@@ -0,0 +1,88 @@
+"""Parsed YAML content files, cached between runs.
+
+Parsing the content YAML is most of the time it takes to import `myning.config`, so the parsed
+files are pickled into a bundle next to the bytecode cache. A file is only parsed again when its
+contents changed: mtimes and sizes are checked first, and files whose stamp changed are hashed so
+that touching a file (e.g. a git checkout) doesn't throw its parsed content away.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+BUNDLE_VERSION = 1
+
+
+def stamp(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def parse(path: Path) -> Any:
+    # Only imported on a cache miss
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    # libyaml's loader is much faster, but PyYAML can be installed without it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def read_bundle(path: Path) -> dict:
+    try:
+        with open(path, "rb") as f:
+            bundle = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return {}
+    if not isinstance(bundle, dict) or bundle.get("version") != BUNDLE_VERSION:
+        return {}
+    return bundle
+
+
+def write_bundle(path: Path, bundle: dict):
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary, "wb") as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+    except OSError:
+        # Read-only installs just parse every time
+        temporary.unlink(missing_ok=True)
+
+
+def load_content(directory: Path, filenames: list[str], cache_path: Path) -> dict[str, Any]:
+    """The parsed contents of `filenames` in `directory`, by file name"""
+    stamps = {name: stamp(directory / name) for name in filenames}
+    bundle = read_bundle(cache_path)
+    cached_stamps = bundle.get("stamps", {})
+    if cached_stamps == stamps:
+        return bundle["content"]
+
+    cached_digests = bundle.get("digests", {})
+    cached_content = bundle.get("content", {})
+    digests = {}
+    content = {}
+    for name in filenames:
+        path = directory / name
+        if cached_stamps.get(name) == stamps[name]:
+            digests[name] = cached_digests[name]
+            content[name] = cached_content[name]
+            continue
+        digests[name] = digest(path)
+        if cached_digests.get(name) == digests[name]:
+            content[name] = cached_content[name]
+        else:
+            content[name] = parse(path)
+
+    write_bundle(
+        cache_path,
+        {"version": BUNDLE_VERSION, "stamps": stamps, "digests": digests, "content": content},
+    )
+    return content
@@ -0,0 +1,49 @@
+from collections import defaultdict
+from enum import Enum
+from typing import Callable
+
+Subscriber = Callable[[], None]
+
+
+class GameEvent(str, Enum):
+    GOLD = "gold"
+    SOUL_CREDITS = "soul_credits"
+    RESEARCH = "research"
+    MINES = "mines"
+    INVENTORY = "inventory"
+    GARDEN = "garden"
+    ARMY = "army"
+    XP = "xp"
+    UPGRADES = "upgrades"
+
+
+class EventBus:
+    """Synchronous publish/subscribe for game state changes. Objects publish after they mutate and
+    widgets subscribe to re-render only when something they show has changed.
+
+    Every event also has a version that goes up each time it is published, for caches that check
+    whether anything changed when they are read instead of subscribing."""
+
+    _subscribers: defaultdict[GameEvent, list[Subscriber]] = defaultdict(list)
+    _versions: defaultdict[GameEvent, int] = defaultdict(int)
+
+    @classmethod
+    def subscribe(cls, subscriber: Subscriber, *events: GameEvent):
+        for event in events:
+            cls._subscribers[event].append(subscriber)
+
+    @classmethod
+    def unsubscribe(cls, subscriber: Subscriber, *events: GameEvent):
+        for event in events:
+            if subscriber in cls._subscribers[event]:
+                cls._subscribers[event].remove(subscriber)
+
+    @classmethod
+    def publish(cls, event: GameEvent):
+        cls._versions[event] += 1
+        for subscriber in list(cls._subscribers.get(event, ())):
+            subscriber()
+
+    @classmethod
+    def versions(cls, *events: GameEvent) -> tuple[int, ...]:
+        return tuple(cls._versions[event] for event in events)
@@ -1,28 +1,41 @@
+from bisect import bisect_right
+
+# _sequence[n - 1] is fibonacci(n) and _sums[n] is fibonacci_sum(n). Both grow on demand so every
+# lookup after the first one for a level is O(1).
+_sequence = [0, 1, 3, 5]
+_sums = [0, 0, 1, 4, 9]
+
+
+def _grow(n: int):
+    while len(_sequence) < n:
+        _sequence.append(_sequence[-1] + _sequence[-2])
+        _sums.append(_sums[-1] + _sequence[-1])
+
+
 def fibonacci(n: int) -> int:
-    match n:
-        case 1:
-            return 0
-        case 2:
-            return 1
-        case 3:
-            return 3
-        case 4:
-            return 5
-    a, b = 3, 5
-    for _ in range(n - 4):
-        a, b = b, a + b
-    return b
+    if n < 1:
+        return 5
+    _grow(n)
+    return _sequence[n - 1]
 
 
 def fibonacci_sum(n: int) -> int:
     if n <= 0:
         return 0
-    base = [0, 1, 3, 5]
-    total = sum(base[:n])
-    if n <= 4:
-        return total
-    a, b = 3, 5
-    for _ in range(n - 4):
-        a, b = b, a + b
-        total += b
-    return total
+    _grow(n)
+    return _sums[n]
+
+
+def fibonacci_sum_inverse(total: int) -> int:
+    """The largest n for which fibonacci_sum(n) <= total"""
+    if total < 0:
+        return 0
+    while _sums[-1] <= total:
+        _grow(len(_sequence) + 1)
+    return bisect_right(_sums, total) - 1
+
+
+def highest_level(level: int, xp: int) -> int:
+    """The highest level affordable from `level` with `xp`, where going from level n to n + 1 costs
+    fibonacci(n + 1)"""
+    return max(level, fibonacci_sum_inverse(fibonacci_sum(level) + xp))
@@ -2,6 +2,8 @@ import json
 import os
 import shutil
 import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
@@ -16,6 +18,17 @@ DB_PATH = ".data/myning.db"
 # Keys that survive a reset_game() call (no file extension — these are SQLite keys)
 _PROTECTED_KEYS = {"stats", "settings"}
 
+# Decoded saves read ahead by FileManager.preload, by key
+_preloaded: dict[str, dict] = {}
+
+# Fix-ups found while loading, written together by FileManager.apply_repairs
+_stale_keys: list[str] = []
+_repaired: list[Object] = []
+
+# Decoding JSON holds the GIL, so big saves are only decoded side by side on free-threaded builds
+PARALLEL_DECODE = not getattr(sys, "_is_gil_enabled", lambda: True)()
+PARALLEL_DECODE_SIZE = 256 * 1024
+
 
 class Subfolders(str, Enum):
     ITEMS = "items"
@@ -58,14 +71,74 @@ class FileManager:
             if not Path(".data/entities").is_dir():
                 os.mkdir(".data/entities")
 
+    @staticmethod
+    def preload(parallel: bool = PARALLEL_DECODE):
+        """Read and decode the whole save in one query. Each key is then loaded from memory the
+        first time, until it is saved or deleted."""
+        _preloaded.clear()
+        if not _db_exists():
+            return
+        with _connect() as conn:
+            rows = conn.execute("SELECT key, data FROM save_data").fetchall()
+        large = [(key, data) for key, data in rows if len(data) >= PARALLEL_DECODE_SIZE]
+        if parallel and len(large) > 1:
+            rows = [(key, data) for key, data in rows if len(data) < PARALLEL_DECODE_SIZE]
+            with ThreadPoolExecutor(len(large)) as executor:
+                decoded = executor.map(json.loads, [data for _, data in large])
+                _preloaded.update(zip([key for key, _ in large], decoded))
+        _preloaded.update((key, json.loads(data)) for key, data in rows)
+
+    @staticmethod
+    def clear_preloaded():
+        _preloaded.clear()
+
+    @staticmethod
+    def repair(item: Object, stale_key: str | None = None):
+        """Save `item`, and delete the save under `stale_key`, once loading is done. Loading never
+        writes, so that it takes the same time whatever shape the save is in."""
+        if stale_key:
+            _stale_keys.append(stale_key)
+        _repaired.append(item)
+
+    @classmethod
+    def apply_repairs(cls):
+        """Write the fix-ups collected while loading in one transaction"""
+        stale_keys, items = _stale_keys.copy(), _repaired.copy()
+        _stale_keys.clear()
+        _repaired.clear()
+        if not _db_exists():
+            for key in stale_keys:
+                Path(f".data/{key}.json").unlink(missing_ok=True)
+            cls.multi_save(*items)
+            return
+        for key in (*stale_keys, *(item.file_name for item in items)):
+            _preloaded.pop(key, None)
+        with _connect() as conn:
+            conn.executemany("DELETE FROM save_data WHERE key=?", ((key,) for key in stale_keys))
+            conn.executemany(
+                "INSERT OR REPLACE INTO save_data (key, data) VALUES (?, ?)",
+                ((item.file_name, json.dumps(item.to_dict())) for item in items),
+            )
+
     @classmethod
     def multi_save(cls, *items: Object):
+        """Save `items` in one transaction"""
+        if not _db_exists():
+            for item in items:
+                cls.save(item)
+            return
         for item in items:
-            cls.save(item)
+            _preloaded.pop(item.file_name, None)
+        with _connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO save_data (key, data) VALUES (?, ?)",
+                ((item.file_name, json.dumps(item.to_dict())) for item in items),
+            )
 
     @staticmethod
     def save(item: Object):
         key = item.file_name
+        _preloaded.pop(key, None)
         data = json.dumps(item.to_dict())
         if _db_exists():
             with _connect() as conn:
@@ -86,6 +159,9 @@ class FileManager:
             subfolder = subfolder.value
         key = f"{subfolder}/{file_name}" if subfolder else file_name
 
+        if key in _preloaded:
+            return cls.from_dict(_preloaded.pop(key))
+
         if _db_exists():
             with _connect() as conn:
                 row = conn.execute("SELECT data FROM save_data WHERE key=?", (key,)).fetchone()
@@ -109,6 +185,7 @@ class FileManager:
     @staticmethod
     def delete(item: Object):
         key = item.file_name
+        _preloaded.pop(key, None)
         if _db_exists():
             with _connect() as conn:
                 conn.execute("DELETE FROM save_data WHERE key=?", (key,))
@@ -119,11 +196,20 @@ class FileManager:
 
     @classmethod
     def multi_delete(cls, *items: Object):
+        if not _db_exists():
+            for item in items:
+                cls.delete(item)
+            return
         for item in items:
-            cls.delete(item)
+            _preloaded.pop(item.file_name, None)
+        with _connect() as conn:
+            conn.executemany(
+                "DELETE FROM save_data WHERE key=?", ((item.file_name,) for item in items)
+            )
 
     @staticmethod
     def reset_game():
+        _preloaded.clear()
         if _db_exists():
             placeholders = ",".join("?" * len(_PROTECTED_KEYS))
             with _connect() as conn:
@@ -1,5 +1,6 @@
 import math
 import random
+from collections import defaultdict
 
 from myning.config import SPECIES, STRINGS
 from myning.objects.army import Army
@@ -8,6 +9,7 @@ from myning.objects.character import Character, CharacterSpecies
 from myning.objects.equipment import EQUIPMENT_TYPES
 from myning.objects.item import Item, ItemType
 from myning.objects.plant import PLANT_TYPES, Plant
+from myning.objects.species import Species
 from myning.utilities import string_generation
 from myning.utilities.rand import (
     get_random_array_item,
@@ -19,15 +21,59 @@ from myning.utilities.rand import (
 def generate_character(
     level_range, species=None, is_enemy=False, max_items=0, max_item_level=0, item_scale=1
 ):
-    if species is None:
-        if is_enemy:
-            species = SPECIES[CharacterSpecies.ALIEN.value]
-        else:
-            species = SPECIES[get_random_array_item(Character.companion_species).value]
-
+    species = species or random_species(is_enemy)
     name = string_generation.generate_name(species.name)
     description = string_generation.generate_description(species.name)
+    return create_character(
+        name, description, species, level_range, is_enemy, max_items, max_item_level, item_scale
+    )
+
+
+def generate_characters(
+    species: list[Species | None],
+    level_range,
+    is_enemy=False,
+    max_items=0,
+    max_item_level=0,
+    item_scale=1,
+) -> list[Character]:
+    """One character per entry of `species` (None for a random one), naming them in one batch per
+    species"""
+    species = [s or random_species(is_enemy) for s in species]
+    indexes: defaultdict[str, list[int]] = defaultdict(list)
+    for index, s in enumerate(species):
+        indexes[s.name].append(index)
+
+    names = [""] * len(species)
+    descriptions = [""] * len(species)
+    for species_name, species_indexes in indexes.items():
+        count = len(species_indexes)
+        batch = zip(
+            species_indexes,
+            string_generation.generate_names(species_name, count),
+            string_generation.generate_descriptions(species_name, count),
+        )
+        for index, name, description in batch:
+            names[index] = name
+            descriptions[index] = description
+
+    return [
+        create_character(
+            name, description, s, level_range, is_enemy, max_items, max_item_level, item_scale
+        )
+        for name, description, s in zip(names, descriptions, species)
+    ]
+
+
+def random_species(is_enemy: bool) -> Species:
+    if is_enemy:
+        return SPECIES[CharacterSpecies.ALIEN.value]
+    return SPECIES[get_random_array_item(Character.companion_species).value]
+
 
+def create_character(
+    name, description, species, level_range, is_enemy, max_items, max_item_level, item_scale
+):
     level = get_random_int(*level_range)
     character = Character(name, description, level, is_enemy, species)
 
@@ -84,25 +130,13 @@ def generate_mineral(max, mineral=None):
     if weight == 0:
         weight = 1
     base_name = mineral if mineral else get_random_array_item(STRINGS["minerals"])
-    mineral = Item(name=f"{modifier} {base_name}", description="", type=ItemType.MINERAL)
-
-    mineral.value = weight
-
-    # Add other random affects
-
-    return mineral
+    return Item(name=f"{modifier} {base_name}", description="", type=ItemType.MINERAL, value=weight)
 
 
 def generate_mineral_exact(level, mineral=None):
     modifier = STRINGS["sizes"][level]
     base_name = mineral if mineral else get_random_array_item(STRINGS["minerals"])
-    mineral = Item(name=f"{modifier} {base_name}", description="", type=ItemType.MINERAL)
-
-    mineral.value = level
-
-    # Add other random affects
-
-    return mineral
+    return Item(name=f"{modifier} {base_name}", description="", type=ItemType.MINERAL, value=level)
 
 
 def generate_enemy_army(
@@ -110,14 +144,14 @@ def generate_enemy_army(
 ):
     size = random.randint(*size_range)
     return Army(
-        generate_character(
+        generate_characters(
+            [None] * size,
             level_range,
             is_enemy=True,
             max_items=max_enemy_items,
             max_item_level=max_enemy_item_level,
             item_scale=enemy_item_scale,
         )
-        for _ in range(size)
     )
 
 
@@ -0,0 +1,116 @@
+import json
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial, wraps
+from pathlib import Path
+
+# MYNING_PROFILE=1 turns the profiler on at startup, MYNING_PROFILE=trace also records a trace
+# that is written to PROFILES_PATH when profiling stops
+ENV_VAR = "MYNING_PROFILE"
+PROFILES_PATH = ".data/profiles"
+WINDOW = 200
+MAX_TRACE_EVENTS = 100_000
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Nearest-rank percentile of already sorted samples"""
+    if not samples:
+        return 0
+    return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+
+class Profiler:
+    def __init__(self):
+        mode = os.environ.get(ENV_VAR, "")
+        self.enabled = bool(mode)
+        self.tracing = mode == "trace"
+        self.samples: defaultdict[str, deque[float]] = defaultdict(partial(deque, maxlen=WINDOW))
+        self.counts: defaultdict[str, int] = defaultdict(int)
+        self.trace: list[dict] = []
+        self.origin = time.perf_counter()
+
+    def record(self, name: str, start: float, end: float | None = None):
+        end = time.perf_counter() if end is None else end
+        self.samples[name].append(end - start)
+        self.counts[name] += 1
+        if self.tracing and len(self.trace) < MAX_TRACE_EVENTS:
+            # Chrome trace event format, viewable in chrome://tracing or Perfetto
+            self.trace.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": round((start - self.origin) * 1e6),
+                    "dur": round((end - start) * 1e6),
+                    "pid": 0,
+                    "tid": 0,
+                }
+            )
+
+    @contextmanager
+    def timed(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def summary(self) -> list[tuple[str, int, float, float, float]]:
+        """(name, calls, p50, p95, max) for each timed name, slowest p95 first. Times are in
+        seconds over the last WINDOW calls."""
+        rows = []
+        for name, samples in self.samples.items():
+            ordered = sorted(samples)
+            rows.append(
+                (
+                    name,
+                    self.counts[name],
+                    percentile(ordered, 0.5),
+                    percentile(ordered, 0.95),
+                    ordered[-1],
+                )
+            )
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def reset(self):
+        self.samples.clear()
+        self.counts.clear()
+        self.trace = []
+        self.origin = time.perf_counter()
+
+    def dump(self) -> Path:
+        path = Path(PROFILES_PATH)
+        path.mkdir(parents=True, exist_ok=True)
+        path /= f"{datetime.now():%Y%m%d-%H%M%S}.json"
+        summary = {
+            name: {"calls": calls, "p50": p50, "p95": p95, "max": max_}
+            for name, calls, p50, p95, max_ in self.summary()
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace, "summary": summary}, f)
+        return path
+
+
+profiler = Profiler()
+
+
+def profiled(func):
+    """Time every call of `func` while the profiler is enabled"""
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.record(name, start)
+
+    return wrapper
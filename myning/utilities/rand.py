@@ -1,7 +1,7 @@
 import random
 from collections import UserList
 from datetime import datetime
-from typing import Callable, TypeVar
+from typing import Callable, Generic, Sequence, TypeVar
 
 T = TypeVar("T")
 ListType = list[T] | UserList[T]
@@ -41,7 +41,15 @@ def boosted_random_choice(
 ) -> T | None:
     if not arr:
         return None
-    selected_indexes = [i for i, v in enumerate(arr) if selector(v)]
+    return random.choices(arr, weights=boosted_weights(arr, selector, percent_boost))[0]
+
+
+def boosted_weights(
+    arr: list[T], selector: Callable[[T], bool], percent_boost: float = 0.0
+) -> list[float]:
+    """Weights that make the values matching `selector` `percent_boost` more likely to be picked
+    together"""
+    selected_indexes = {i for i, v in enumerate(arr) if selector(v)}
     selected_count = len(selected_indexes)
     default_weight = 1 / len(arr)
     selected_weight = default_weight
@@ -67,4 +75,39 @@ def boosted_random_choice(
             weights.append(selected_weight)
         else:
             weights.append(unselected_weight)
-    return random.choices(arr, weights=weights)[0]
+    return weights
+
+
+class AliasTable(Generic[T]):
+    """Walker's alias method: after building the table in O(n), each weighted pick is O(1)"""
+
+    def __init__(self, values: Sequence[T], weights: Sequence[float]):
+        self.values = list(values)
+        count = len(self.values)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        self.probabilities = [1.0] * count
+        self.aliases = list(range(count))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever is left is 1 up to rounding errors
+
+    def pick(self) -> T:
+        index = random.randrange(len(self.values))
+        if random.random() >= self.probabilities[index]:
+            index = self.aliases[index]
+        return self.values[index]
+
+    def chances(self) -> list[float]:
+        """The chance of picking each value, as encoded in the table"""
+        count = len(self.values)
+        chances = [p / count for p in self.probabilities]
+        for index, alias in enumerate(self.aliases):
+            chances[alias] += (1 - self.probabilities[index]) / count
+        return chances
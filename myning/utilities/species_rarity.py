@@ -5,7 +5,7 @@ from myning.objects.character import CharacterSpecies
 from myning.objects.player import Player
 from myning.objects.research_facility import ResearchFacility
 from myning.objects.species import Species
-from myning.utilities.rand import boosted_random_choice
+from myning.utilities.rand import AliasTable, boosted_weights
 
 SPECIES_TIERS = [
     [CharacterSpecies.HUMAN],
@@ -44,35 +44,58 @@ def get_current_tier():
     return max(s.rarity_tier for s in player.discovered_species)
 
 
-def _recruit_in_tier(tier: list[CharacterSpecies]):
-    player = Player()
+# Recruit tables keyed by the player's discovery version, the mine's companion rarity and the
+# research boosts. Tables for older discovery versions are dropped when a new one is built.
+_recruit_tables: dict[tuple, AliasTable[Species]] = {}
 
-    def is_undiscovered(species_name):
-        return SPECIES[species_name] not in player.discovered_species
 
+def _research_value(research_id: str) -> float:
     facility = ResearchFacility()
-    percent_boost = 0.0
-    if facility.has_research("species_discovery"):
-        percent_boost = RESEARCH["species_discovery"].player_value / 100
+    return RESEARCH[research_id].player_value if facility.has_research(research_id) else 0
 
-    selected_species_name = boosted_random_choice(tier, is_undiscovered, percent_boost)
-    return SPECIES[selected_species_name] if selected_species_name else None
 
-
-def get_recruit_species(highest_rarity: int):
-    facility = ResearchFacility()
-    tiers = list(range(1, highest_rarity + 1))
+def _tier_weights(highest_rarity: int, rarity_boost: float) -> list[float]:
     species_weights = SPECIES_WEIGHTS[:highest_rarity]
-    if facility.has_research("species_rarity"):
+    if rarity_boost:
         species_weights = [
-            weight + RESEARCH["species_rarity"].player_value + (i * 3)
-            for i, weight in enumerate(species_weights)
+            weight + rarity_boost + (i * 3) for i, weight in enumerate(species_weights)
         ]
+    return species_weights
 
-    rarity = random.choices(tiers, weights=species_weights)[0]
 
-    tier = SPECIES_TIERS[rarity - 1]
-    return _recruit_in_tier(tier)
+def build_recruit_table(
+    highest_rarity: int, discovery_boost: float, rarity_boost: float
+) -> AliasTable[Species]:
+    """One table over every species in the first `highest_rarity` tiers: the chance of a species
+    is the chance of its tier times its (discovery boosted) chance within the tier"""
+    player = Player()
+
+    def is_undiscovered(species_name):
+        return not player.has_discovered(SPECIES[species_name])
+
+    species = []
+    weights = []
+    tier_weights = _tier_weights(highest_rarity, rarity_boost)
+    total = sum(tier_weights)
+    for tier, tier_weight in zip(SPECIES_TIERS, tier_weights):
+        in_tier = boosted_weights(tier, is_undiscovered, discovery_boost / 100)
+        # Boosted weights are clamped, so they don't always sum to 1
+        in_tier_total = sum(in_tier)
+        species.extend(SPECIES[name] for name in tier)
+        weights.extend(tier_weight / total * weight / in_tier_total for weight in in_tier)
+    return AliasTable(species, weights)
+
+
+def get_recruit_species(highest_rarity: int) -> Species:
+    version = Player().discovery_version
+    discovery_boost = _research_value("species_discovery")
+    rarity_boost = _research_value("species_rarity")
+    key = (version, highest_rarity, discovery_boost, rarity_boost)
+    if key not in _recruit_tables:
+        if _recruit_tables and next(iter(_recruit_tables))[0] != version:
+            _recruit_tables.clear()
+        _recruit_tables[key] = build_recruit_table(highest_rarity, discovery_boost, rarity_boost)
+    return _recruit_tables[key].pick()
 
 
 def get_time_travel_species(lowest_tier: int) -> Species:
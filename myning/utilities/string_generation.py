@@ -1,3 +1,6 @@
+import random
+from typing import NamedTuple
+
 from myning.config import NAMES, STRINGS
 from myning.objects.character import CharacterSpecies
 from myning.utilities.rand import get_random_array_item, get_random_array_item_and_index
@@ -136,6 +139,21 @@ death_actions = [
 ]
 
 
+class NameParts(NamedTuple):
+    first: tuple[str, ...]
+    last: tuple[str, ...]
+
+
+# Everything names and descriptions are made of, flattened into tuples once at import
+NAME_PARTS = {
+    species: NameParts(tuple(parts["first"]), tuple(parts["last"]))
+    for species, parts in NAMES.items()
+}
+SIZES = tuple(size.lower() for size in STRINGS["sizes"])
+MODIFIERS = tuple(modifier.lower() for modifier in STRINGS["modifiers"])
+CREATURE_TYPES = tuple(f"{creature.lower()}-like creature" for creature in creature_types)
+
+
 def generate_potion_base():
     size, weight = get_random_array_item_and_index(STRINGS["sizes"])
     potion = get_random_array_item(STRINGS["minerals"])
@@ -147,15 +165,33 @@ def generate_potion_base():
 
 
 def generate_name(type):
-    return f"{get_random_array_item(NAMES[type]['first'])} {get_random_array_item(NAMES[type]['last'])}"
+    parts = NAME_PARTS[type]
+    return f"{random.choice(parts.first)} {random.choice(parts.last)}"
+
+
+def generate_names(type, count: int) -> list[str]:
+    parts = NAME_PARTS[type]
+    firsts = random.choices(parts.first, k=count)
+    lasts = random.choices(parts.last, k=count)
+    return [f"{first} {last}" for first, last in zip(firsts, lasts)]
 
 
 def generate_description(type):
-    size = get_random_array_item(STRINGS["sizes"]).lower()
-    adjective = get_random_array_item(STRINGS["modifiers"]).lower()
     if type == CharacterSpecies.ALIEN.value:
-        type = f"{get_random_array_item(creature_types).lower()}-like creature"
-    return f"a {size}, {adjective}, {type}"
+        type = random.choice(CREATURE_TYPES)
+    return f"a {random.choice(SIZES)}, {random.choice(MODIFIERS)}, {type}"
+
+
+def generate_descriptions(type, count: int) -> list[str]:
+    sizes = random.choices(SIZES, k=count)
+    adjectives = random.choices(MODIFIERS, k=count)
+    if type == CharacterSpecies.ALIEN.value:
+        types = random.choices(CREATURE_TYPES, k=count)
+    else:
+        types = [type] * count
+    return [
+        f"a {size}, {adjective}, {type}" for size, adjective, type in zip(sizes, adjectives, types)
+    ]
 
 
 def generate_death_action():
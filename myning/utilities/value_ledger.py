@@ -0,0 +1,70 @@
+from typing import Callable, NamedTuple
+
+from myning.objects.garden import Garden
+from myning.objects.inventory import Inventory
+from myning.objects.player import Player
+from myning.objects.research_facility import ResearchFacility
+from myning.utilities.event_bus import EventBus, GameEvent
+
+
+class LedgerPart(NamedTuple):
+    source: Callable[[], object]
+    value: Callable[[object], int]
+    events: tuple[GameEvent, ...]
+
+
+# Each part of the total game value, with the events published whenever it may have changed
+PARTS = {
+    "gold": LedgerPart(Player, lambda player: player.gold, (GameEvent.GOLD,)),
+    "xp": LedgerPart(Player, lambda player: player.exp_value, (GameEvent.XP,)),
+    "army": LedgerPart(Player, lambda player: player.army_value, (GameEvent.ARMY,)),
+    "upgrades": LedgerPart(Player, lambda player: player.upgrades_value, (GameEvent.UPGRADES,)),
+    "mines": LedgerPart(Player, lambda player: player.mines_value, (GameEvent.MINES,)),
+    "research": LedgerPart(
+        ResearchFacility, lambda facility: facility.total_value, (GameEvent.RESEARCH,)
+    ),
+    "garden": LedgerPart(Garden, lambda garden: garden.total_value, (GameEvent.GARDEN,)),
+    "inventory": LedgerPart(
+        Inventory, lambda inventory: inventory.total_value, (GameEvent.INVENTORY,)
+    ),
+}
+
+
+class ValueLedger:
+    """The total game value used for the time machine and stats sync, kept per part.
+
+    A part is only recomputed when one of its events was published (or its singleton was replaced)
+    since it was last read, so reading the total is a handful of version checks."""
+
+    def __init__(self):
+        self.entries: dict[str, tuple[object, tuple[int, ...], int]] = {}
+
+    def value_of(self, name: str) -> int:
+        part = PARTS[name]
+        source = part.source()
+        versions = EventBus.versions(*part.events)
+        entry = self.entries.get(name)
+        if entry and entry[0] is source and entry[1] == versions:
+            return entry[2]
+        value = part.value(source)
+        self.entries[name] = (source, versions, value)
+        return value
+
+    @property
+    def total(self) -> int:
+        return sum(self.value_of(name) for name in PARTS)
+
+    def check(self) -> dict[str, tuple[int, int]]:
+        """(ledger, recomputed) values of the parts that are out of sync"""
+        mismatches = {}
+        for name, part in PARTS.items():
+            expected = part.value(part.source())
+            if (actual := self.value_of(name)) != expected:
+                mismatches[name] = (actual, expected)
+        return mismatches
+
+    def clear(self):
+        self.entries = {}
+
+
+ledger = ValueLedger()
@@ -0,0 +1,66 @@
+import heapq
+
+from myning.objects.character import Character
+from myning.utilities.fib import fibonacci_sum
+
+
+def distribute_xp(
+    members: list[Character], leader: Character, xp: int
+) -> list[tuple[Character, int]]:
+    """Split `xp` between `members` the way handing it out one level at a time would: the lowest
+    level member, earliest in `members` on ties, levels up next. Members can't outlevel `leader`,
+    who levels up instead once they have all caught up. The leader doesn't need to be a member.
+
+    Rather than stepping level by level, members jump straight to the level where the next member
+    takes over, so this takes a few heap operations per member and level tier for any amount of
+    xp. Returns how much xp each member and the leader get; characters aren't changed.
+    """
+    characters = list(members)
+    if not any(member is leader for member in members):
+        characters.append(leader)
+    leader_index = next(i for i, character in enumerate(characters) if character is leader)
+    levels = [character.level for character in characters]
+    experience = [character.experience for character in characters]
+    granted = [0] * len(characters)
+    heap = [(levels[i], i) for i in range(len(members))]
+    heapq.heapify(heap)
+
+    def top():
+        # the leader's entry goes stale when it levels past everyone else
+        while heap and heap[0][0] != levels[heap[0][1]]:
+            heapq.heapreplace(heap, (levels[heap[0][1]], heap[0][1]))
+        return heap[0] if heap else None
+
+    def raise_to(i: int, level: int | None):
+        """Spend xp on raising character `i` to `level`, or as far as it goes"""
+        nonlocal xp
+        if level is None:
+            cost = xp
+        else:
+            cost = fibonacci_sum(level) - fibonacci_sum(levels[i]) - experience[i]
+        spent = min(cost, xp)
+        granted[i] += spent
+        xp -= spent
+        if level is not None and spent == cost:
+            levels[i] = level
+            experience[i] = 0
+
+    while xp > 0:
+        if (lowest := top()) is None:
+            raise_to(leader_index, None)
+            break
+        level, i = lowest
+        if i != leader_index and level >= levels[leader_index]:
+            raise_to(leader_index, level + 1)
+            continue
+        heapq.heappop(heap)
+        target = None
+        if (following := top()) is not None:
+            # stop where the next member takes over, ties going to whoever comes first
+            target = following[0] if i > following[1] else following[0] + 1
+        if i != leader_index:
+            target = levels[leader_index] if target is None else min(target, levels[leader_index])
+        raise_to(i, target)
+        heapq.heappush(heap, (levels[i], i))
+
+    return [(character, xp) for character, xp in zip(characters, granted) if xp]
@@ -1,10 +1,13 @@
 from textual.pilot import Pilot
 
+from myning.chapters import armory
 from myning.config import UPGRADES
+from myning.objects.character import Character
 from myning.objects.inventory import Inventory
 from myning.objects.item import Item, ItemType
 from myning.objects.player import Player
 from myning.tui.chapter import ChapterWidget
+from myning.utilities.file_manager import FileManager
 
 player = Player()
 inventory = Inventory()
@@ -44,3 +47,20 @@ async def test_armory(pilot: Pilot, chapter: ChapterWidget):
     equipped = player.equipment.get_slot_item(ItemType.WEAPON)
     assert equipped and equipped.main_affect == 10
     assert inventory.items[0].main_affect == 1
+
+
+def test_auto_equip_distributes_best_items_across_army():
+    ally = Character("Ally")
+    player.add_ally(ally)
+    worn = Item("5", "5", ItemType.WEAPON, 5, 5)
+    ally.equipment.equip(worn)
+    weapons = [Item(str(i), str(i), ItemType.WEAPON, i, i) for i in (1, 3, 8)]
+    inventory.add_items(weapons)
+
+    armory.auto_equip()
+
+    # the ally keeps its 5 since it is one of the two best weapons, the player gets the 8
+    assert player.equipment.get_slot_item(ItemType.WEAPON) is weapons[2]
+    assert ally.equipment.get_slot_item(ItemType.WEAPON) is worn
+    assert inventory.get_slot(ItemType.WEAPON) == weapons[:2]
+    FileManager.multi_save.assert_called_once_with(player, inventory)  # type: ignore
@@ -51,8 +51,8 @@ async def test_mining(app: MyningApp, pilot: Pilot, chapter: ChapterWidget):
     # enter to skip mining
     await pilot.press("enter")
     assert "New mineral added" in get_content(app)
-    assert len(trip.minerals_mined) == 1
-    mineral = trip.minerals_mined[0]
+    assert trip.mineral_count == 1
+    (mineral,) = trip.minerals_mined.values()
     assert mineral.name in get_content(app)
 
     # tick after getting mineral goes back to mining (ItemsAction has duration=5)
@@ -3,6 +3,10 @@ import re
 from rich.text import Text
 from textual.pilot import Pilot
 
+from myning.chapters.store import Store
+from myning.objects.inventory import Inventory
+from myning.objects.item import Item, ItemType
+from myning.objects.player import Player
 from myning.tui.app import MyningApp
 from myning.tui.chapter import ChapterWidget
 from myning.tui.currency import CurrencyWidget
@@ -41,3 +45,31 @@ async def test_store(app: MyningApp, pilot: Pilot):
     await pilot.press("enter")
     assert inventory.row_count == 1
     assert get_gold(app) == 0
+
+
+async def test_store_sell_builds_rows_lazily(app: MyningApp, chapter: ChapterWidget):
+    inventory = Inventory()
+    inventory.add_items([Item(f"item {i}", "", ItemType.MINERAL, i, i) for i in range(1000)])
+    chapter.pick(Store().pick_sell())
+
+    option_table = chapter.option_table
+    assert option_table.row_count == 1001
+    # only rows close to the visible window have been built
+    assert 0 < len(option_table._lazy_rows) < 1000  # pylint: disable=protected-access
+
+    assert "item" in get_option(app, 998)
+    assert len(option_table.get_row_at(998)) == len(option_table.columns)
+
+
+def test_store_stock_is_kept_between_visits():
+    player = Player()
+    stock = Store().items
+    assert Store().items == stock
+
+    sword = Item("sword", "", ItemType.WEAPON, 1, 1)
+    Inventory().add_item(sword)
+    Store().mass_sell([sword], 1)
+    assert sword in Store().items
+
+    player.level += 1
+    assert sword not in Store().items
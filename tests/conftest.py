@@ -13,7 +13,9 @@ from myning.objects.player import Player
 from myning.objects.research_facility import ResearchFacility
 from myning.objects.settings import Settings
 from myning.objects.stats import Stats
+from myning.objects.stock import Stock
 from myning.objects.trip import Trip
+from myning.utilities.clock import clock
 
 # pylint: disable=redefined-outer-name
 
@@ -81,6 +83,8 @@ def reset_objects():
     stats.integer_stats = {}
     stats.float_stats = {}
     stats.defeated_bosses = []
+    Stock.loaded.clear()
+    clock.reset()
 
 
 @pytest.fixture
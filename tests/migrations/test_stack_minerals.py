@@ -0,0 +1,77 @@
+import json
+import sqlite3
+
+from myning.migrations import stack_minerals
+from myning.objects.item import Item, ItemType
+from myning.utilities.file_manager import DB_PATH
+
+
+def unstacked(name: str, value: int, number: int) -> dict:
+    """A mineral as it was saved before stacking: a random id and no count"""
+    mineral = Item(name, "", ItemType.MINERAL, value).to_dict()
+    mineral["id"] = f"{name} - {number}"
+    del mineral["count"]
+    return mineral
+
+
+def read(conn: sqlite3.Connection) -> dict[str, dict]:
+    return {key: json.loads(data) for key, data in conn.execute("SELECT key, data FROM save_data")}
+
+
+def test_minerals_are_folded_into_stacks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".data").mkdir()
+    inventory_minerals = [unstacked("Small copper", 2, i) for i in range(3)] + [
+        unstacked("Large gold", 5, i) for i in range(2)
+    ]
+    trip_minerals = [unstacked("Small copper", 2, i) for i in range(3, 5)]
+    gold_stack = Item("Large gold", "", ItemType.MINERAL, 5)
+    gold_stack.count = 4
+    weapon = Item("Sword", "", ItemType.WEAPON, 10, 3)
+    rows = {
+        **{f"items/{mineral['id']}": mineral for mineral in inventory_minerals + trip_minerals},
+        weapon.file_name: weapon.to_dict(),
+        "inventory": {
+            ItemType.MINERAL.value: [mineral["id"] for mineral in inventory_minerals],
+            ItemType.WEAPON.value: [weapon.id],
+        },
+        "trip": {
+            "minerals_mined": [mineral["id"] for mineral in trip_minerals] + [gold_stack.to_dict()],
+            "items_found": [],
+        },
+    }
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute("CREATE TABLE save_data (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        conn.executemany(
+            "INSERT INTO save_data VALUES (?, ?)",
+            ((key, json.dumps(data)) for key, data in rows.items()),
+        )
+    conn.close()
+    value_before = sum(mineral["value"] for mineral in inventory_minerals + trip_minerals) + 5 * 4
+
+    stack_minerals.run()
+
+    conn = sqlite3.connect(DB_PATH)
+    saved = read(conn)
+    conn.close()
+    copper_id, gold_id = "Small copper - stack 2", "Large gold - stack 5"
+
+    inventory = saved["inventory"]
+    assert sorted(inventory[ItemType.MINERAL.value]) == [gold_id, copper_id]
+    assert inventory[ItemType.WEAPON.value] == [weapon.id]
+    inventory_stacks = [saved[f"items/{id}"] for id in inventory[ItemType.MINERAL.value]]
+    assert {stack["id"]: stack["count"] for stack in inventory_stacks} == {copper_id: 3, gold_id: 2}
+
+    trip_stacks = saved["trip"]["minerals_mined"]
+    assert {stack["id"]: stack["count"] for stack in trip_stacks} == {copper_id: 2, gold_id: 4}
+
+    assert set(saved) == {
+        "inventory",
+        "trip",
+        weapon.file_name,
+        f"items/{copper_id}",
+        f"items/{gold_id}",
+    }
+    value_after = sum(stack["value"] * stack["count"] for stack in inventory_stacks + trip_stacks)
+    assert value_after == value_before
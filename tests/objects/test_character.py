@@ -1,5 +1,6 @@
 from myning.config import SPECIES
 from myning.objects.character import Character, CharacterSpecies
+from myning.utilities.fib import fibonacci_sum
 from myning.utilities.generators import generate_character
 
 
@@ -30,3 +31,14 @@ def test_species_attributes():
         assert " " in char.name
         for attr in ("damage", "armor", "critical_chance", "dodge_chance"):
             assert isinstance(char.stats[attr], int)
+
+
+def test_add_experience_jumps_to_level():
+    """Test that bulk leveling ends where leveling one xp at a time would"""
+    bulk, stepped = Character("bulk"), Character("stepped")
+    bulk.add_experience(1000, save=False)
+    for _ in range(1000):
+        stepped.add_experience(1, save=False)
+    assert bulk.level == stepped.level > 10
+    assert bulk.experience == stepped.experience == 1000 - fibonacci_sum(bulk.level)
+    assert bulk.health == stepped.health == stepped.max_health
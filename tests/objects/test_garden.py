@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+from myning.objects.garden import Garden
+from myning.objects.plant import Plant, PlantType
+
+
+def plant_at(garden: Garden, row: int, column: int, minutes_ago: int):
+    # Value 1 plants take 10 minutes to grow
+    plant = Plant("apple seed", "An apple seed", value=1, plant_type=PlantType.APPLE)
+    plant.started = datetime.now() - timedelta(minutes=minutes_ago)
+    garden.add_plant(plant, row, column)
+    return plant
+
+
+def test_garden_schedule_matches_plant_growth():
+    garden = Garden._create(3)
+    plants = {
+        (0, 0): plant_at(garden, 0, 0, 1),
+        (0, 2): plant_at(garden, 0, 2, 6),
+        (1, 1): plant_at(garden, 1, 1, 8),
+        (2, 0): plant_at(garden, 2, 0, 11),
+    }
+    assert garden.changed_cells() == set(plants)
+    for (row, column), plant in plants.items():
+        assert garden.growth_icon(row, column) == plant.growth_icon
+        assert garden.check_ready(row, column) == plant.ready
+    assert garden.growth_icon(1, 0) == ""
+    assert garden.next_plant_coords == (2, 0)
+
+    # Three minutes later only the plants that crossed a growth stage changed
+    later = datetime.now() + timedelta(minutes=3)
+    garden.schedule.advance(later)
+    assert garden.schedule.pop_changed() == {(0, 2), (1, 1)}
+    assert garden.schedule.ready.cells == {(1, 1), (2, 0)}
+
+    garden.uproot_plant(2, 0)
+    assert garden.next_plant_coords == (1, 1)
+
+
+def test_garden_schedule_progress():
+    garden = Garden._create(2)
+    assert garden.empty
+    plant_at(garden, 0, 0, 5)
+    plant_at(garden, 1, 1, 20)
+    assert not garden.empty
+
+    schedule = garden.schedule
+    assert schedule.total_time == 2 * 600
+    assert abs(schedule.progress() - (300 + 600)) < 5
+    assert abs(schedule.time_left() - 300) < 5
+
+    garden.water = 1
+    garden.water_plant(0, 0)
+    assert abs(schedule.progress() - (300 + 120 + 600)) < 5
+    assert garden.growth_icon(0, 0) == "🪴"
+
+
+def test_garden_free_cells_follow_planting_and_level_up():
+    garden = Garden._create(2)
+    assert garden.next_empty_coords == (0, 0)
+
+    plant_at(garden, 0, 0, 1)
+    plant_at(garden, 0, 1, 1)
+    assert garden.next_empty_coords == (1, 0)
+    assert garden.empty_columns(0) == []
+
+    garden.level_up()
+    assert garden.next_empty_coords == (0, 2)
+    assert garden.empty_columns(2) == [0, 1, 2]
+
+    for row in range(3):
+        for column in garden.empty_columns(row):
+            plant_at(garden, row, column, 11)
+    assert garden.next_empty_coords == (None, None)
+    assert garden.ready_columns(2) == [0, 1, 2]
+
+    garden.harvest_plant(1, 1)
+    assert garden.next_empty_coords == (1, 1)
+    assert garden.next_plant_coords == (0, 2)
+    assert not garden.empty
@@ -0,0 +1,75 @@
+from myning.objects.inventory import Inventory
+from myning.objects.item import Item, ItemType
+
+
+def weapon(damage: int):
+    return Item(f"sword {damage}", "", ItemType.WEAPON, damage, damage)
+
+
+def test_best_in_slot_is_maintained():
+    inventory = Inventory._create()  # pylint: disable=protected-access
+    assert inventory.get_best_in_slot(ItemType.WEAPON) is None
+    assert not inventory.has_better_item(ItemType.WEAPON, None)
+
+    first_five, three, second_five = weapon(5), weapon(3), weapon(5)
+    inventory.add_items([three, first_five, second_five])
+    # ties go to the item added first, like max()
+    assert inventory.get_best_in_slot(ItemType.WEAPON) is first_five
+    assert inventory.has_better_item(ItemType.WEAPON, three)
+    assert not inventory.has_better_item(ItemType.WEAPON, second_five)
+    assert inventory.has_better_item(ItemType.WEAPON, None)
+
+    inventory.remove_item(first_five)
+    assert inventory.get_best_in_slot(ItemType.WEAPON) is second_five
+    inventory.remove_items(second_five, weapon(9))
+    assert inventory.get_best_in_slot(ItemType.WEAPON) is three
+    # insertion order is kept for display
+    assert inventory.get_slot(ItemType.WEAPON) == [three]
+
+
+def test_slot_order_and_serialization():
+    inventory = Inventory._create()  # pylint: disable=protected-access
+    items = [weapon(2), Item("rock", "", ItemType.MINERAL, 1, 1), weapon(1)]
+    inventory.add_items(items)
+
+    assert inventory.items == [items[0], items[2], items[1]]
+    assert inventory.to_dict() == {
+        ItemType.WEAPON: [items[0].id, items[2].id],
+        ItemType.MINERAL: [items[1].id],
+    }
+
+
+def test_aggregates_are_maintained():
+    inventory = Inventory._create()  # pylint: disable=protected-access
+    sword, rock = weapon(4), Item("rock", "", ItemType.MINERAL, 3, 3)
+    inventory.add_items([sword, rock, weapon(2)])
+
+    assert inventory.item_count == 3
+    assert inventory.count(ItemType.WEAPON) == 2
+    assert inventory.count(ItemType.HELMET) == 0
+    assert inventory.slot_value(ItemType.WEAPON) == 6
+    assert inventory.total_value == 9
+    assert list(inventory.iter_items()) == inventory.items
+
+    inventory.remove_items(sword, rock)
+    assert inventory.item_count == 1
+    assert inventory.total_value == 2
+
+
+def test_minerals_stack():
+    inventory = Inventory._create()  # pylint: disable=protected-access
+    gold = [Item("Big Gold", "", ItemType.MINERAL, 3) for _ in range(3)]
+    silver = Item("Big Silver", "", ItemType.MINERAL, 2)
+
+    held = inventory.add_items([*gold, silver])
+    assert held == [gold[0], silver]
+    assert gold[0].count == 3
+    assert inventory.get_slot(ItemType.MINERAL) == [gold[0], silver]
+    assert inventory.count(ItemType.MINERAL) == inventory.item_count == 4
+    assert inventory.total_value == 11
+    assert inventory.add_item(Item("Big Gold", "", ItemType.MINERAL, 3)) is gold[0]
+    assert inventory.total_value == 14
+
+    inventory.remove_item(gold[0])
+    assert inventory.item_count == 1
+    assert inventory.total_value == 2
@@ -0,0 +1,41 @@
+from myning.objects.item import Item, ItemType
+from myning.objects.plant import Plant, PlantType
+
+
+def test_items_share_template_and_affects():
+    first = Item("Big Sword", "", ItemType.WEAPON, 5, 5)
+    second = Item("Big Sword", "", ItemType.WEAPON, 5, 5)
+    assert first.template is second.template
+    assert first._affects is second._affects  # pylint: disable=protected-access
+    assert not hasattr(first, "__dict__")
+
+    second.add_affect("armor", 1)
+    assert first.affects == {"damage": 5}
+    assert second.affects == {"damage": 5, "armor": 1}
+    assert str(first) == "⚔️  [red1]Big Sword[/] ([red1]5[/])"
+
+
+def test_item_round_trip():
+    item = Item("Big Sword", "", ItemType.WEAPON, 5, 5)
+    loaded = Item.from_dict(item.to_dict())
+    assert loaded.template is item.template
+    assert loaded.type is ItemType.WEAPON
+    assert loaded.id == item.id
+    assert loaded.main_affect == 5
+
+
+def test_renaming_a_plant_swaps_its_template():
+    plant = Plant("ripe apple seed", "an apple seed", value=1, plant_type=PlantType.APPLE)
+    plant.grow()
+    assert plant.name == "ripe apple plant"
+    assert plant.description == "an apple plant"
+    assert plant.type is ItemType.PLANT
+
+
+def test_item_rows_share_affect_text():
+    first = Item("Big Sword", "", ItemType.WEAPON, 5, 5)
+    second = Item("Small Sword", "", ItemType.WEAPON, 1, 5)
+    assert first.arr[2] is second.arr[2]
+    assert first.arr[2].plain == "5"
+    assert first.arr[2].justify == "right"
+    assert Item("Big Axe", "", ItemType.WEAPON, 5, 6).arr[2].plain == "6"
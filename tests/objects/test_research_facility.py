@@ -0,0 +1,31 @@
+from datetime import datetime, timedelta
+
+from myning.objects.character import Character
+from myning.objects.research_facility import ResearchFacility
+
+
+def test_points_accrue_lazily():
+    facility = ResearchFacility._create(1)  # pylint: disable=protected-access
+    facility.add_researcher(Character("Researcher"))
+    facility.check_in(2)
+    facility.last_research_tick = datetime.now() - timedelta(minutes=facility.minutes_per_tick)
+
+    # one full tick with one researcher and a 2x bonus
+    expected = facility.points_per_researcher * 2
+    assert abs(facility.points - expected) < 0.01
+    assert facility.to_dict()["points"] < 0.01
+
+    facility.purchase(1)
+    assert abs(facility.to_dict()["points"] - facility.points) < 0.01
+    assert abs(facility.points - (expected - 1)) < 0.01
+
+
+def test_check_in_collects_points_earned_while_away():
+    facility = ResearchFacility._create(1)  # pylint: disable=protected-access
+    facility.add_researcher(Character("Researcher"))
+    facility.last_research_tick = datetime.now() - timedelta(hours=1)
+
+    facility.check_in(1)
+
+    assert abs(facility._points - facility.points_per_hour(1)) < 0.01  # pylint: disable=protected-access
+    assert facility.pending_points() < 0.01
@@ -0,0 +1,32 @@
+from myning.config import LOST_RATIO
+from myning.objects.item import Item, ItemType
+from myning.objects.trip import Trip
+
+
+def mineral(name: str):
+    return Item(name, "", ItemType.MINERAL, 1)
+
+
+def test_minerals_are_stacked_and_saved_inline():
+    trip = Trip._create()  # pylint: disable=protected-access
+    weapon = Item("sword", "", ItemType.WEAPON, 1, 1)
+    found = trip.add_items(mineral("Gold"), mineral("Gold"), mineral("Silver"), weapon)
+    assert found == [weapon]
+    assert trip.mineral_count == 3
+    assert trip.minerals_mined["Gold - stack 1"].count == 2
+
+    minerals = trip.to_dict()["minerals_mined"]
+    assert [(mineral["name"], mineral["count"]) for mineral in minerals] == [
+        ("Gold", 2),
+        ("Silver", 1),
+    ]
+
+
+def test_losses_drop_every_nth_mineral():
+    trip = Trip._create()  # pylint: disable=protected-access
+    trip.add_items(*(mineral("Gold") for _ in range(4)), *(mineral("Silver") for _ in range(3)))
+    trip.subtract_mineral_loss()
+    # the same minerals are lost as when they were listed one by one
+    kept = [i for i in range(7) if i % LOST_RATIO != 0]
+    assert trip.minerals_mined["Gold - stack 1"].count == sum(i < 4 for i in kept)
+    assert trip.minerals_mined["Silver - stack 1"].count == sum(i >= 4 for i in kept)
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[2]
+
+# Everything main.py sets up before loading the TUI
+STARTUP = """
+from myning.objects.game import Game
+from myning.objects.garden import Garden
+from myning.objects.graveyard import Graveyard
+from myning.objects.inventory import Inventory
+from myning.objects.macguffin import Macguffin
+from myning.objects.player import Player
+from myning.objects.research_facility import ResearchFacility
+from myning.objects.settings import Settings
+from myning.objects.stats import Stats
+from myning.objects.trip import Trip
+
+Player.initialize("Importer")
+for cls in (Game, Garden, Graveyard, Inventory, Macguffin, ResearchFacility, Settings, Stats, Trip):
+    cls.initialize()
+
+import myning.tui.app
+"""
+
+# The first frame only needs the main menu, or the tutorial for a new game. Every other chapter,
+# and the heavy dependencies some of them use, is imported when it is opened.
+EAGER_CHAPTERS = {"myning.chapters.main_menu", "myning.chapters.tutorial"}
+LAZY_MODULES = {"aiohttp", "chafa", "PIL"} | {
+    ".".join(path.relative_to(ROOT).with_suffix("").parts).removesuffix(".__init__")
+    for path in (ROOT / "myning" / "chapters").rglob("*.py")
+} - EAGER_CHAPTERS - {"myning.chapters"}
+
+# Generous, most of it is textual. Importing aiohttp eagerly alone costs about 170ms.
+BUDGET_MS = 1000
+
+
+def import_times(tmp_path: Path) -> dict[str, int]:
+    """Cumulative import time of each module in microseconds"""
+    env = {key: value for key, value in os.environ.items() if not key.startswith("COV_")}
+    env["PYTHONPATH"] = str(ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_tui_import_is_lazy(tmp_path: Path):
+    times = import_times(tmp_path)
+    assert not LAZY_MODULES & times.keys()
+    assert times["myning.tui.app"] / 1000 < BUDGET_MS
@@ -0,0 +1,19 @@
+from textual.pilot import Pilot
+
+from myning.tui.app import MyningApp
+from myning.tui.profiler import ProfilerOverlay
+from myning.utilities.profiler import profiler
+
+
+async def test_profiler_overlay_toggle(app: MyningApp, pilot: Pilot):
+    overlay = app.screen.query_one(ProfilerOverlay)
+    assert not overlay.display
+
+    await pilot.press("f3")
+    assert overlay.display and profiler.enabled
+
+    await pilot.press("enter")
+    assert any(name.startswith("mine.") for name in profiler.counts)
+
+    await pilot.press("f3")
+    assert not overlay.display and not profiler.enabled
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from textual.pilot import Pilot
+
+from myning.chapters import main_menu
+from myning.objects.inventory import Inventory
+from myning.objects.item import Item, ItemType
+from myning.objects.plant import Plant, PlantType
+from myning.objects.player import Player
+from myning.tui.app import MyningApp
+from myning.tui.army import ArmyWidget
+from myning.tui.chapter import ChapterWidget
+from myning.tui.inventory import InventoryWidget
+from myning.utilities.clock import clock
+
+player = Player()
+inventory = Inventory()
+
+
+async def test_inventory_widget_applies_diffs(app: MyningApp):
+    widget = app.screen.query_one(InventoryWidget)
+    weapon = Item("sword", "", ItemType.WEAPON, 5, 5)
+    mineral = Item("rock", "", ItemType.MINERAL, 3, 3)
+    inventory.add_items([weapon, mineral])
+    widget.update()
+    assert widget.row_count == 2
+    assert "8g" in str(widget.border_subtitle)
+    weapon_value = widget.get_row(weapon.id)[2]
+
+    another = Item("pebble", "", ItemType.MINERAL, 2, 2)
+    inventory.add_item(another)
+    inventory.remove_item(mineral)
+    widget.update()
+
+    assert widget.row_count == 2
+    assert widget.get_row(weapon.id)[2] is weapon_value
+    assert widget.get_row_at(1)[1] == "pebble"
+    assert "7g" in str(widget.border_subtitle)
+
+
+async def test_inventory_widget_shows_expired_plants_on_pick(app: MyningApp, pilot: Pilot):
+    widget = app.screen.query_one(InventoryWidget)
+    chapter = app.screen.query_one(ChapterWidget)
+    clock.freeze(datetime(2024, 1, 1, 12))
+    plant = Plant("apple plant", "An apple plant", value=6, plant_type=PlantType.APPLE)
+    plant.grow()
+    inventory.add_item(plant)
+    await pilot.pause()
+    assert widget.get_row(plant.id)[0] == "🍎"
+
+    # Nothing publishes an event when a plant expires
+    clock.advance(timedelta(seconds=plant.expires_in))
+    chapter.pick(main_menu.enter())
+    await pilot.pause()
+    assert widget.get_row(plant.id)[0] == "🤢"
+
+
+async def test_army_widget_applies_diffs(app: MyningApp):
+    widget = app.screen.query_one(ArmyWidget)
+    widget.update()
+    total_health = widget.total_health
+
+    player.health -= 1
+    widget.update()
+
+    assert widget.row_count == 1
+    assert widget.current_health == player.army.current_health
+    assert widget.total_health == total_health == player.army.total_health
+    assert f"{player.army.current_health}[/green1]/" in str(widget.border_subtitle)
@@ -0,0 +1,109 @@
+import time
+from datetime import datetime, timedelta
+
+from myning.chapters.healer import Recovery
+from myning.objects.character import Character
+from myning.objects.garden import Garden
+from myning.objects.plant import Plant, PlantType
+from myning.objects.player import Player
+from myning.objects.research_facility import ResearchFacility
+from myning.utilities.clock import GameClock, clock
+
+START = datetime(2024, 1, 1, 12)
+
+
+class Recorder:
+    def __init__(self, *times: datetime):
+        self.times = sorted(times)
+        self.seen: list[datetime] = []
+
+    def next_due(self):
+        return self.times[0] if self.times else None
+
+    def catch_up(self):
+        self.seen.append(clock.now())
+        self.times.pop(0)
+
+
+def test_advance_processes_sources_in_event_order():
+    clock.freeze(START)
+    first = Recorder(START + timedelta(hours=1), START + timedelta(hours=3))
+    second = Recorder(START + timedelta(hours=2), START + timedelta(hours=5))
+    clock.register(first)
+    clock.register(second)
+    try:
+        clock.advance(timedelta(hours=4))
+    finally:
+        clock.unregister(first)
+        clock.unregister(second)
+
+    assert clock.now() == START + timedelta(hours=4)
+    assert first.seen == [START + timedelta(hours=1), START + timedelta(hours=3)]
+    assert second.seen == [START + timedelta(hours=2)]
+
+
+def test_catching_up_does_not_move_the_clock():
+    class Slow:
+        def __init__(self):
+            self.due = datetime.now()
+
+        def next_due(self):
+            return self.due
+
+        def catch_up(self):
+            time.sleep(0.001)
+            self.due = None
+
+    slow = Slow()
+    clock.register(slow)
+    try:
+        for _ in range(100):
+            slow.due = datetime.now()
+            clock.catch_up()
+    finally:
+        clock.unregister(slow)
+    assert clock.offset == timedelta()
+
+
+def test_fast_forward_grows_garden_and_accrues_research():
+    clock.freeze(START)
+    garden = Garden._create(2)
+    garden.water = 0
+    garden.last_collected_water = START
+    for row, column in ((0, 0), (1, 1)):
+        plant = Plant("apple seed", "An apple seed", value=6, plant_type=PlantType.APPLE)
+        plant.sow()
+        garden.add_plant(plant, row, column)
+    facility = ResearchFacility._create(1)
+    facility.add_researcher(Character("researcher"))
+    clock.register(garden)
+    try:
+        clock.advance(timedelta(hours=3))
+    finally:
+        clock.unregister(garden)
+
+    assert garden.schedule.ready.cells == {(0, 0), (1, 1)}
+    assert garden.next_plant_coords == (0, 0)
+    assert garden.water == garden.level
+    assert facility.points == round(facility.points_per_hour(1) * 3, 2)
+
+
+def test_fast_forward_heals():
+    player = Player()
+    player.health = 1
+    clock.freeze(START)
+    recovery = Recovery()
+    clock.register(recovery)
+    try:
+        clock.advance(timedelta(hours=1))
+    finally:
+        clock.unregister(recovery)
+    assert player.health == player.max_health
+
+
+def test_clock_offset_is_saved():
+    game_clock = GameClock()
+    game_clock.advance(timedelta(hours=2))
+    restored = GameClock()
+    restored.load(game_clock.to_dict())
+    assert restored.now() - datetime.now() > timedelta(hours=1, minutes=59)
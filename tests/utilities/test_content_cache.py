@@ -0,0 +1,41 @@
+import os
+
+from myning.utilities import content_cache
+from myning.utilities.content_cache import load_content
+
+
+def test_content_is_parsed_again_only_when_it_changes(tmp_path, monkeypatch):
+    parsed = []
+    parse = content_cache.parse
+    monkeypatch.setattr(
+        content_cache, "parse", lambda path: parsed.append(path.name) or parse(path)
+    )
+    (tmp_path / "a.yaml").write_text("a: 1\n")
+    (tmp_path / "b.yaml").write_text("b: [x, y]\n")
+    files = ["a.yaml", "b.yaml"]
+    cache = tmp_path / "cache" / "content.pickle"
+
+    assert load_content(tmp_path, files, cache) == {"a.yaml": {"a": 1}, "b.yaml": {"b": ["x", "y"]}}
+    assert parsed == files
+    assert cache.exists()
+
+    assert load_content(tmp_path, files, cache)["b.yaml"] == {"b": ["x", "y"]}
+    assert parsed == files
+
+    # Touched but unchanged files are hashed, not parsed
+    stat = (tmp_path / "a.yaml").stat()
+    os.utime(tmp_path / "a.yaml", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_content(tmp_path, files, cache)["a.yaml"] == {"a": 1}
+    assert parsed == files
+
+    (tmp_path / "b.yaml").write_text("b: [z]\n")
+    assert load_content(tmp_path, files, cache)["b.yaml"] == {"b": ["z"]}
+    assert parsed == [*files, "b.yaml"]
+
+
+def test_broken_bundle_is_ignored(tmp_path):
+    (tmp_path / "a.yaml").write_text("a: 1\n")
+    cache = tmp_path / "content.pickle"
+    cache.write_bytes(b"not a pickle")
+    assert load_content(tmp_path, ["a.yaml"], cache) == {"a.yaml": {"a": 1}}
+    assert load_content(tmp_path, ["a.yaml"], cache) == {"a.yaml": {"a": 1}}
@@ -0,0 +1,35 @@
+from myning.objects.inventory import Inventory
+from myning.objects.item import Item, ItemType
+from myning.objects.player import Player
+from myning.utilities.event_bus import EventBus, GameEvent
+
+
+def test_publish_reaches_subscribers_until_unsubscribed():
+    calls = []
+
+    def subscriber():
+        calls.append(1)
+
+    EventBus.subscribe(subscriber, GameEvent.GOLD, GameEvent.INVENTORY)
+    EventBus.publish(GameEvent.GOLD)
+    EventBus.publish(GameEvent.GARDEN)
+    assert len(calls) == 1
+
+    EventBus.unsubscribe(subscriber, GameEvent.GOLD, GameEvent.INVENTORY)
+    EventBus.publish(GameEvent.GOLD)
+    assert len(calls) == 1
+
+
+def test_game_objects_publish_changes():
+    events = []
+    subscribers = {event: lambda event=event: events.append(event) for event in GameEvent}
+    for event, subscriber in subscribers.items():
+        EventBus.subscribe(subscriber, event)
+    try:
+        Player().gold += 1
+        Inventory().add_items([Item("rock", "", ItemType.MINERAL, 1, 1)])
+    finally:
+        for event, subscriber in subscribers.items():
+            EventBus.unsubscribe(subscriber, event)
+
+    assert events == [GameEvent.GOLD, GameEvent.INVENTORY]
@@ -1,4 +1,4 @@
-from myning.utilities.fib import fibonacci, fibonacci_sum
+from myning.utilities.fib import fibonacci, fibonacci_sum, fibonacci_sum_inverse, highest_level
 
 
 def test_fibonacci():
@@ -13,3 +13,19 @@ def test_fibonacci_sum():
     assert fibonacci_sum(4) == 1 + 3 + 5
     assert fibonacci_sum(5) == 1 + 3 + 5 + 8
     assert fibonacci_sum(10) == 1 + 3 + 5 + 8 + 13 + 21 + 34 + 55 + 89
+
+
+def test_highest_level():
+    for level in range(1, 20):
+        for xp in range(0, 300, 7):
+            expected, left = level, xp
+            while left >= fibonacci(expected + 1):
+                left -= fibonacci(expected + 1)
+                expected += 1
+            assert highest_level(level, xp) == expected
+
+
+def test_fibonacci_sum_inverse():
+    assert fibonacci_sum_inverse(0) == 1
+    assert fibonacci_sum_inverse(fibonacci_sum(100)) == 100
+    assert fibonacci_sum_inverse(fibonacci_sum(100) - 1) == 99
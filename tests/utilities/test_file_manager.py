@@ -0,0 +1,69 @@
+import json
+import sqlite3
+
+import pytest
+
+from myning.objects.character import Character
+from myning.objects.settings import Settings
+from myning.objects.stats import Stats
+from myning.utilities import file_manager
+from myning.utilities.file_manager import DB_PATH, FileManager
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".data").mkdir()
+    settings = Settings._create(army_columns=7)
+    stats = Stats._create(integer_stats={"mines_completed": 3})
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute("CREATE TABLE save_data (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        for item in (settings, stats):
+            conn.execute(
+                "INSERT INTO save_data VALUES (?, ?)", (item.file_name, json.dumps(item.to_dict()))
+            )
+    conn.close()
+    yield
+    FileManager.clear_preloaded()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_preloaded_saves_are_loaded_once(database, monkeypatch, parallel):
+    monkeypatch.setattr(file_manager, "PARALLEL_DECODE_SIZE", 0)
+    FileManager.preload(parallel=parallel)
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute("DELETE FROM save_data")
+    conn.close()
+
+    # Served from what was preloaded, the database is empty by now
+    settings = FileManager.load(Settings, "settings")
+    assert settings and settings.army_columns == 7
+    stats = FileManager.load(Stats, "stats")
+    assert stats and stats.integer_stats == {"mines_completed": 3}
+
+    # Each save is only served once, after that it is read again
+    assert FileManager.load(Settings, "settings") is None
+
+
+def test_loading_an_ally_without_an_id_defers_the_repair(database):
+    def keys():
+        conn = sqlite3.connect(DB_PATH)
+        rows = conn.execute("SELECT key FROM save_data").fetchall()
+        conn.close()
+        return {key for (key,) in rows}
+
+    legacy = Character("Bob", "A legacy ally").to_dict()
+    del legacy["id"]
+    conn = sqlite3.connect(DB_PATH)
+    with conn:
+        conn.execute("INSERT INTO save_data VALUES (?, ?)", ("entities/Bob", json.dumps(legacy)))
+    conn.close()
+
+    ally = Character.from_dict(legacy)
+    assert ally.id.startswith("Bob - ")
+    assert keys() == {"settings", "stats", "entities/Bob"}
+
+    FileManager.apply_repairs()
+    assert keys() == {"settings", "stats", f"entities/{ally.id}"}
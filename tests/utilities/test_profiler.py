@@ -0,0 +1,44 @@
+import json
+
+from myning.utilities import profiler as profiler_module
+from myning.utilities.profiler import Profiler, percentile, profiled, profiler
+
+
+def test_percentile():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 0.5) == 51
+    assert percentile(samples, 0.95) == 96
+    assert percentile(samples, 1) == 100
+    assert percentile([], 0.5) == 0
+
+
+def test_summary_and_dump(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiler_module, "PROFILES_PATH", str(tmp_path))
+    p = Profiler()
+    p.tracing = True
+    for i in range(10):
+        p.record("fast", 0, i / 1000)
+    p.record("slow", 0, 1)
+
+    (slow, *_), (fast, calls, p50, p95, max_) = p.summary()
+    assert slow == "slow"
+    assert (fast, calls, p50, p95, max_) == ("fast", 10, 0.005, 0.009, 0.009)
+
+    with open(p.dump(), encoding="utf-8") as f:
+        dumped = json.load(f)
+    assert len(dumped["traceEvents"]) == 11
+    assert dumped["summary"]["fast"]["calls"] == 10
+
+
+def test_profiled_only_records_when_enabled(monkeypatch):
+    @profiled
+    def work():
+        return 1
+
+    monkeypatch.setattr(profiler, "enabled", False)
+    assert work() == 1
+    assert work.__qualname__ not in profiler.counts
+
+    monkeypatch.setattr(profiler, "enabled", True)
+    assert work() == 1
+    assert profiler.counts[work.__qualname__] == 1
@@ -2,7 +2,7 @@ import random
 
 import pytest
 
-from myning.utilities.rand import boosted_random_choice
+from myning.utilities.rand import AliasTable, boosted_random_choice
 
 
 @pytest.mark.parametrize(
@@ -27,3 +27,11 @@ def test_boosted_random_choice(arr: list[int], boost_percent, expected_percent):
             boosted_count += 1
     percent_boosted = boosted_count / total
     assert abs(percent_boosted - expected_percent) < 0.01
+
+
+def test_alias_table_chances_match_weights():
+    weights = [5, 1, 0, 3, 11, 0.5]
+    table = AliasTable(list("abcdef"), weights)
+    for chance, weight in zip(table.chances(), weights):
+        assert chance == pytest.approx(weight / sum(weights))
+    assert table.pick() in "abdef"
@@ -3,7 +3,12 @@ import pytest
 from myning.config import SPECIES
 from myning.objects.character import CharacterSpecies
 from myning.objects.player import Player
+from myning.utilities import species_rarity
+from myning.utilities.rand import boosted_weights
 from myning.utilities.species_rarity import (
+    SPECIES_TIERS,
+    SPECIES_WEIGHTS,
+    build_recruit_table,
     get_available_tiers,
     get_current_tier,
     get_recruit_species,
@@ -168,3 +173,33 @@ def test_get_time_travel_species(tier):
 
     species = get_time_travel_species(tier)
     assert species.rarity_tier >= tier
+
+
+def test_recruit_table_matches_tier_then_species_choice():
+    player.discovered_species = [SPECIES[CharacterSpecies.HUMAN.value]]
+    boost = 50
+    table = build_recruit_table(3, boost, 0)
+    chances = dict(zip(table.values, table.chances()))
+
+    tier_weights = SPECIES_WEIGHTS[:3]
+    for tier, tier_weight in zip(SPECIES_TIERS, tier_weights):
+        in_tier = boosted_weights(
+            tier, lambda name: not player.has_discovered(SPECIES[name]), boost / 100
+        )
+        for name, weight in zip(tier, in_tier):
+            expected = tier_weight / sum(tier_weights) * weight / sum(in_tier)
+            assert chances[SPECIES[name]] == pytest.approx(expected)
+
+
+def test_recruit_tables_are_rebuilt_on_discovery():
+    player.discovered_species = [SPECIES[CharacterSpecies.HUMAN.value]]
+    version = player.discovery_version
+    get_recruit_species(2)
+    assert not player.discover_species(SPECIES[CharacterSpecies.HUMAN.value])
+    assert player.discovery_version == version
+
+    assert player.discover_species(SPECIES[CharacterSpecies.DWARF.value])
+    assert player.discovery_version != version
+    assert player.has_discovered(SPECIES[CharacterSpecies.DWARF.value])
+    get_recruit_species(2)
+    assert all(key[0] == player.discovery_version for key in species_rarity._recruit_tables)
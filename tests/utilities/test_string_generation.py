@@ -0,0 +1,36 @@
+from myning.config import NAMES, SPECIES
+from myning.objects.character import CharacterSpecies
+from myning.utilities import string_generation
+from myning.utilities.generators import generate_characters
+
+
+def test_generate_names_uses_species_name_parts():
+    species = CharacterSpecies.DWARF.value
+    names = string_generation.generate_names(species, 50)
+    assert len(names) == 50
+    for name in names:
+        assert any(
+            name == f"{first} {last}"
+            for first in NAMES[species]["first"]
+            for last in NAMES[species]["last"]
+        )
+
+
+def test_generate_descriptions():
+    human = string_generation.generate_descriptions(CharacterSpecies.HUMAN.value, 20)
+    assert len(human) == 20
+    assert all(d.startswith("a ") and d.endswith(", Human") for d in human)
+
+    alien = string_generation.generate_descriptions(CharacterSpecies.ALIEN.value, 20)
+    assert all(d.endswith("-like creature") for d in alien)
+    assert string_generation.generate_description(CharacterSpecies.ALIEN.value).endswith(
+        "-like creature"
+    )
+
+
+def test_generate_characters_keeps_species_order():
+    species = [SPECIES[CharacterSpecies.ELF.value], None, SPECIES[CharacterSpecies.ORC.value]]
+    characters = generate_characters(species, (1, 3), is_enemy=True)
+    assert [c.species.name for c in characters] == ["Elf", "Alien", "Orc"]
+    assert all(c.description.endswith(c.species.name) for c in (characters[0], characters[2]))
+    assert all(1 <= c.level <= 3 for c in characters)
@@ -0,0 +1,58 @@
+import copy
+
+from myning.config import UPGRADES
+from myning.objects.garden import Garden
+from myning.objects.inventory import Inventory
+from myning.objects.item import Item, ItemType
+from myning.objects.player import Player
+from myning.objects.research_facility import ResearchFacility
+from myning.objects.singleton import Singleton
+from myning.utilities.generators import generate_character, generate_equipment
+from myning.utilities.value_ledger import ledger
+
+
+def full_total():
+    return (
+        Player().total_value
+        + ResearchFacility().total_value
+        + Garden().total_value
+        + Inventory().total_value
+    )
+
+
+def test_ledger_follows_game_changes(monkeypatch):
+    from myning.chapters import wizard_hut
+
+    monkeypatch.setitem(Singleton._instances, Garden, Garden._create())
+    player = Player()
+    inventory = Inventory()
+    assert ledger.total == full_total()
+
+    ally = generate_character((1, 5))
+    player.add_ally(ally)
+    player.gold += 500
+    player.add_available_xp(20)
+    ally.add_experience(100, save=False)
+    ally.equipment.equip(generate_equipment(3, ItemType.WEAPON))
+    inventory.add_items([Item("rock", "", ItemType.MINERAL, 5, 3)])
+    wizard_hut.buy(copy.copy(UPGRADES["auto_equip"]))
+    Garden().level_up()
+    assert not ledger.check()
+    assert ledger.total == full_total()
+
+    player.fire_ally(ally)
+    player.remove_available_xp(5)
+    inventory.clear()
+    assert not ledger.check()
+    assert ledger.total == full_total()
+
+
+def test_ledger_only_recomputes_changed_parts():
+    player = Player()
+    ledger.total
+    entries = dict(ledger.entries)
+
+    player.gold += 1
+    ledger.total
+    changed = [name for name, entry in ledger.entries.items() if entry is not entries[name]]
+    assert changed == ["gold"]
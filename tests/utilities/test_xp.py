@@ -0,0 +1,51 @@
+import random
+
+from myning.objects.character import Character
+from myning.utilities.fib import fibonacci
+from myning.utilities.xp import distribute_xp
+
+
+def make_army(seed: int) -> list[Character]:
+    rng = random.Random(seed)
+    army = []
+    for i in range(rng.randint(2, 8)):
+        character = Character(f"member {i}")
+        character.level = rng.randint(1, 12)
+        character.experience = rng.randrange(fibonacci(character.level + 1))
+        army.append(character)
+    return army
+
+
+def one_level_at_a_time(members: list[Character], leader: Character, xp: int):
+    """What auto-add used to do"""
+    granted = {id(character): 0 for character in [*members, leader]}
+    while xp > 0:
+        member = min(members, key=lambda m: m.level)
+        if member.level >= leader.level and member is not leader:
+            member = leader
+        needed = min(fibonacci(member.level + 1) - member.experience, xp)
+        xp -= needed
+        granted[id(member)] += needed
+        member.add_experience(needed, save=False)
+    return granted
+
+
+def test_distribute_xp_matches_leveling_one_level_at_a_time():
+    for seed in range(200):
+        xp = random.Random(seed).choice([1, 50, 5_000, 10**9])
+        army, expected_army = make_army(seed), make_army(seed)
+        # the leader leads the army, or only caps it like for ghosts
+        with_leader = seed % 2 == 0
+        members = army if with_leader else army[1:]
+        expected_members = expected_army if with_leader else expected_army[1:]
+
+        expected = one_level_at_a_time(expected_members, expected_army[0], xp)
+        grants = distribute_xp(members, army[0], xp)
+        assert sum(granted for _, granted in grants) == xp
+        for character, granted in grants:
+            index = army.index(character)
+            assert granted == expected[id(expected_army[index])]
+            character.add_experience(granted, save=False)
+        assert [(c.level, c.experience) for c in army] == [
+            (c.level, c.experience) for c in expected_army
+        ]